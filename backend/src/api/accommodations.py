@@ -5,7 +5,7 @@ Provides REST API for managing accommodations near tourist spots.
 """
 
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.postgres import get_db
@@ -25,6 +25,9 @@ from src.models.usuario import Usuario
 
 router = APIRouter(prefix="/api", tags=["accommodations"])
 
+# Maximum accommodation IDs accepted by the bulk delete endpoint
+MAX_DELETE_IDS = 100
+
 
 def get_hospedagem_service(db: AsyncSession = Depends(get_db)) -> HospedagemService:
     """Dependency to get HospedagemService instance."""
@@ -257,3 +260,42 @@ async def delete_accommodation(
     """
     await service.delete_accommodation(accommodation_id)
     return None
+
+
+@router.delete(
+    "/accommodations",
+    summary="Delete several accommodations (Admin only)",
+    description="Delete a list of accommodations in one request. Requires admin privileges."
+)
+async def delete_accommodations(
+    ids: str = Query(..., description="Comma-separated accommodation IDs (max 100)"),
+    current_user: Usuario = Depends(get_current_admin_user),
+    service: HospedagemService = Depends(get_hospedagem_service)
+):
+    """
+    Delete several accommodations in one request.
+    
+    Args:
+        ids: Comma-separated accommodation IDs.
+        current_user: Current authenticated admin user.
+        service: Hospedagem service dependency.
+        
+    Returns:
+        Number of deleted accommodations.
+    """
+    try:
+        accommodation_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers"
+        )
+    
+    if len(accommodation_ids) > MAX_DELETE_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_DELETE_IDS} ids can be deleted at once"
+        )
+    
+    deleted = await service.delete_accommodations(accommodation_ids)
+    return {"deleted": deleted}
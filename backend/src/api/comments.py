@@ -13,7 +13,13 @@ from src.config.postgres import get_db
 from src.repositories.comment_repository import CommentRepository
 from src.repositories.spot_repository import SpotRepository
 from src.services.comment_service import CommentService
-from src.schemas.spot import CommentResponse, CreateCommentRequest, CommentListResponse
+from src.schemas.spot import (
+    BulkCreateCommentsRequest,
+    BulkLikeCommentsRequest,
+    CommentListResponse,
+    CommentResponse,
+    CreateCommentRequest,
+)
 from src.dependencies.auth import get_current_user
 from src.models.usuario import Usuario
 
@@ -123,6 +129,49 @@ async def create_comment(
     return comment
 
 
+@router.post(
+    "/comments/bulk",
+    response_model=list[CommentResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_comments_bulk(
+    bulk_data: BulkCreateCommentsRequest,
+    current_user: Usuario = Depends(get_current_user),
+    mongo_db: AsyncIOMotorDatabase = Depends(get_mongodb),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create several comments for a tourist spot in one request.
+    
+    **Authentication required.**
+    
+    **Request Body:**
+    - `spot_id`: Tourist spot ID
+    - `items`: 1-50 objects with `texto` (same rules as single comments)
+    
+    **Business Rules:**
+    - Every text is validated before any comment is stored
+    - Spot must exist
+    
+    **Returns:**
+    - Created comments, in request order
+    
+    **Error Responses:**
+    - 400: Validation error or inappropriate content in any item
+    - 401: Unauthorized (no valid JWT token)
+    - 404: Tourist spot not found
+    """
+    comment_repo = CommentRepository(mongo_db)
+    spot_repo = SpotRepository(db)
+    comment_service = CommentService(comment_repo, spot_repo)
+    
+    return await comment_service.create_comments_bulk(
+        ponto_id=bulk_data.spot_id,
+        usuario_id=current_user.id,
+        textos=[item.texto for item in bulk_data.items]
+    )
+
+
 @router.post("/comments/{comment_id}/like", status_code=status.HTTP_204_NO_CONTENT)
 async def like_comment(
     comment_id: str,
@@ -157,6 +206,33 @@ async def like_comment(
     return None
 
 
+@router.post("/comments/likes/bulk", status_code=status.HTTP_204_NO_CONTENT)
+async def like_comments_bulk(
+    bulk_data: BulkLikeCommentsRequest,
+    mongo_db: AsyncIOMotorDatabase = Depends(get_mongodb),
+):
+    """
+    Increment likes counter for several comments at once.
+    
+    **Public endpoint** - No authentication required (simple like system).
+    
+    **Request Body:**
+    - `comment_ids`: 1-100 comment IDs
+    
+    **Business Rules:**
+    - Each comment is liked at most once per request
+    - Unknown or invalid IDs are ignored
+    
+    **Returns:**
+    - 204 No Content on success
+    """
+    comment_repo = CommentRepository(mongo_db)
+    
+    await comment_repo.add_likes(bulk_data.comment_ids)
+    
+    return None
+
+
 @router.post("/comments/{comment_id}/report", status_code=status.HTTP_204_NO_CONTENT)
 async def report_comment(
     comment_id: str,
@@ -5,7 +5,7 @@ Provides REST API for managing user favorites.
 """
 
 from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.postgres import get_db
@@ -18,6 +18,9 @@ from src.models.usuario import Usuario
 
 router = APIRouter(prefix="/api", tags=["favorites"])
 
+# Maximum spot IDs accepted by the bulk status endpoint
+MAX_STATUS_IDS = 100
+
 
 def get_favoritos_service(db: AsyncSession = Depends(get_db)) -> FavoritosService:
     """Dependency to get FavoritosService instance."""
@@ -131,6 +134,44 @@ async def toggle_favorite(
     return await service.toggle_favorite(current_user.id, spot_id)
 
 
+@router.get(
+    "/spots/favorites/status",
+    summary="Check favorite status of several spots",
+    description="Check which of a list of spots are in user's favorites."
+)
+async def check_favorite_statuses(
+    ids: str = Query(..., description="Comma-separated spot IDs (max 100)"),
+    current_user: Usuario = Depends(get_current_user),
+    service: FavoritosService = Depends(get_favoritos_service)
+):
+    """
+    Check favorite status for several spots in one request.
+    
+    Args:
+        ids: Comma-separated tourist spot IDs.
+        current_user: Current authenticated user.
+        service: Favoritos service dependency.
+        
+    Returns:
+        Mapping of spot ID to favorite status.
+    """
+    try:
+        spot_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers"
+        )
+    
+    if len(spot_ids) > MAX_STATUS_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_STATUS_IDS} ids can be checked at once"
+        )
+    
+    return await service.get_favorite_statuses(current_user.id, spot_ids)
+
+
 @router.get(
     "/spots/{spot_id}/favorite/status",
     summary="Check favorite status",
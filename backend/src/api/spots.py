@@ -4,16 +4,21 @@ Spots API endpoints - Tourist spot discovery and management.
 Implements GET, POST, PUT, DELETE endpoints for tourist spots.
 """
 
+import asyncio
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, File, Path, Query, HTTPException, Request, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.postgres import get_db
 from src.services.spot_service import SpotService
 from src.services.directions_service import DirectionsService
-from src.schemas.spot import SpotListResponse, SpotDetail, CreateSpotRequest, UpdateSpotRequest
+from src.schemas.spot import SpotListResponse, SpotDetail, SpotBundleResponse, CreateSpotRequest, UpdateSpotRequest
+from src.api.accommodations import get_hospedagem_service, get_spot_accommodations
+from src.api.photos import get_spot_photos
+from src.api.ratings import get_spot_ratings, get_spot_rating_stats
 from src.dependencies.auth import get_current_admin_user
 from src.models.usuario import Usuario
+from src.utils.import_data import IMPORT_MAX_CHUNKS
 
 router = APIRouter()
 
@@ -93,6 +98,62 @@ async def get_spot(
     return spot
 
 
+@router.get("/spots/{spot_id}/bundle", response_model=SpotBundleResponse)
+async def get_spot_bundle(
+    spot_id: int,
+    ratings_limit: int = Query(10, ge=1, le=100, description="Max recent ratings to include"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get a spot with its photos, ratings and accommodations in one request.
+    
+    Built from the same handlers as the individual endpoints, so each part
+    has exactly the shape of its standalone response. Photos (MongoDB)
+    are loaded concurrently with the PostgreSQL queries.
+    
+    **Returns:**
+    - `spot`: Same as `GET /spots/{spot_id}`
+    - `photos`: Same as `GET /spots/{spot_id}/photos`
+    - `rating_stats`: Same as `GET /spots/{spot_id}/ratings/stats`
+    - `ratings`: Most recent ratings (up to `ratings_limit`)
+    - `accommodations`: Same as `GET /spots/{spot_id}/accommodations`
+    
+    **Errors:**
+    - 404: Spot not found or has been deleted
+    """
+    async def load_sql_parts():
+        # A single AsyncSession can only run one query at a time
+        spot = await SpotService(db).get_spot_by_id(spot_id)
+        if not spot:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tourist spot with ID {spot_id} not found",
+            )
+        rating_stats = await get_spot_rating_stats(spot_id, db=db)
+        ratings = await get_spot_ratings(spot_id, skip=0, limit=ratings_limit, db=db)
+        accommodations = await get_spot_accommodations(
+            spot_id,
+            tipo=None,
+            max_price=None,
+            min_price=None,
+            service=get_hospedagem_service(db),
+        )
+        return spot, rating_stats, ratings, accommodations
+    
+    (spot, rating_stats, ratings, accommodations), photos = await asyncio.gather(
+        load_sql_parts(),
+        get_spot_photos(spot_id),
+    )
+    
+    return {
+        "spot": spot,
+        "photos": photos,
+        "rating_stats": rating_stats,
+        "ratings": ratings,
+        "accommodations": accommodations,
+    }
+
+
 @router.post("/spots", response_model=SpotDetail, status_code=status.HTTP_201_CREATED)
 async def create_spot(
     spot_data: CreateSpotRequest,
@@ -387,7 +448,7 @@ async def export_spots(
     from src.repositories.photo_repository import PhotoRepository
     from src.repositories.rating_repository import RatingRepository
     from src.utils.export import ExportService
-    from fastapi.responses import Response
+    from fastapi.responses import Response, StreamingResponse
     
     spot_repo = SpotRepository(db)
     photo_repo = PhotoRepository()
@@ -433,24 +494,27 @@ async def export_spots(
     
     # Export data
     try:
+        filename = ExportService.get_export_filename(format)
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
+        
+        # JSON is streamed one spot at a time to keep peak memory flat
+        if format == "json":
+            return StreamingResponse(
+                ExportService.export_to_json_stream(enriched_spots, include_metadata=True),
+                media_type="application/json",
+                headers=headers,
+            )
+        
         export_content = ExportService.export_spots_with_details(
             spots=enriched_spots,
             format=format,
             include_metadata=True,
         )
         
-        # Set appropriate content type and filename
-        if format == "json":
-            media_type = "application/json"
-        else:  # csv
-            media_type = "text/csv"
-        
-        filename = ExportService.get_export_filename(format)
-        
         return Response(
             content=export_content,
-            media_type=media_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            media_type="text/csv",
+            headers=headers,
         )
         
     except ValueError as e:
@@ -460,34 +524,20 @@ async def export_spots(
         )
 
 
-@router.post("/spots/import")
-async def import_spots(
-    format: str = Query("json", regex="^(json|csv)$", description="Import format: json or csv"),
-    content: str = Query(..., description="File content as string"),
-    admin: Usuario = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
-):
+async def _import_spots_file(fileobj, format: str, admin: Usuario, db: AsyncSession) -> dict:
     """
-    Import tourist spots data (Admin only).
-    
-    **Authentication required:** Admin role.
-    
-    **Parameters:**
-    - `format`: Import format - "json" or "csv"
-    - `content`: File content as string
+    Parse, validate and store spots from an uploaded binary file.
     
-    **Response:**
-    - Summary of import operation
-    - List of successfully imported spots
-    - List of errors (if any)
+    Shared by the single-request and the chunked import endpoints.
     
-    **Returns:**
-    - 200: Import completed with summary
+    Args:
+        fileobj: Binary file with JSON or CSV content.
+        format: "json" or "csv".
+        admin: Importing admin user.
+        db: Database session.
     
-    **Error Responses:**
-    - 401: Unauthorized
-    - 403: Forbidden (non-admin user)
-    - 400: Invalid format or data
+    Returns:
+        Import summary, imported spots and errors.
     """
     from src.repositories.spot_repository import SpotRepository
     from src.utils.import_data import ImportService
@@ -495,8 +545,10 @@ async def import_spots(
     spot_repo = SpotRepository(db)
     
     try:
-        # Parse and validate import data
-        valid_spots, errors, summary = ImportService.import_spots(content, format)
+        # Parse and validate off the event loop; large files take seconds
+        valid_spots, errors, summary = await asyncio.to_thread(
+            ImportService.import_spots, fileobj, format
+        )
         
         # Import valid spots
         imported_spots = []
@@ -543,3 +595,116 @@ async def import_spots(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Import failed: {str(e)}",
         )
+
+
+@router.post("/spots/import")
+async def import_spots(
+    format: str = Query("json", regex="^(json|csv)$", description="Import format: json or csv"),
+    file: UploadFile = File(..., description="JSON or CSV file to import"),
+    admin: Usuario = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Import tourist spots data (Admin only).
+    
+    **Authentication required:** Admin role.
+    
+    **Parameters:**
+    - `format`: Import format - "json" or "csv"
+    - `file`: File to import (multipart/form-data)
+    
+    **Response:**
+    - Summary of import operation
+    - List of successfully imported spots
+    - List of errors (if any)
+    
+    **Returns:**
+    - 200: Import completed with summary
+    
+    **Error Responses:**
+    - 401: Unauthorized
+    - 403: Forbidden (non-admin user)
+    - 400: Invalid format or data
+    """
+    return await _import_spots_file(file.file, format, admin, db)
+
+
+@router.post("/spots/import/chunks/{upload_id}/{index}")
+async def upload_import_chunk(
+    request: Request,
+    upload_id: str,
+    index: int = Path(..., ge=0, lt=IMPORT_MAX_CHUNKS, description="Chunk index (0-based)"),
+    admin: Usuario = Depends(get_current_admin_user),
+):
+    """
+    Upload one chunk of a large import file (Admin only).
+    
+    **Authentication required:** Admin role.
+    
+    **Parameters:**
+    - `upload_id`: Client-generated upload ID (uuid4 hex)
+    - `index`: Chunk position, starting at 0
+    - Request body: raw chunk bytes (max 8 MB)
+    
+    Re-sending a chunk replaces it, so failed chunks can be retried.
+    Finish with `POST /spots/import/{upload_id}/commit`.
+    
+    **Error Responses:**
+    - 400: Invalid upload ID or chunk too large
+    - 401: Unauthorized
+    - 403: Forbidden (non-admin user)
+    """
+    from src.utils.import_data import ImportChunkStore
+    
+    try:
+        size = await ImportChunkStore.save_chunk(upload_id, index, request.stream())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    return {"upload_id": upload_id, "index": index, "size": size}
+
+
+@router.post("/spots/import/{upload_id}/commit")
+async def commit_chunked_import(
+    upload_id: str,
+    format: str = Query("json", regex="^(json|csv)$", description="Import format: json or csv"),
+    total_chunks: int = Query(..., ge=1, le=IMPORT_MAX_CHUNKS, description="Number of chunks uploaded"),
+    admin: Usuario = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Assemble a chunked upload and import it (Admin only).
+    
+    **Authentication required:** Admin role.
+    
+    **Parameters:**
+    - `upload_id`: Upload ID used for the chunks
+    - `format`: Import format - "json" or "csv"
+    - `total_chunks`: Number of chunks sent
+    
+    **Returns:**
+    - 200: Same summary as `POST /spots/import`
+    
+    **Error Responses:**
+    - 400: Invalid upload ID, missing chunks or invalid data
+    - 401: Unauthorized
+    - 403: Forbidden (non-admin user)
+    """
+    from src.utils.import_data import ImportChunkStore
+    
+    try:
+        assembled = ImportChunkStore.assemble(upload_id, total_chunks)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    try:
+        with assembled:
+            return await _import_spots_file(assembled, format, admin, db)
+    finally:
+        ImportChunkStore.discard(upload_id)
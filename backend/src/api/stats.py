@@ -0,0 +1,40 @@
+"""
+Stats API endpoints - Aggregated platform statistics.
+
+Implements a single GET endpoint returning all dashboard counters.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.postgres import get_db
+from src.services.stats_service import StatsService
+from src.schemas.spot import PlatformStatsResponse
+from src.dependencies.auth import get_current_admin_user
+from src.models.usuario import Usuario
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=PlatformStatsResponse)
+async def get_platform_stats(
+    admin: Usuario = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get platform-wide totals in one request.
+    
+    **Admin only** - Requires admin authentication.
+    
+    **Returns:**
+    - `spots`: Active (not soft-deleted) tourist spots
+    - `photos`: Photos stored in MongoDB
+    - `ratings`: Ratings across all spots
+    - `comments`: Comments across all spots
+    
+    **Errors:**
+    - 401: Not authenticated
+    - 403: Forbidden (non-admin user)
+    """
+    service = StatsService(db)
+    return await service.get_platform_stats()
@@ -13,7 +13,9 @@ from src.config.postgres import init_db, close_db
 from src.config.mongodb import init_mongo, close_mongo
 from src.config.redis import init_redis, close_redis
 from src.middleware.error_handler import setup_error_handlers
+from src.middleware.compression import ApiGZipMiddleware
 from src.middleware.rate_limit import rate_limit_middleware
+from src.utils.static_files import CachedStaticFiles
 from src.utils.logging_config import setup_logging
 import logging
 
@@ -85,6 +87,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses for clients that send Accept-Encoding: gzip
+# (uploaded images under /uploads are already compressed and skipped)
+app.add_middleware(ApiGZipMiddleware, minimum_size=1000)
+
 # Rate limiting middleware
 app.middleware("http")(rate_limit_middleware)
 
@@ -113,7 +119,7 @@ async def health_check():
 
 
 # Register API routers
-from src.api import spots, photos, ratings, auth, comments, accommodations, favorites, health
+from src.api import spots, photos, ratings, auth, comments, accommodations, favorites, health, stats
 
 app.include_router(health.router, tags=["health"])
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX, tags=["auth"])
@@ -123,3 +129,11 @@ app.include_router(ratings.router, prefix=settings.API_V1_PREFIX, tags=["ratings
 app.include_router(comments.router, prefix=settings.API_V1_PREFIX, tags=["comments"])
 app.include_router(accommodations.router, prefix=settings.API_V1_PREFIX, tags=["accommodations"])
 app.include_router(favorites.router, prefix=settings.API_V1_PREFIX, tags=["favorites"])
+app.include_router(stats.router, prefix=settings.API_V1_PREFIX, tags=["stats"])
+
+# Uploaded photos and thumbnails (cached by browsers for a year)
+app.mount(
+    "/uploads",
+    CachedStaticFiles(directory=settings.UPLOAD_DIR, check_dir=False),
+    name="uploads",
+)
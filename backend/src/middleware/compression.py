@@ -0,0 +1,31 @@
+"""
+Compression Middleware - Gzip API responses only.
+
+Uploaded photos are already compressed (JPEG/PNG/WebP); gzipping them
+again costs CPU for no size gain, so static uploads bypass compression.
+"""
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class ApiGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips requests under the excluded path prefixes."""
+
+    def __init__(self, app, excluded_prefixes: tuple = ("/uploads",), **kwargs):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            excluded_prefixes: Path prefixes served without compression
+            **kwargs: Passed to GZipMiddleware (e.g. minimum_size)
+        """
+        super().__init__(app, **kwargs)
+        self.excluded_prefixes = excluded_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
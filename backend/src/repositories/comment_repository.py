@@ -50,6 +50,41 @@ class CommentRepository:
         
         return comment_doc
     
+    async def create_many(self, comments_data: List[dict]) -> List[dict]:
+        """
+        Create several comments with a single insert.
+        
+        Args:
+            comments_data: Comment data dictionaries.
+        
+        Returns:
+            Created comments with _id, in input order.
+        """
+        if not comments_data:
+            return []
+        
+        now = datetime.utcnow()
+        comment_docs = [
+            {
+                "pontoId": comment_data["pontoId"],
+                "usuarioId": comment_data["usuarioId"],
+                "texto": comment_data["texto"],
+                "createdAt": now,
+                "metadata": {
+                    "likes": 0,
+                    "reports": 0
+                },
+                "respostas": []
+            }
+            for comment_data in comments_data
+        ]
+        
+        result = await self.collection.insert_many(comment_docs)
+        for comment_doc, inserted_id in zip(comment_docs, result.inserted_ids):
+            comment_doc["_id"] = str(inserted_id)
+        
+        return comment_docs
+    
     async def get_by_id(self, comment_id: str) -> Optional[dict]:
         """
         Get comment by ID.
@@ -179,6 +214,28 @@ class CommentRepository:
         except Exception:
             return False
     
+    async def add_likes(self, comment_ids: List[str]) -> int:
+        """
+        Increment likes counter of several comments in one update.
+        
+        Invalid or duplicate IDs are ignored.
+        
+        Args:
+            comment_ids: MongoDB ObjectIds as strings.
+        
+        Returns:
+            Number of comments updated.
+        """
+        object_ids = {ObjectId(cid) for cid in comment_ids if ObjectId.is_valid(cid)}
+        if not object_ids:
+            return 0
+        
+        result = await self.collection.update_many(
+            {"_id": {"$in": list(object_ids)}},
+            {"$inc": {"metadata.likes": 1}}
+        )
+        return result.modified_count
+    
     async def add_report(self, comment_id: str) -> bool:
         """
         Increment reports counter.
@@ -107,6 +107,26 @@ class FavoritoRepository(BaseRepository[Favorito]):
         favorite = await self.get_by_user_and_spot(usuario_id, ponto_id)
         return favorite is not None
     
+    async def get_favorited_among(self, usuario_id: int, ponto_ids: List[int]) -> List[int]:
+        """
+        Get which of the given spots are favorited by a user (one query).
+        
+        Args:
+            usuario_id: User ID.
+            ponto_ids: Tourist spot IDs to check.
+            
+        Returns:
+            Subset of ponto_ids that are favorited.
+        """
+        query = select(Favorito.ponto_id).where(
+            and_(
+                Favorito.usuario_id == usuario_id,
+                Favorito.ponto_id.in_(ponto_ids)
+            )
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
     async def get_user_favorite_spot_ids(self, usuario_id: int) -> List[int]:
         """
         Get list of spot IDs favorited by a user.
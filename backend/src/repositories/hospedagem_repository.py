@@ -5,7 +5,7 @@ Provides CRUD operations for the Hospedagem model.
 """
 
 from typing import Optional, List
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.hospedagem import Hospedagem, TipoHospedagem
@@ -92,6 +92,21 @@ class HospedagemRepository(BaseRepository[Hospedagem]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def delete_many(self, ids: List[int]) -> int:
+        """
+        Delete several accommodations in a single statement.
+        
+        Args:
+            ids: Accommodation IDs.
+            
+        Returns:
+            Number of deleted rows.
+        """
+        result = await self.db.execute(
+            delete(Hospedagem).where(Hospedagem.id.in_(ids))
+        )
+        return result.rowcount
+    
     async def get_statistics(self, ponto_id: int) -> dict:
         """
         Get accommodation statistics for a tourist spot.
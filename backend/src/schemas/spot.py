@@ -145,6 +145,17 @@ class CreateCommentRequest(BaseModel):
     texto: str = Field(..., min_length=1, max_length=2000, description="Comment text")
 
 
+class BulkCreateCommentsRequest(BaseModel):
+    """Schema for creating several comments on a spot in one request."""
+    spot_id: int
+    items: list[CreateCommentRequest] = Field(..., min_length=1, max_length=50)
+
+
+class BulkLikeCommentsRequest(BaseModel):
+    """Schema for liking several comments in one request."""
+    comment_ids: list[str] = Field(..., min_length=1, max_length=100)
+
+
 class CommentListResponse(BaseModel):
     """Schema for paginated comment list response."""
     comments: list[CommentResponse]
@@ -205,3 +216,20 @@ class AccommodationStatisticsResponse(BaseModel):
     min_price: float
     max_price: float
     types: dict
+
+
+class SpotBundleResponse(BaseModel):
+    """Schema for everything the spot detail page needs, in one response."""
+    spot: SpotDetail
+    photos: list[PhotoResponse]
+    rating_stats: RatingDistributionResponse
+    ratings: list[RatingResponse]
+    accommodations: AccommodationListResponse
+
+
+class PlatformStatsResponse(BaseModel):
+    """Schema for platform-wide statistics."""
+    spots: int
+    photos: int
+    ratings: int
+    comments: int
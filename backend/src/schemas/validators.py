@@ -4,8 +4,8 @@ Validation Schemas - Comprehensive input validation for tourist spot data.
 Provides Pydantic validators for all data inputs.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator
+from typing import List, Optional
 from enum import Enum
 
 
@@ -60,6 +60,25 @@ class SpotValidator(BaseModel):
         return v.strip()
 
 
+class SpotImportValidator(BaseModel):
+    """Validator for spots in bulk CSV/JSON imports (constraint-only, no custom hooks)."""
+    
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+    
+    nome: str = Field(..., min_length=1, max_length=200, description="Spot name")
+    descricao: Optional[str] = Field(None, max_length=2000, description="Spot description")
+    cidade: str = Field(..., min_length=1, description="City name")
+    estado: str = Field(..., min_length=1, description="State name")
+    pais: str = Field(..., min_length=1, description="Country name")
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude")
+    endereco: Optional[str] = Field(None, description="Address")
+
+
+# Validates a whole import batch in a single pydantic-core call
+SpotImportBatchValidator = TypeAdapter(List[SpotImportValidator])
+
+
 class RatingValidator(BaseModel):
     """Validator for rating submission."""
     
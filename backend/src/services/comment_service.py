@@ -50,37 +50,8 @@ class CommentService:
                 detail={"error": "Not Found", "message": "Tourist spot not found", "code": "SPOT_001"}
             )
         
-        # Validate comment text
-        if not texto or len(texto.strip()) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "Validation error",
-                    "message": "Comment text is required",
-                    "code": "VAL_005"
-                }
-            )
-        
-        if len(texto) > 2000:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "Validation error",
-                    "message": "Comment text cannot exceed 2000 characters",
-                    "code": "VAL_004"
-                }
-            )
-        
-        # Apply content moderation (basic profanity filter)
-        if self._contains_inappropriate_content(texto):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "Moderation error",
-                    "message": "Comment contains inappropriate content",
-                    "code": "COMMENT_001"
-                }
-            )
+        # Validate comment text and apply content moderation
+        self._validate_comment_text(texto)
         
         # Create comment
         comment_data = {
@@ -93,6 +64,44 @@ class CommentService:
         
         return comment
     
+    async def create_comments_bulk(
+        self, ponto_id: int, usuario_id: int, textos: List[str]
+    ) -> List[dict]:
+        """
+        Create several comments for a tourist spot in one operation.
+        
+        All texts are validated before anything is written, so the batch
+        is either fully created or rejected.
+        
+        Args:
+            ponto_id: Tourist spot ID.
+            usuario_id: User ID.
+            textos: Comment texts.
+        
+        Returns:
+            Created comments, in input order.
+        
+        Raises:
+            HTTPException: If spot doesn't exist or any text fails validation.
+        """
+        # Validate spot exists
+        spot = await self.spot_repo.get_by_id(ponto_id)
+        if not spot:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"error": "Not Found", "message": "Tourist spot not found", "code": "SPOT_001"}
+            )
+        
+        for texto in textos:
+            self._validate_comment_text(texto)
+        
+        comments_data = [
+            {"pontoId": ponto_id, "usuarioId": usuario_id, "texto": texto.strip()}
+            for texto in textos
+        ]
+        
+        return await self.comment_repo.create_many(comments_data)
+    
     async def get_comments_for_spot(
         self,
         ponto_id: int,
@@ -174,37 +183,8 @@ class CommentService:
                 }
             )
         
-        # Validate new text
-        if not texto or len(texto.strip()) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "Validation error",
-                    "message": "Comment text is required",
-                    "code": "VAL_005"
-                }
-            )
-        
-        if len(texto) > 2000:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "Validation error",
-                    "message": "Comment text cannot exceed 2000 characters",
-                    "code": "VAL_004"
-                }
-            )
-        
-        # Apply content moderation
-        if self._contains_inappropriate_content(texto):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "Moderation error",
-                    "message": "Comment contains inappropriate content",
-                    "code": "COMMENT_001"
-                }
-            )
+        # Validate new text and apply content moderation
+        self._validate_comment_text(texto)
         
         # Update comment
         updated_comment = await self.comment_repo.update(
@@ -310,6 +290,47 @@ class CommentService:
         """
         return await self.comment_repo.get_reported_comments(threshold)
     
+    def _validate_comment_text(self, texto: str) -> None:
+        """
+        Validate comment text length and content.
+        
+        Args:
+            texto: Comment text.
+        
+        Raises:
+            HTTPException: If text is empty, too long, or inappropriate.
+        """
+        if not texto or len(texto.strip()) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "Validation error",
+                    "message": "Comment text is required",
+                    "code": "VAL_005"
+                }
+            )
+        
+        if len(texto) > 2000:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "Validation error",
+                    "message": "Comment text cannot exceed 2000 characters",
+                    "code": "VAL_004"
+                }
+            )
+        
+        # Apply content moderation (basic profanity filter)
+        if self._contains_inappropriate_content(texto):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "Moderation error",
+                    "message": "Comment contains inappropriate content",
+                    "code": "COMMENT_001"
+                }
+            )
+    
     def _contains_inappropriate_content(self, text: str) -> bool:
         """
         Basic profanity filter for content moderation.
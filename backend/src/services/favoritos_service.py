@@ -121,6 +121,22 @@ class FavoritosService:
         """
         return await self.favorito_repo.is_favorited(usuario_id, ponto_id)
     
+    async def get_favorite_statuses(self, usuario_id: int, ponto_ids: List[int]) -> Dict[int, bool]:
+        """
+        Check favorite status of several spots at once.
+        
+        Args:
+            usuario_id: User ID.
+            ponto_ids: Tourist spot IDs.
+            
+        Returns:
+            Mapping of spot ID to favorite status.
+        """
+        if not ponto_ids:
+            return {}
+        favorited = set(await self.favorito_repo.get_favorited_among(usuario_id, ponto_ids))
+        return {ponto_id: ponto_id in favorited for ponto_id in ponto_ids}
+    
     async def get_favorite_spot_ids(self, usuario_id: int) -> List[int]:
         """
         Get list of spot IDs in user's favorites.
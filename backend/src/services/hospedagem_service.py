@@ -224,6 +224,22 @@ class HospedagemService:
         accommodation = await self.get_accommodation(accommodation_id)
         await self.hospedagem_repo.delete(accommodation.id)
     
+    async def delete_accommodations(self, accommodation_ids: List[int]) -> int:
+        """
+        Delete several accommodations at once.
+        
+        IDs that do not exist are ignored.
+        
+        Args:
+            accommodation_ids: Accommodation IDs.
+            
+        Returns:
+            Number of deleted accommodations.
+        """
+        if not accommodation_ids:
+            return 0
+        return await self.hospedagem_repo.delete_many(accommodation_ids)
+    
     async def get_statistics(self, ponto_id: int) -> dict:
         """
         Get accommodation statistics for a tourist spot.
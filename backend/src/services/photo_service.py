@@ -8,6 +8,26 @@ from typing import List, Dict, Any
 from src.repositories.photo_repository import PhotoRepository
 
 
+def _photo_urls(photo: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Build versioned file URLs for a photo document.
+    
+    The photo ID is appended as ``?v=`` so the URLs change whenever a
+    file is replaced, which lets /uploads serve them as immutable.
+    
+    Args:
+        photo: Photo document from MongoDB.
+    
+    Returns:
+        Dictionary with ``url`` and ``thumbnail_url``.
+    """
+    version = str(photo["_id"])
+    return {
+        "url": f"/uploads/{photo['path']}?v={version}",
+        "thumbnail_url": f"/uploads/{photo.get('thumbnailPath', photo['path'])}?v={version}",
+    }
+
+
 class PhotoService:
     """Service layer for photo business logic."""
     
@@ -31,8 +51,7 @@ class PhotoService:
                 "id": str(photo["_id"]),
                 "titulo": photo.get("titulo", ""),
                 "filename": photo["filename"],
-                "url": f"/uploads/{photo['path']}",
-                "thumbnail_url": f"/uploads/{photo.get('thumbnailPath', photo['path'])}",
+                **_photo_urls(photo),
                 "uploaded_by": photo["usuarioId"],
                 "created_at": photo["createdAt"].isoformat(),
             }
@@ -58,8 +77,7 @@ class PhotoService:
             "ponto_id": photo["pontoId"],
             "titulo": photo.get("titulo", ""),
             "filename": photo["filename"],
-            "url": f"/uploads/{photo['path']}",
-            "thumbnail_url": f"/uploads/{photo.get('thumbnailPath', photo['path'])}",
+            **_photo_urls(photo),
             "uploaded_by": photo["usuarioId"],
             "created_at": photo["createdAt"].isoformat(),
         }
@@ -0,0 +1,54 @@
+"""
+StatsService - Platform-wide counters for the admin dashboard.
+
+Collects spot, photo, rating and comment totals in a single call.
+"""
+
+import asyncio
+from typing import Dict
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.mongodb import get_mongo_db
+from src.models.avaliacao import Avaliacao
+from src.models.ponto_turistico import PontoTuristico
+
+
+class StatsService:
+    """Service for aggregated platform statistics."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.mongo_db = get_mongo_db()
+    
+    async def get_platform_stats(self) -> Dict[str, int]:
+        """
+        Count spots, photos, ratings and comments.
+        
+        PostgreSQL totals come from one SELECT with scalar subqueries and the
+        MongoDB collection counts run concurrently, so the whole call costs
+        one round-trip per database.
+        
+        Returns:
+            Dict with spots, photos, ratings and comments totals.
+        """
+        spots_count = (
+            select(func.count(PontoTuristico.id))
+            .where(PontoTuristico.deleted_at.is_(None))
+            .scalar_subquery()
+        )
+        ratings_count = select(func.count(Avaliacao.id)).scalar_subquery()
+        
+        sql_result, photos, comments = await asyncio.gather(
+            self.db.execute(select(spots_count, ratings_count)),
+            self.mongo_db.fotos.estimated_document_count(),
+            self.mongo_db.comentarios.estimated_document_count(),
+        )
+        spots, ratings = sql_result.one()
+        
+        return {
+            "spots": spots,
+            "photos": photos,
+            "ratings": ratings,
+            "comments": comments,
+        }
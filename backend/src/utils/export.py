@@ -6,10 +6,107 @@ Provides functions to export tourist spots with related data.
 
 import csv
 import json
-from typing import List, Dict, Any
+import re
+from decimal import Decimal
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
 from datetime import datetime
 from io import StringIO
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# CSV columns, in output order, with the value used when a spot lacks one
+_CSV_FIELDS = (
+    ("id", None),
+    ("nome", None),
+    ("descricao", None),
+    ("cidade", None),
+    ("estado", None),
+    ("pais", None),
+    ("latitude", None),
+    ("longitude", None),
+    ("endereco", None),
+    ("criado_por", None),
+    ("created_at", None),
+    ("avg_rating", None),
+    ("rating_count", None),
+    ("photo_count", 0),
+)
+CSV_FIELDNAMES = tuple(name for name, _ in _CSV_FIELDS)
+
+_get_csv_row = itemgetter(*CSV_FIELDNAMES)
+
+_CSV_HEADER = ",".join(CSV_FIELDNAMES)
+_CSV_SEPARATOR_COUNT = len(CSV_FIELDNAMES) - 1
+_CSV_LINE_TERMINATOR = "\r\n"
+
+# Characters (besides the delimiter) that force a field to be quoted
+_csv_needs_quoting = re.compile(r'["\r\n]').search
+
+
+def _csv_row_with_defaults(spot: Dict[str, Any], _fields=_CSV_FIELDS) -> List[Any]:
+    """Build a CSV row for a spot missing some columns (fields bound as a local default)."""
+    return [spot.get(name, default) for name, default in _fields]
+
+
+def _iter_csv_rows(spots: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Yield CSV row tuples, falling back to defaults for incomplete spots."""
+    for spot in spots:
+        try:
+            yield _get_csv_row(spot)
+        except KeyError:
+            yield _csv_row_with_defaults(spot)
+
+
+def _render_csv_rows(rows: Iterable[Tuple[Any, ...]]) -> str:
+    """
+    Render CSV text, joining plain rows directly and quoting via csv.writer only when needed.
+    
+    A row is plain when its joined line has exactly one delimiter per column
+    gap and no quote/newline characters, i.e. no field needs quoting.
+    Returns an empty string when there are no rows.
+    """
+    lines = [_CSV_HEADER]
+    fallback = StringIO()
+    # Keep the real terminator: QUOTE_MINIMAL quotes fields containing its characters
+    fallback_writer = csv.writer(fallback, lineterminator=_CSV_LINE_TERMINATOR)
+    
+    for row in rows:
+        line = ",".join(["" if value is None else str(value) for value in row])
+        if line.count(",") != _CSV_SEPARATOR_COUNT or _csv_needs_quoting(line):
+            fallback.seek(0)
+            fallback.truncate()
+            fallback_writer.writerow(row)
+            line = fallback.getvalue()[:-len(_CSV_LINE_TERMINATOR)]
+        lines.append(line)
+    
+    if len(lines) == 1:
+        return ""
+    
+    lines.append("")
+    return _CSV_LINE_TERMINATOR.join(lines)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize types the JSON encoders don't handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dump_json_bytes(value: Any) -> bytes:
+    """Serialize a value to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default)
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
 
 class ExportService:
     """Service for exporting tourist spot data."""
@@ -37,66 +134,63 @@ class ExportService:
                 "format_version": "1.0",
             }
         
-        return json.dumps(export_data, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            return orjson.dumps(
+                export_data, default=_json_default, option=orjson.OPT_INDENT_2
+            ).decode("utf-8")
+        
+        return json.dumps(export_data, indent=2, ensure_ascii=False, default=_json_default)
 
     @staticmethod
-    def export_to_csv(spots: List[Dict[str, Any]]) -> str:
+    def export_to_json_stream(
+        spots: List[Dict[str, Any]],
+        include_metadata: bool = True,
+    ) -> Iterator[bytes]:
         """
-        Export tourist spots to CSV format.
+        Export tourist spots to JSON as a stream of byte chunks.
+        
+        Produces the same document shape as export_to_json (compact), but
+        prepares and serializes one spot at a time so peak memory stays at
+        a single record instead of the whole export.
         
         Args:
-            spots: List of spot dictionaries
+            spots: List of raw spot dictionaries
+            include_metadata: Whether to include export metadata
             
-        Returns:
-            CSV string
+        Yields:
+            UTF-8 encoded JSON fragments
         """
-        if not spots:
-            return ""
-        
-        output = StringIO()
-        
-        # Define CSV columns
-        fieldnames = [
-            "id",
-            "nome",
-            "descricao",
-            "cidade",
-            "estado",
-            "pais",
-            "latitude",
-            "longitude",
-            "endereco",
-            "criado_por",
-            "created_at",
-            "avg_rating",
-            "rating_count",
-            "photo_count",
-        ]
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        
-        for spot in spots:
-            # Flatten the spot data for CSV
-            row = {
-                "id": spot.get("id"),
-                "nome": spot.get("nome"),
-                "descricao": spot.get("descricao"),
-                "cidade": spot.get("cidade"),
-                "estado": spot.get("estado"),
-                "pais": spot.get("pais"),
-                "latitude": spot.get("latitude"),
-                "longitude": spot.get("longitude"),
-                "endereco": spot.get("endereco"),
-                "criado_por": spot.get("criado_por"),
-                "created_at": spot.get("created_at"),
-                "avg_rating": spot.get("avg_rating"),
-                "rating_count": spot.get("rating_count"),
-                "photo_count": spot.get("photo_count", 0),
+        prepare = ExportService.prepare_spot_for_export
+        
+        yield b'{"data":['
+        for idx, spot in enumerate(spots):
+            if idx:
+                yield b","
+            yield _dump_json_bytes(prepare(spot))
+        yield b"]"
+        
+        if include_metadata:
+            metadata = {
+                "exported_at": datetime.utcnow().isoformat(),
+                "total_spots": len(spots),
+                "format_version": "1.0",
             }
-            writer.writerow(row)
+            yield b',"metadata":' + _dump_json_bytes(metadata)
         
-        return output.getvalue()
+        yield b"}"
+
+    @staticmethod
+    def export_to_csv(spots: Iterable[Dict[str, Any]]) -> str:
+        """
+        Export tourist spots to CSV format.
+        
+        Args:
+            spots: Iterable of spot dictionaries (consumed once)
+            
+        Returns:
+            CSV string, empty when there are no spots
+        """
+        return _render_csv_rows(_iter_csv_rows(spots))
 
     @staticmethod
     def prepare_spot_for_export(spot_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -110,20 +204,25 @@ class ExportService:
             Formatted spot dictionary
         """
         export_spot = spot_dict.copy()
+        get = export_spot.get
         
         # Format datetime fields
-        if "created_at" in export_spot and isinstance(export_spot["created_at"], datetime):
-            export_spot["created_at"] = export_spot["created_at"].isoformat()
+        created_at = get("created_at")
+        if isinstance(created_at, datetime):
+            export_spot["created_at"] = created_at.isoformat()
         
-        # Convert Decimal to float for latitude/longitude
-        if "latitude" in export_spot:
-            export_spot["latitude"] = float(export_spot["latitude"])
-        if "longitude" in export_spot:
-            export_spot["longitude"] = float(export_spot["longitude"])
+        # Convert Decimal to float for latitude/longitude (already-float values pass through)
+        latitude = get("latitude")
+        if latitude is not None and type(latitude) is not float:
+            export_spot["latitude"] = float(latitude)
+        longitude = get("longitude")
+        if longitude is not None and type(longitude) is not float:
+            export_spot["longitude"] = float(longitude)
         
         # Round avg_rating
-        if "avg_rating" in export_spot and export_spot["avg_rating"] is not None:
-            export_spot["avg_rating"] = round(float(export_spot["avg_rating"]), 2)
+        avg_rating = get("avg_rating")
+        if avg_rating is not None:
+            export_spot["avg_rating"] = round(float(avg_rating), 2)
         
         return export_spot
 
@@ -147,15 +246,15 @@ class ExportService:
         Raises:
             ValueError: If format is not supported
         """
-        # Prepare all spots for export
-        prepared_spots = [
-            ExportService.prepare_spot_for_export(spot) for spot in spots
-        ]
+        prepare = ExportService.prepare_spot_for_export
         
         if format.lower() == "json":
+            # JSON needs the full list for the document and its metadata count
+            prepared_spots = [prepare(spot) for spot in spots]
             return ExportService.export_to_json(prepared_spots, include_metadata)
         elif format.lower() == "csv":
-            return ExportService.export_to_csv(prepared_spots)
+            # CSV consumes spots once, so prepare them lazily while writing
+            return ExportService.export_to_csv(map(prepare, spots))
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
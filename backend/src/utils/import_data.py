@@ -5,9 +5,89 @@ Provides functions to parse and validate imported data.
 """
 
 import csv
+import gzip
+import io
 import json
-from typing import List, Dict, Any, Tuple
-from io import StringIO
+import os
+import re
+import shutil
+import tempfile
+import time
+import zlib
+from typing import IO, AsyncIterator, List, Dict, Any, Tuple, Union
+from io import StringIO, TextIOWrapper
+
+from pydantic import ValidationError
+
+from src.schemas.validators import SpotImportBatchValidator, SpotImportValidator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_EMPTY_VALUES = (None, "")
+
+# Validation error messages
+_INVALID_LATITUDE = "Invalid latitude value: {}"
+_INVALID_LONGITUDE = "Invalid longitude value: {}"
+_LATITUDE_RANGE = "Latitude must be between -90 and 90, got: {}"
+_LONGITUDE_RANGE = "Longitude must be between -180 and 180, got: {}"
+_NOME_TOO_LONG = "Nome must be 200 characters or less"
+_DESCRICAO_TOO_LONG = "Descricao must be 2000 characters or less"
+_COORDINATE_ERRORS = {
+    "latitude": (_INVALID_LATITUDE, _LATITUDE_RANGE),
+    "longitude": (_INVALID_LONGITUDE, _LONGITUDE_RANGE),
+}
+_TOO_LONG_ERRORS = {
+    "nome": _NOME_TOO_LONG,
+    "descricao": _DESCRICAO_TOO_LONG,
+}
+_RANGE_ERROR_TYPES = ("greater_than_equal", "less_than_equal")
+
+# CSV column -> spot field
+_CSV_FIELD_MAPPING = {
+    "id": "id",
+    "nome": "nome",
+    "descricao": "descricao",
+    "cidade": "cidade",
+    "estado": "estado",
+    "pais": "pais",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "endereco": "endereco",
+}
+
+
+def _format_validation_error(error: Dict[str, Any]) -> str:
+    """Translate a pydantic error entry into the import error messages."""
+    loc = error["loc"]
+    field = loc[-1] if loc and isinstance(loc[-1], str) else None
+    if field is None:
+        return error["msg"]
+    
+    error_type = error["type"]
+    value = error.get("input")
+    if error_type in ("missing", "string_too_short") or (
+        error_type == "string_type" and value in _EMPTY_VALUES
+    ):
+        return f"Missing required field: {field}"
+    
+    if field in _COORDINATE_ERRORS:
+        invalid_template, range_template = _COORDINATE_ERRORS[field]
+        if error_type in _RANGE_ERROR_TYPES:
+            return range_template.format(float(value))
+        if value in _EMPTY_VALUES:
+            return f"Missing required field: {field}"
+        return invalid_template.format(value)
+    
+    if error_type == "string_too_long" and field in _TOO_LONG_ERRORS:
+        return _TOO_LONG_ERRORS[field]
+    
+    return f"{field}: {error['msg']}"
 
 
 class ImportService:
@@ -24,49 +104,51 @@ class ImportService:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-        
-        # Required fields
-        required_fields = ["nome", "cidade", "estado", "pais", "latitude", "longitude"]
-        for field in required_fields:
-            if field not in spot or spot[field] is None or spot[field] == "":
-                errors.append(f"Missing required field: {field}")
+        try:
+            SpotImportValidator.model_validate(spot)
+        except ValidationError as e:
+            return False, [_format_validation_error(error) for error in e.errors()]
         
-        # Validate latitude
-        if "latitude" in spot:
-            try:
-                lat = float(spot["latitude"])
-                if not (-90 <= lat <= 90):
-                    errors.append(f"Latitude must be between -90 and 90, got: {lat}")
-            except (ValueError, TypeError):
-                errors.append(f"Invalid latitude value: {spot['latitude']}")
-        
-        # Validate longitude
-        if "longitude" in spot:
-            try:
-                lon = float(spot["longitude"])
-                if not (-180 <= lon <= 180):
-                    errors.append(f"Longitude must be between -180 and 180, got: {lon}")
-            except (ValueError, TypeError):
-                errors.append(f"Invalid longitude value: {spot['longitude']}")
+        return True, []
+
+    @staticmethod
+    def validate_spots(spots: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Validate a batch of spots in a single pass.
         
-        # Validate nome length
-        if "nome" in spot and len(str(spot["nome"])) > 200:
-            errors.append("Nome must be 200 characters or less")
+        Args:
+            spots: Spot dictionaries to validate
+            
+        Returns:
+            Tuple of (valid_spots, list_of_errors)
+        """
+        if not isinstance(spots, list):
+            return [], ["Invalid JSON structure: expected a list of spots"]
         
-        # Validate descricao length
-        if "descricao" in spot and spot["descricao"] and len(str(spot["descricao"])) > 2000:
-            errors.append("Descricao must be 2000 characters or less")
+        try:
+            SpotImportBatchValidator.validate_python(spots)
+        except ValidationError as e:
+            errors = []
+            invalid_indexes = set()
+            for error in e.errors():
+                idx = error["loc"][0]
+                invalid_indexes.add(idx)
+                errors.append(f"Spot {idx + 1}: {_format_validation_error(error)}")
+            
+            valid_spots = [
+                spot for idx, spot in enumerate(spots) if idx not in invalid_indexes
+            ]
+            return valid_spots, errors
         
-        return len(errors) == 0, errors
+        return spots, []
 
     @staticmethod
-    def parse_json(json_content: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    def parse_json(json_content: Union[str, bytes]) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Parse JSON content and extract spot data.
         
         Args:
-            json_content: JSON string
+            json_content: JSON string or UTF-8 bytes
             
         Returns:
             Tuple of (list_of_spots, list_of_errors)
@@ -75,7 +157,7 @@ class ImportService:
         spots = []
         
         try:
-            data = json.loads(json_content)
+            data = _json_loads(json_content)
             
             # Handle different JSON structures
             if isinstance(data, list):
@@ -92,15 +174,9 @@ class ImportService:
                 errors.append("Invalid JSON structure: expected list or object")
                 return [], errors
             
-            # Validate each spot
-            valid_spots = []
-            for idx, spot in enumerate(spots):
-                is_valid, spot_errors = ImportService.validate_spot_data(spot)
-                if is_valid:
-                    valid_spots.append(spot)
-                else:
-                    for error in spot_errors:
-                        errors.append(f"Spot {idx + 1}: {error}")
+            # Validate all spots in one pass
+            valid_spots, spot_errors = ImportService.validate_spots(spots)
+            errors.extend(spot_errors)
             
             return valid_spots, errors
             
@@ -112,12 +188,12 @@ class ImportService:
             return [], errors
 
     @staticmethod
-    def parse_csv(csv_content: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    def parse_csv(csv_content: Union[str, IO[str]]) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Parse CSV content and extract spot data.
         
         Args:
-            csv_content: CSV string
+            csv_content: CSV string, or a text stream read row by row
             
         Returns:
             Tuple of (list_of_spots, list_of_errors)
@@ -127,29 +203,30 @@ class ImportService:
         
         try:
             # Read CSV
-            csv_file = StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
+            csv_file = StringIO(csv_content) if isinstance(csv_content, str) else csv_content
+            reader = csv.reader(csv_file)
+            headers = next(reader, None)
+            if headers is None:
+                return [], errors
+            validate = ImportService.validate_spot_data
             
-            # Parse each row
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
+            # Resolve CSV column positions once instead of building a dict per row
+            header_index = {header: idx for idx, header in enumerate(headers)}
+            field_indexes = tuple(
+                (spot_field, header_index[csv_field])
+                for csv_field, spot_field in _CSV_FIELD_MAPPING.items()
+                if csv_field in header_index
+            )
+            
+            # Parse each non-blank row
+            for row_num, row in enumerate(filter(None, reader), start=2):  # 1 is header
+                row_len = len(row)
                 spot = {}
                 
                 # Map CSV fields to spot fields
-                field_mapping = {
-                    "id": "id",
-                    "nome": "nome",
-                    "descricao": "descricao",
-                    "cidade": "cidade",
-                    "estado": "estado",
-                    "pais": "pais",
-                    "latitude": "latitude",
-                    "longitude": "longitude",
-                    "endereco": "endereco",
-                }
-                
-                for csv_field, spot_field in field_mapping.items():
-                    if csv_field in row:
-                        value = row[csv_field].strip() if row[csv_field] else None
+                for spot_field, idx in field_indexes:
+                    if idx < row_len:
+                        value = row[idx].strip()
                         if value:
                             spot[spot_field] = value
                 
@@ -169,29 +246,35 @@ class ImportService:
                         continue
                 
                 # Validate spot
-                is_valid, spot_errors = ImportService.validate_spot_data(spot)
+                is_valid, spot_errors = validate(spot)
                 if is_valid:
                     spots.append(spot)
                 else:
-                    for error in spot_errors:
-                        errors.append(f"Row {row_num}: {error}")
+                    errors.extend(f"Row {row_num}: {error}" for error in spot_errors)
             
             return spots, errors
             
+        except ImportFileError:
+            # Unreadable upload, not a row problem: let the API answer 400
+            raise
         except Exception as e:
             errors.append(f"Error parsing CSV: {str(e)}")
             return [], errors
 
     @staticmethod
     def import_spots(
-        content: str,
+        content: Union[str, IO[bytes]],
         format: str,
     ) -> Tuple[List[Dict[str, Any]], List[str], Dict[str, Any]]:
         """
-        Import spots from content string.
+        Import spots from a content string or an uploaded binary file.
+        
+        CSV files are decoded and parsed row by row; JSON files are read as
+        bytes and parsed without an intermediate str copy. Gzip-compressed
+        files are detected by their magic bytes and inflated on the fly.
         
         Args:
-            content: File content as string
+            content: File content as string, or a binary file object
             format: Format type ("json" or "csv")
             
         Returns:
@@ -200,9 +283,15 @@ class ImportService:
         Raises:
             ValueError: If format is not supported
         """
+        is_file = not isinstance(content, str)
+        if is_file:
+            content = _maybe_gunzip(content)
+        
         if format.lower() == "json":
-            spots, errors = ImportService.parse_json(content)
+            spots, errors = ImportService.parse_json(content.read() if is_file else content)
         elif format.lower() == "csv":
+            if is_file:
+                content = TextIOWrapper(content, encoding="utf-8", newline="")
             spots, errors = ImportService.parse_csv(content)
         else:
             raise ValueError(f"Unsupported import format: {format}")
@@ -241,3 +330,221 @@ class ImportService:
         }
         
         return db_spot
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Largest decompressed size accepted from a gzip upload (guards against gzip bombs)
+IMPORT_MAX_DECOMPRESSED_BYTES = 200 * 1024 * 1024
+
+
+class ImportFileError(ValueError):
+    """Raised when an uploaded import file cannot be read (bad or oversized gzip)."""
+
+
+class _BoundedGzipReader(io.RawIOBase):
+    """Raw reader over a GzipFile that stops at IMPORT_MAX_DECOMPRESSED_BYTES."""
+
+    def __init__(self, gz: gzip.GzipFile):
+        self._gz = gz
+        self._total = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Inflate into ``buffer``, enforcing the size limit.
+        
+        Raises:
+            ImportFileError: If the data is not valid gzip or inflates past the limit
+        """
+        try:
+            size = self._gz.readinto(buffer)
+        except (gzip.BadGzipFile, EOFError, zlib.error) as e:
+            raise ImportFileError(f"Invalid gzip file: {e}") from e
+        self._total += size
+        if self._total > IMPORT_MAX_DECOMPRESSED_BYTES:
+            raise ImportFileError(
+                f"Decompressed import exceeds {IMPORT_MAX_DECOMPRESSED_BYTES} bytes"
+            )
+        return size
+
+
+def _maybe_gunzip(fileobj: IO[bytes]) -> IO[bytes]:
+    """
+    Transparently decompress a gzip-compressed upload.
+    
+    The decompressing reader raises ImportFileError, a ValueError mapped
+    to 400 by the API,
+    on corrupt data or once more than IMPORT_MAX_DECOMPRESSED_BYTES have
+    been inflated.
+    
+    Args:
+        fileobj: Seekable binary file
+        
+    Returns:
+        A bounded decompressing reader if the file starts with the gzip
+        magic bytes, otherwise the file itself
+    """
+    magic = fileobj.read(2)
+    fileobj.seek(0)
+    if magic == _GZIP_MAGIC:
+        return io.BufferedReader(_BoundedGzipReader(gzip.GzipFile(fileobj=fileobj, mode="rb")))
+    return fileobj
+
+
+# Chunked uploads: where parts are stored and how large one part may be
+IMPORT_CHUNK_DIR = os.path.join(tempfile.gettempdir(), "turistando_imports")
+IMPORT_CHUNK_MAX_BYTES = 8 * 1024 * 1024
+
+# Largest chunked import accepted, and the chunk count that implies
+IMPORT_MAX_BYTES = 512 * 1024 * 1024
+IMPORT_MAX_CHUNKS = -(-IMPORT_MAX_BYTES // IMPORT_CHUNK_MAX_BYTES)
+
+# Upload directories untouched for this long are deleted (never committed)
+IMPORT_CHUNK_TTL_SECONDS = 6 * 60 * 60
+
+_UPLOAD_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ImportChunkStore:
+    """Temporary on-disk storage for chunked (resumable) import uploads."""
+
+    @staticmethod
+    def upload_dir(upload_id: str) -> str:
+        """
+        Get the directory holding an upload's chunks.
+        
+        Args:
+            upload_id: Client-generated upload ID (uuid4 hex)
+            
+        Returns:
+            Directory path
+            
+        Raises:
+            ValueError: If the upload ID is malformed
+        """
+        if not _UPLOAD_ID_RE.match(upload_id):
+            raise ValueError("Invalid upload id: expected 32 hex characters")
+        return os.path.join(IMPORT_CHUNK_DIR, upload_id)
+
+    @staticmethod
+    def chunk_path(upload_id: str, index: int) -> str:
+        """Get the file path of one chunk."""
+        return os.path.join(ImportChunkStore.upload_dir(upload_id), f"{index:06d}.part")
+
+    @staticmethod
+    def sweep_stale(max_age: float = IMPORT_CHUNK_TTL_SECONDS) -> None:
+        """
+        Delete upload directories not modified within ``max_age`` seconds.
+        
+        Removes chunks of uploads that were abandoned before their commit.
+        
+        Args:
+            max_age: Age in seconds after which an upload is considered stale
+        """
+        cutoff = time.time() - max_age
+        try:
+            entries = list(os.scandir(IMPORT_CHUNK_DIR))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except OSError:
+                pass
+
+    @staticmethod
+    async def save_chunk(upload_id: str, index: int, body: AsyncIterator[bytes]) -> int:
+        """
+        Store one chunk, streaming the request body to disk.
+        
+        The chunk is written to a temporary name and renamed when complete,
+        so retrying a failed chunk simply replaces it.
+        
+        Args:
+            upload_id: Upload ID
+            index: Chunk index (0-based)
+            body: Async iterator over the request body
+            
+        Returns:
+            Chunk size in bytes
+            
+        Raises:
+            ValueError: If the upload ID is malformed, the index is out of
+                range or the chunk is too large
+        """
+        if not 0 <= index < IMPORT_MAX_CHUNKS:
+            raise ValueError(f"Chunk index must be between 0 and {IMPORT_MAX_CHUNKS - 1}")
+        
+        path = ImportChunkStore.chunk_path(upload_id, index)
+        upload_dir = os.path.dirname(path)
+        if not os.path.isdir(upload_dir):
+            # New upload: clean up abandoned ones first
+            ImportChunkStore.sweep_stale()
+        os.makedirs(upload_dir, exist_ok=True)
+        
+        tmp_path = f"{path}.tmp"
+        size = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                async for part in body:
+                    size += len(part)
+                    if size > IMPORT_CHUNK_MAX_BYTES:
+                        raise ValueError(f"Chunk exceeds {IMPORT_CHUNK_MAX_BYTES} bytes")
+                    f.write(part)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        return size
+
+    @staticmethod
+    def assemble(upload_id: str, total_chunks: int) -> IO[bytes]:
+        """
+        Join all chunks of an upload into one temporary file.
+        
+        Args:
+            upload_id: Upload ID
+            total_chunks: Number of chunks the client sent
+            
+        Returns:
+            Binary file positioned at the start (deleted when closed)
+            
+        Raises:
+            ValueError: If the upload ID is malformed, total_chunks is out of
+                range, or chunks are missing or beyond total_chunks
+        """
+        if not 1 <= total_chunks <= IMPORT_MAX_CHUNKS:
+            raise ValueError(f"total_chunks must be between 1 and {IMPORT_MAX_CHUNKS}")
+        
+        upload_dir = ImportChunkStore.upload_dir(upload_id)
+        try:
+            stored = {name for name in os.listdir(upload_dir) if name.endswith(".part")}
+        except FileNotFoundError:
+            stored = set()
+        
+        paths = [ImportChunkStore.chunk_path(upload_id, i) for i in range(total_chunks)]
+        expected = {os.path.basename(path) for path in paths}
+        missing = [i for i, path in enumerate(paths) if os.path.basename(path) not in stored]
+        if missing:
+            raise ValueError(f"Missing chunks: {missing[:20]}")
+        extra = sorted(stored - expected)
+        if extra:
+            raise ValueError(f"Unexpected chunks beyond total_chunks: {extra[:20]}")
+        
+        assembled = tempfile.TemporaryFile()
+        for path in paths:
+            with open(path, "rb") as chunk:
+                shutil.copyfileobj(chunk, assembled)
+        assembled.seek(0)
+        return assembled
+
+    @staticmethod
+    def discard(upload_id: str) -> None:
+        """Delete all stored chunks of an upload."""
+        shutil.rmtree(ImportChunkStore.upload_dir(upload_id), ignore_errors=True)
@@ -4,12 +4,37 @@ JWT token generation and validation utilities.
 Handles access token creation and verification for authentication.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from jose import JWTError, jwt
+from typing import Dict, Any, Optional, Tuple
+import jwt
 
 from src.config.settings import settings
 
+# Decoded-token cache: blake2b(token) -> (payload, expires_at monotonic)
+_TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE_TTL = 60
+_token_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Build a bounded-size cache key bound to the current signing config."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(settings.ALGORITHM.encode())
+    digest.update(settings.SECRET_KEY.encode())
+    digest.update(token.encode())
+    return digest.digest()
+
+
+def clear_token_cache() -> None:
+    """Drop all memoized token payloads (e.g. after a secret rotation)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -44,6 +69,9 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT access token.
     
+    Valid payloads are memoized for up to 60 seconds (never past the token's
+    own ``exp``), so repeated lookups of the same token skip signature checks.
+    
     Args:
         token: JWT token string to decode.
     
@@ -56,11 +84,36 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
         >>> payload["sub"]
         'user@example.com'
     """
+    key = _token_cache_key(token)
+    now = time.monotonic()
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            if cached[1] > now:
+                _token_cache.move_to_end(key)
+                return cached[0]
+            del _token_cache[key]
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
+    
+    # Never keep a payload cached past its own expiration
+    ttl = float(_TOKEN_CACHE_TTL)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    
+    if ttl > 0:
+        with _token_cache_lock:
+            _token_cache[key] = (payload, now + ttl)
+            _token_cache.move_to_end(key)
+            if len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+    
+    return payload
 
 
 def extract_user_id_from_token(token: str) -> Optional[int]:
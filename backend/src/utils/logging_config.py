@@ -4,12 +4,16 @@ Logging Configuration - Centralized logging setup.
 Configures logging for the application with rotation and formatting.
 """
 
+import atexit
 import logging
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 
+# Number of records buffered before the file handler is written to
+FILE_LOG_BUFFER_CAPACITY = 512
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -20,12 +24,17 @@ def setup_logging(
     """
     Setup application logging with file rotation and console output.
     
+    File output is buffered through a MemoryHandler and flushed every
+    FILE_LOG_BUFFER_CAPACITY records, on ERROR or above, and at exit.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory for log files
         log_to_file: Whether to log to file
         log_to_console: Whether to log to console
     """
+    level = getattr(logging, log_level.upper())
+    
     # Create logs directory if it doesn't exist
     if log_to_file:
         log_path = Path(log_dir)
@@ -33,9 +42,11 @@ def setup_logging(
     
     # Configure root logger
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
     
-    # Remove existing handlers
+    # Remove existing handlers (flushing any buffered records first)
+    for handler in logger.handlers:
+        handler.flush()
     logger.handlers = []
     
     # Create formatter
@@ -47,22 +58,30 @@ def setup_logging(
     # Console handler
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
     
-    # File handler with rotation
+    # File handler with rotation, fronted by a buffer to batch writes
     if log_to_file:
-        log_file = Path(log_dir) / f"turistando_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = log_path / f"turistando_{datetime.now().strftime('%Y%m%d')}.log"
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
             encoding='utf-8'
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        buffered_handler = MemoryHandler(
+            capacity=FILE_LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        buffered_handler.setLevel(level)
+        logger.addHandler(buffered_handler)
+        atexit.register(buffered_handler.flush)
     
     # Set levels for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -0,0 +1,20 @@
+"""
+Static file serving with long-lived browser caching.
+
+Serves uploaded photos and thumbnails from the upload directory.
+"""
+
+from starlette.staticfiles import StaticFiles
+
+# Uploaded files never change under a versioned URL (?v=<photo id>)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks every served file as immutable for a year."""
+    
+    def file_response(self, *args, **kwargs):
+        """Build the file response and add the Cache-Control header."""
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
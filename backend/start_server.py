@@ -2,6 +2,7 @@
 Script para iniciar o servidor da aplicação.
 Verifica dependências e inicia o servidor FastAPI.
 """
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -13,9 +14,21 @@ sys.path.insert(0, str(backend_dir))
 # Define variáveis de ambiente
 os.environ.setdefault("PYTHONPATH", str(backend_dir))
 
+
+def _has_module(name: str) -> bool:
+    """Verifica se um módulo opcional está instalado."""
+    return importlib.util.find_spec(name) is not None
+
+
 if __name__ == "__main__":
     import uvicorn
     
+    # Reload só em desenvolvimento (DEV=1/true/yes).
+    # Rate limiter e cache de JWT são por processo, então o
+    # padrão é 1 worker; use WORKERS=N para escalar conscientemente.
+    reload = os.getenv("DEV", "").strip().lower() in ("1", "true", "yes")
+    workers = 1 if reload else int(os.getenv("WORKERS", "1"))
+    
     print("=" * 60)
     print("  Turistando API Server")
     print("=" * 60)
@@ -23,13 +36,18 @@ if __name__ == "__main__":
     print("🚀 Iniciando servidor FastAPI...")
     print("📍 Acesse: http://localhost:8000")
     print("📚 Documentação: http://localhost:8000/docs")
+    mode = "desenvolvimento (reload)" if reload else f"produção ({workers} workers)"
+    print(f"⚙️  Modo: {mode}")
     print()
     
-    # Iniciar servidor
+    # Iniciar servidor (uvloop/httptools quando disponíveis, ex.: uvicorn[standard] no Linux)
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=workers,
+        loop="uvloop" if _has_module("uvloop") else "asyncio",
+        http="httptools" if _has_module("httptools") else "h11",
         log_level="info"
     )
@@ -5,7 +5,8 @@ Main landing page for the Streamlit application.
 """
 
 import streamlit as st
-from src.components.user_profile import user_profile_sidebar, get_current_user
+from components.user_profile import user_profile_sidebar, get_current_user
+from services.api_client import get_api_client
 
 st.set_page_config(
     page_title="Turistando",
@@ -14,6 +15,13 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_platform_stats():
+    """Fetch the spot listing used for platform stats (cached for 60s)."""
+    return get_api_client().list_spots(limit=1)
+
+
 # Display user profile in sidebar if logged in
 user_profile_sidebar()
 
@@ -52,10 +60,7 @@ Use o menu lateral para navegar pelas diferentes seções:
 
 # Try to fetch stats from API
 try:
-    from src.services.api_client import TuristandoAPI
-    
-    api = TuristandoAPI()
-    spots_data = api.list_spots(limit=1)
+    spots_data = _fetch_platform_stats()
     
     col1, col2, col3 = st.columns(3)
     
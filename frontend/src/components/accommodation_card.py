@@ -5,6 +5,17 @@ Accommodation card component for displaying accommodation information.
 import streamlit as st
 from typing import Optional
 
+TIPO_ICONS = {
+    "hotel": "🏨",
+    "pousada": "🏡",
+    "hostel": "🛏️"
+}
+
+
+def _set_flag(key: str):
+    """Button callback: set a session state flag."""
+    st.session_state[key] = True
+
 
 def render_accommodation_card(accommodation: dict, show_actions: bool = False):
     """
@@ -14,14 +25,8 @@ def render_accommodation_card(accommodation: dict, show_actions: bool = False):
         accommodation: Accommodation dictionary with details.
         show_actions: Whether to show admin action buttons.
     """
-    tipo_icons = {
-        "hotel": "🏨",
-        "pousada": "🏡",
-        "hostel": "🛏️"
-    }
-    
     tipo = accommodation.get("tipo", "hotel")
-    icon = tipo_icons.get(tipo, "🏨")
+    icon = TIPO_ICONS.get(tipo, "🏨")
     
     with st.container():
         col1, col2 = st.columns([3, 1])
@@ -49,24 +54,38 @@ def render_accommodation_card(accommodation: dict, show_actions: bool = False):
                 st.markdown(f"[🔗 Fazer Reserva]({accommodation['link_reserva']})")
         
         if show_actions:
+            ss = st.session_state
+            acc_id = accommodation["id"]
+            editing_key = f"editing_acc_{acc_id}"
+            confirm_key = f"confirm_delete_acc_{acc_id}"
+            confirming = ss.get(confirm_key)
+            
             st.divider()
             col_edit, col_delete = st.columns(2)
             
             with col_edit:
-                if st.button(f"✏️ Editar", key=f"edit_acc_{accommodation['id']}"):
-                    st.session_state[f"editing_acc_{accommodation['id']}"] = True
-                    st.rerun()
+                st.button(
+                    f"✏️ Editar",
+                    key=f"edit_acc_{acc_id}",
+                    on_click=_set_flag,
+                    args=(editing_key,)
+                )
             
             with col_delete:
-                if st.button(f"🗑️ Deletar", key=f"delete_acc_{accommodation['id']}", type="secondary"):
-                    if st.session_state.get(f"confirm_delete_acc_{accommodation['id']}"):
+                if confirming:
+                    if st.button(f"🗑️ Deletar", key=f"delete_acc_{acc_id}", type="secondary"):
                         # Actually delete
                         return "delete"
-                    else:
-                        st.session_state[f"confirm_delete_acc_{accommodation['id']}"] = True
-                        st.rerun()
+                else:
+                    st.button(
+                        f"🗑️ Deletar",
+                        key=f"delete_acc_{acc_id}",
+                        type="secondary",
+                        on_click=_set_flag,
+                        args=(confirm_key,)
+                    )
             
-            if st.session_state.get(f"confirm_delete_acc_{accommodation['id']}"):
+            if confirming:
                 st.warning("⚠️ Tem certeza? Clique novamente para confirmar.")
 
 
@@ -5,6 +5,22 @@ Accommodation form component for creating and editing accommodations.
 import streamlit as st
 import requests
 from typing import Optional
+from services.api_client import cached_get_spot_bundle, error_detail, get_http_session
+
+
+# Accommodation type options and their selectbox indexes
+_ACC_TYPES = ("hotel", "pousada", "hostel")
+_ACC_TYPE_IDX = {tipo: i for i, tipo in enumerate(_ACC_TYPES)}
+
+
+def _stop_editing(accommodation_id: Optional[int]):
+    """Cancel button callback: leave edit mode for the accommodation."""
+    st.session_state.pop(f"editing_acc_{accommodation_id}", None)
+
+
+def _show_add_form():
+    """Button callback: open the quick add form."""
+    st.session_state["show_add_accommodation"] = True
 
 
 def render_accommodation_form(
@@ -46,8 +62,8 @@ def render_accommodation_form(
         with col1:
             tipo = st.selectbox(
                 "Tipo de Hospedagem *",
-                ["hotel", "pousada", "hostel"],
-                index=["hotel", "pousada", "hostel"].index(initial_data.get("tipo", "hotel")) if initial_data else 0
+                _ACC_TYPES,
+                index=_ACC_TYPE_IDX.get((initial_data or {}).get("tipo"), 0)
             )
         
         with col2:
@@ -81,16 +97,13 @@ def render_accommodation_form(
             )
         
         with col_cancel:
-            cancel = st.form_submit_button(
+            st.form_submit_button(
                 "❌ Cancelar",
-                use_container_width=True
+                use_container_width=True,
+                on_click=_stop_editing,
+                args=(accommodation_id,)
             )
         
-        if cancel:
-            if is_edit and f"editing_acc_{accommodation_id}" in st.session_state:
-                del st.session_state[f"editing_acc_{accommodation_id}"]
-            st.rerun()
-        
         if submit:
             # Validation
             if not nome or not endereco or not tipo:
@@ -122,18 +135,20 @@ def render_accommodation_form(
                 
                 if is_edit:
                     # Update existing accommodation
-                    response = requests.put(
-                        f"http://localhost:8000/api/accommodations/{accommodation_id}",
-                        json=data,
-                        headers=headers
-                    )
+                    method = "PUT"
+                    url = f"http://localhost:8000/api/accommodations/{accommodation_id}"
                 else:
                     # Create new accommodation
-                    response = requests.post(
-                        "http://localhost:8000/api/accommodations",
-                        json=data,
-                        headers=headers
-                    )
+                    method = "POST"
+                    url = "http://localhost:8000/api/accommodations"
+                
+                response = get_http_session().request(
+                    method,
+                    url,
+                    json=data,
+                    headers=headers,
+                    timeout=10
+                )
                 
                 if response.status_code in [200, 201]:
                     st.success(f"✅ Hospedagem {'atualizada' if is_edit else 'adicionada'} com sucesso!")
@@ -142,10 +157,12 @@ def render_accommodation_form(
                     if is_edit and f"editing_acc_{accommodation_id}" in st.session_state:
                         del st.session_state[f"editing_acc_{accommodation_id}"]
                     
+                    # Spot Details reads accommodations from the cached bundle
+                    cached_get_spot_bundle.clear()
                     return True
                 else:
-                    error_detail = response.json().get("detail", "Erro desconhecido")
-                    st.error(f"❌ Erro ao salvar hospedagem: {error_detail}")
+                    detail = error_detail(response, "Erro desconhecido")
+                    st.error(f"❌ Erro ao salvar hospedagem: {detail}")
                     return False
                     
             except requests.exceptions.RequestException as e:
@@ -162,9 +179,7 @@ def render_quick_add_accommodation_button(spot_id: int):
     Args:
         spot_id: Tourist spot ID.
     """
-    if st.button("➕ Adicionar Hospedagem", type="primary"):
-        st.session_state["show_add_accommodation"] = True
-        st.rerun()
+    st.button("➕ Adicionar Hospedagem", type="primary", on_click=_show_add_form)
     
     if st.session_state.get("show_add_accommodation"):
         if render_accommodation_form(spot_id):
@@ -4,31 +4,99 @@ Comment submission component.
 Provides UI for submitting comments on tourist spots.
 """
 
+import re
+import time
 import streamlit as st
 from typing import Optional
-from services.api_client import TuristandoAPI
+from services.api_client import TuristandoAPI, get_api_client
+from components.comments_list import fetch_spot_comments
+
+# Max time since the first submit of a text during which identical re-posts are dropped
+QUICK_COMMENT_DEBOUNCE_SECONDS = 2.0
+
+# Error hints in API error messages, checked in priority order
+_ERR_RE = re.compile(r"(inappropriate|moderation|40[0134])", re.I)
+_ERR_PRIORITY = ("404", "401", "403", "inappropriate", "moderation", "400")
+
+_MODERATION_MESSAGE = "❌ Your comment contains inappropriate content. Please revise and try again."
+_AUTH_MESSAGE = "❌ Authentication error. Please login again."
+_COMMENT_ERROR_MESSAGES = {
+    "404": "❌ Tourist spot not found.",
+    "401": _AUTH_MESSAGE,
+    "403": _AUTH_MESSAGE,
+    "inappropriate": _MODERATION_MESSAGE,
+    "moderation": _MODERATION_MESSAGE,
+    "400": "❌ Invalid input. Please check your comment.",
+}
+
+
+def _comment_error_kind(error_msg: str) -> str:
+    """
+    Classify an API error message with a single regex pass.
+    
+    Args:
+        error_msg: Error message from the API call.
+    
+    Returns:
+        The highest-priority hint found, or "" if none matched.
+    """
+    found = {hint.lower() for hint in _ERR_RE.findall(error_msg)}
+    for kind in _ERR_PRIORITY:
+        if kind in found:
+            return kind
+    return ""
+
+
+def _show_comment_error(error_msg: str):
+    """
+    Display a user-friendly message for a failed comment submission.
+    
+    Args:
+        error_msg: Error message from the API call.
+    """
+    message = _COMMENT_ERROR_MESSAGES.get(_comment_error_kind(error_msg))
+    st.error(message or f"❌ Error posting comment: {error_msg}")
 
 
 def render_comment_form(
-    api: TuristandoAPI,
+    api: Optional[TuristandoAPI],
     spot_id: int,
-    token: Optional[str] = None
+    token: Optional[str] = None,
+    queue: bool = False
 ) -> bool:
     """
     Render comment submission form.
     
     Args:
-        api: API client instance.
+        api: API client instance (None uses the shared get_api_client()).
         spot_id: Tourist spot ID.
         token: User authentication token.
+        queue: Queue submitted comments and post them together in one
+            bulk request via a "Post all" button.
     
     Returns:
-        True if comment was submitted successfully.
+        True if comment(s) were submitted successfully.
     """
+    api = api or get_api_client()
+    
     if not token:
         st.info("🔒 Please login to post a comment")
         return False
     
+    queue_key = f"comment_queue_{spot_id}"
+    if queue and st.session_state.get(queue_key):
+        queued = st.session_state[queue_key]
+        if st.button(f"📤 Post all ({len(queued)})", key=f"post_comment_queue_{spot_id}", type="primary"):
+            try:
+                api.create_comments_bulk(spot_id=spot_id, textos=queued, token=token)
+                del st.session_state[queue_key]
+                fetch_spot_comments.clear()
+                st.success(f"✅ {len(queued)} comments posted successfully!")
+                return True
+            except Exception as e:
+                _show_comment_error(str(e))
+                return False
+    
     with st.form(key=f"comment_form_{spot_id}"):
         st.subheader("💬 Add a Comment")
         
@@ -59,47 +127,39 @@ def render_comment_form(
         
         if submitted:
             # Validate
-            if not texto or len(texto.strip()) == 0:
+            clean = texto.strip()
+            if not clean:
                 st.error("❌ Please enter a comment")
                 return False
             
-            if len(texto) > 2000:
+            if len(clean) > 2000:
                 st.error("❌ Comment is too long (max 2000 characters)")
                 return False
             
+            if queue:
+                # Defer the POST until "Post all"
+                st.session_state.setdefault(queue_key, []).append(clean)
+                st.info("📝 Comment queued. Use \"Post all\" to publish queued comments.")
+                return False
+            
             try:
-                # Submit comment
-                result = api.create_comment(
-                    spot_id=spot_id,
-                    texto=texto,
-                    token=token
-                )
+                # Submit comment (single item through the bulk endpoint)
+                api.create_comments_bulk(spot_id=spot_id, textos=[clean], token=token)
+                fetch_spot_comments.clear()
                 st.success("✅ Comment posted successfully!")
                 st.balloons()
                 return True
                 
             except Exception as e:
-                error_msg = str(e)
-                
                 # Handle specific error cases
-                if "404" in error_msg:
-                    st.error("❌ Tourist spot not found.")
-                elif "401" in error_msg or "403" in error_msg:
-                    st.error("❌ Authentication error. Please login again.")
-                elif "inappropriate" in error_msg.lower() or "moderation" in error_msg.lower():
-                    st.error("❌ Your comment contains inappropriate content. Please revise and try again.")
-                elif "400" in error_msg:
-                    st.error("❌ Invalid input. Please check your comment.")
-                else:
-                    st.error(f"❌ Error posting comment: {error_msg}")
-                
+                _show_comment_error(str(e))
                 return False
     
     return False
 
 
 def render_comment_quick_form(
-    api: TuristandoAPI,
+    api: Optional[TuristandoAPI],
     spot_id: int,
     token: Optional[str] = None,
     on_submit=None
@@ -108,11 +168,13 @@ def render_comment_quick_form(
     Render a compact inline comment form.
     
     Args:
-        api: API client instance.
+        api: API client instance (None uses the shared get_api_client()).
         spot_id: Tourist spot ID.
         token: User authentication token.
         on_submit: Callback function to call after successful submission.
     """
+    api = api or get_api_client()
+    
     if not token:
         st.info("💬 Login to join the conversation")
         return
@@ -126,16 +188,26 @@ def render_comment_quick_form(
     )
     
     if st.button("Post", key=f"quick_comment_btn_{spot_id}", type="primary"):
-        if not texto or len(texto.strip()) == 0:
+        clean = texto.strip()
+        if not clean:
             st.warning("Please enter a comment")
             return
         
+        # Collapse bursts of identical submits (double clicks, reruns) into one POST
+        pending_key = f"pending_comment_{spot_id}"
+        pending = st.session_state.get(pending_key)
+        now = time.monotonic()
+        if (
+            pending
+            and pending["text"] == clean
+            and now - pending["first_ts"] < QUICK_COMMENT_DEBOUNCE_SECONDS
+        ):
+            return
+        st.session_state[pending_key] = {"text": clean, "first_ts": now}
+        
         try:
-            result = api.create_comment(
-                spot_id=spot_id,
-                texto=texto,
-                token=token
-            )
+            api.create_comments_bulk(spot_id=spot_id, textos=[clean], token=token)
+            fetch_spot_comments.clear()
             st.success("✅ Comment posted!")
             
             # Call callback if provided
@@ -146,8 +218,10 @@ def render_comment_quick_form(
             st.rerun()
             
         except Exception as e:
+            # Allow an immediate retry of the same text after a failure
+            st.session_state.pop(pending_key, None)
             error_msg = str(e)
-            if "inappropriate" in error_msg.lower() or "moderation" in error_msg.lower():
+            if _comment_error_kind(error_msg) in ("inappropriate", "moderation"):
                 st.error("❌ Comment contains inappropriate content")
             else:
                 st.error(f"❌ Error: {error_msg}")
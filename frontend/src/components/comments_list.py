@@ -4,32 +4,173 @@ Comments list component.
 Displays comments for tourist spots with sorting and pagination.
 """
 
+import pandas as pd
 import streamlit as st
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
-from services.api_client import TuristandoAPI
+from services.api_client import TuristandoAPI, get_api_client, start_prefetch
+from utils.text import truncate
 
 
-def render_comments_list(
-    api: TuristandoAPI,
+# Comment sort options, their labels and selectbox indexes
+_SORT_OPTS = ("recentes", "antigas", "mais_curtidos")
+_SORT_LABELS = {
+    "recentes": "Most Recent",
+    "antigas": "Oldest First",
+    "mais_curtidos": "Most Liked"
+}
+_SORT_IDX = {opt: i for i, opt in enumerate(_SORT_OPTS)}
+
+# Query parameter holding the current comments page
+PAGE_QUERY_PARAM = "page"
+
+
+def get_comment_page() -> int:
+    """
+    Read the current comments page from the URL query parameters.
+    
+    Returns:
+        Page number (1 if missing or invalid).
+    """
+    try:
+        return max(1, int(st.query_params.get(PAGE_QUERY_PARAM, "1")))
+    except ValueError:
+        return 1
+
+
+def _set_comment_page(page: int):
+    """Button callback: store the comments page in the URL."""
+    st.query_params[PAGE_QUERY_PARAM] = str(page)
+
+
+@lru_cache(maxsize=4096)
+def format_comment_date(created_at: str) -> str:
+    """
+    Format a comment ISO timestamp for display, memoized per raw string.
+    
+    Args:
+        created_at: ISO 8601 timestamp (may end with "Z").
+    
+    Returns:
+        Formatted date, or "Recently" if it cannot be parsed.
+    """
+    try:
+        parsed = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return "Recently"
+    return parsed.strftime("%b %d, %Y %H:%M")
+
+
+def _flatten_comment(comment: dict) -> dict:
+    """
+    Flatten a raw API comment into the record the renderers use.
+    
+    Args:
+        comment: Comment as returned by the API.
+    
+    Returns:
+        Dict with id, user, date_str, likes and text.
+    """
+    created_at = comment.get("createdAt")
+    return {
+        "id": comment["_id"],
+        "user": (comment.get("usuario") or {}).get("login")
+        or f"User {comment.get('usuarioId', 'Unknown')}",
+        "date_str": format_comment_date(created_at) if created_at else "Recently",
+        "likes": (comment.get("metadata") or {}).get("likes", 0),
+        "text": comment.get("texto", ""),
+    }
+
+
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
+def fetch_spot_comments(
+    _api: TuristandoAPI,
     spot_id: int,
     page: int = 1,
     per_page: int = 20,
     ordenacao: str = "recentes"
+) -> dict:
+    """
+    Fetch a page of comments, cached for 30 seconds across reruns.
+    
+    The API client is excluded from the cache key (leading underscore).
+    Comments are flattened once here (see _flatten_comment), so the
+    cached page is already in render-ready form. Call
+    ``fetch_spot_comments.clear()`` after mutating comments.
+    
+    Args:
+        _api: API client instance.
+        spot_id: Tourist spot ID.
+        page: Page number.
+        per_page: Items per page.
+        ordenacao: Sort order (recentes, antigas, mais_curtidos).
+    
+    Returns:
+        Flattened comments list with pagination.
+    """
+    response = _api.get_spot_comments(
+        spot_id=spot_id,
+        page=page,
+        per_page=per_page,
+        ordenacao=ordenacao
+    )
+    response["comments"] = [_flatten_comment(c) for c in response.get("comments", [])]
+    return response
+
+
+def _prefetch_comments(
+    api: TuristandoAPI,
+    spot_id: int,
+    page: int,
+    per_page: int = 20,
+    ordenacao: str = "recentes"
 ):
     """
-    Render comments list with pagination and sorting.
+    Warm the fetch_spot_comments cache for a page in a background thread.
+    
+    Runs once per session via start_prefetch(); failures are ignored and
+    the page is simply fetched again when shown.
     
     Args:
         api: API client instance.
         spot_id: Tourist spot ID.
-        page: Current page number.
+        page: Page number to prefetch.
+        per_page: Items per page.
+        ordenacao: Sort order (recentes, antigas, mais_curtidos).
+    """
+    start_prefetch(
+        ("comments", spot_id, page, per_page, ordenacao),
+        lambda: fetch_spot_comments(api, spot_id, page, per_page, ordenacao),
+    )
+
+
+def render_comments_list(
+    api: Optional[TuristandoAPI],
+    spot_id: int,
+    page: Optional[int] = None,
+    per_page: int = 20,
+    ordenacao: str = "recentes"
+):
+    """
+    Render comments list with pagination and sorting.
+    
+    Args:
+        api: API client instance (None uses the shared get_api_client()).
+        spot_id: Tourist spot ID.
+        page: Current page number (defaults to the "page" query parameter).
         per_page: Items per page.
         ordenacao: Sort order (recentes, antigas, mais_curtidos).
     """
+    api = api or get_api_client()
+    
+    if page is None:
+        page = get_comment_page()
+    
     try:
         # Fetch comments
-        response = api.get_spot_comments(
+        response = fetch_spot_comments(
+            api,
             spot_id=spot_id,
             page=page,
             per_page=per_page,
@@ -43,6 +184,9 @@ def render_comments_list(
         # Header with count
         st.subheader(f"💬 Comments ({total})")
         
+        if st.session_state.pop("comments_reported_notice", False):
+            st.warning("Comment reported for moderation")
+        
         if total == 0:
             st.info("No comments yet. Be the first to share your thoughts!")
             return
@@ -52,13 +196,9 @@ def render_comments_list(
         with col1:
             sort_option = st.selectbox(
                 "Sort by",
-                options=["recentes", "antigas", "mais_curtidos"],
-                format_func=lambda x: {
-                    "recentes": "Most Recent",
-                    "antigas": "Oldest First",
-                    "mais_curtidos": "Most Liked"
-                }[x],
-                index=["recentes", "antigas", "mais_curtidos"].index(ordenacao),
+                options=_SORT_OPTS,
+                format_func=_SORT_LABELS.__getitem__,
+                index=_SORT_IDX.get(ordenacao, 0),
                 key=f"sort_comments_{spot_id}"
             )
         
@@ -67,77 +207,78 @@ def render_comments_list(
             st.rerun()
         
         # Display comments
-        for comment in comments:
-            render_comment_card(api, comment)
+        render_comments_table(api, comments, key=f"comments_table_{spot_id}_{page}_{ordenacao}")
         
         # Pagination
         if total > per_page:
             render_pagination(pagination, spot_id)
+            
+            # Warm the next page while the user reads this one
+            if page * per_page < total:
+                _prefetch_comments(api, spot_id, page + 1, per_page, ordenacao)
         
     except Exception as e:
         st.error(f"❌ Error loading comments: {e}")
 
 
-def render_comment_card(api: TuristandoAPI, comment: dict):
+def render_comments_table(api: TuristandoAPI, comments: list, key: str):
     """
-    Render a single comment card.
+    Render a page of comments as a single editable table.
+    
+    One data editor replaces the per-comment columns and buttons. The
+    Like/Report checkbox columns are diffed against their unchecked
+    defaults to find which actions were clicked.
     
     Args:
         api: API client instance.
-        comment: Comment data dictionary.
+        comments: Flattened comment records from fetch_spot_comments.
+        key: Widget key for the data editor.
     """
-    with st.container():
-        # Header: User and date
-        col1, col2, col3 = st.columns([2, 1, 1])
-        
-        with col1:
-            # User info
-            usuario = comment.get("usuario", {})
-            username = usuario.get("login", f"User {comment.get('usuarioId', 'Unknown')}")
-            st.markdown(f"**{username}**")
-        
-        with col2:
-            # Date
-            try:
-                created_at = datetime.fromisoformat(comment["createdAt"].replace("Z", "+00:00"))
-                date_str = created_at.strftime("%b %d, %Y %H:%M")
-                st.caption(date_str)
-            except:
-                st.caption("Recently")
-        
-        with col3:
-            # Likes counter
-            metadata = comment.get("metadata", {})
-            likes = metadata.get("likes", 0)
-            st.caption(f"👍 {likes}")
-        
-        # Comment text
-        texto = comment.get("texto", "")
-        st.write(texto)
-        
-        # Actions
-        col1, col2, col3 = st.columns([1, 1, 4])
-        
-        with col1:
-            # Like button
-            if st.button("👍 Like", key=f"like_{comment['_id']}", use_container_width=True):
-                try:
-                    api.like_comment(comment["_id"])
-                    st.success("Liked!")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Error: {e}")
-        
-        with col2:
-            # Report button
-            if st.button("🚩 Report", key=f"report_{comment['_id']}", use_container_width=True):
-                try:
-                    api.report_comment(comment["_id"])
-                    st.warning("Comment reported for moderation")
-                except Exception as e:
-                    st.error(f"Error: {e}")
-        
-        st.divider()
+    table = pd.DataFrame(
+        {
+            "User": [c["user"] for c in comments],
+            "Date": [c["date_str"] for c in comments],
+            "Likes": [c["likes"] for c in comments],
+            "Comment": [c["text"] for c in comments],
+            "Like": False,
+            "Report": False,
+        },
+        index=[c["id"] for c in comments],
+    )
+    
+    edited = st.data_editor(
+        table,
+        key=key,
+        hide_index=True,
+        use_container_width=True,
+        disabled=("User", "Date", "Likes", "Comment"),
+        column_config={
+            "Like": st.column_config.CheckboxColumn("👍 Like"),
+            "Report": st.column_config.CheckboxColumn("🚩 Report"),
+        },
+    )
+    
+    liked = edited.index[edited["Like"]]
+    reported = edited.index[edited["Report"]]
+    if liked.empty and reported.empty:
+        return
+    
+    try:
+        if not liked.empty:
+            api.like_comments_bulk(list(liked))
+        for comment_id in reported:
+            api.report_comment(comment_id)
+    except Exception as e:
+        st.error(f"Error: {e}")
+        return
+    finally:
+        fetch_spot_comments.clear()
+        # Reset the checkboxes so actions are not resent
+        st.session_state.pop(key, None)
+    
+    if not reported.empty:
+        st.session_state["comments_reported_notice"] = True
+    st.rerun()
 
 
 def render_pagination(pagination: dict, spot_id: int):
@@ -161,36 +302,30 @@ def render_pagination(pagination: dict, spot_id: int):
     
     col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
     
+    # Navigation goes through the URL; the callbacks run before the rerun,
+    # so revisited pages are served from the fetch_spot_comments cache.
     with col1:
         if page > 1:
-            if st.button("⏮️ First", key=f"first_page_{spot_id}"):
-                st.session_state[f"comment_page_{spot_id}"] = 1
-                st.rerun()
+            st.button("⏮️ First", key=f"first_page_{spot_id}", on_click=_set_comment_page, args=(1,))
     
     with col2:
         if page > 1:
-            if st.button("◀️ Prev", key=f"prev_page_{spot_id}"):
-                st.session_state[f"comment_page_{spot_id}"] = page - 1
-                st.rerun()
+            st.button("◀️ Prev", key=f"prev_page_{spot_id}", on_click=_set_comment_page, args=(page - 1,))
     
     with col3:
         st.markdown(f"<div style='text-align: center; padding-top: 8px;'>Page {page} of {total_pages}</div>", unsafe_allow_html=True)
     
     with col4:
         if page < total_pages:
-            if st.button("Next ▶️", key=f"next_page_{spot_id}"):
-                st.session_state[f"comment_page_{spot_id}"] = page + 1
-                st.rerun()
+            st.button("Next ▶️", key=f"next_page_{spot_id}", on_click=_set_comment_page, args=(page + 1,))
     
     with col5:
         if page < total_pages:
-            if st.button("Last ⏭️", key=f"last_page_{spot_id}"):
-                st.session_state[f"comment_page_{spot_id}"] = total_pages
-                st.rerun()
+            st.button("Last ⏭️", key=f"last_page_{spot_id}", on_click=_set_comment_page, args=(total_pages,))
 
 
 def render_compact_comments(
-    api: TuristandoAPI,
+    api: Optional[TuristandoAPI],
     spot_id: int,
     max_comments: int = 3
 ):
@@ -198,12 +333,15 @@ def render_compact_comments(
     Render a compact comments preview.
     
     Args:
-        api: API client instance.
+        api: API client instance (None uses the shared get_api_client()).
         spot_id: Tourist spot ID.
         max_comments: Maximum number of comments to show.
     """
+    api = api or get_api_client()
+    
     try:
-        response = api.get_spot_comments(
+        response = fetch_spot_comments(
+            api,
             spot_id=spot_id,
             page=1,
             per_page=max_comments,
@@ -221,18 +359,16 @@ def render_compact_comments(
         
         for comment in comments[:max_comments]:
             # Simple comment display
-            usuario = comment.get("usuario", {})
-            username = usuario.get("login", f"User {comment.get('usuarioId')}")
-            texto = comment.get("texto", "")
-            
-            # Truncate long comments
-            if len(texto) > 150:
-                texto = texto[:147] + "..."
+            username = comment["user"]
+            texto = truncate(comment["text"], 150)
             
             st.markdown(f"**{username}**: {texto}")
         
         if total > max_comments:
             st.caption(f"... and {total - max_comments} more")
+            
+            # Warm the full list's first page (default sort)
+            _prefetch_comments(api, spot_id, 1)
         
     except Exception as e:
         st.caption(f"Error loading comments: {e}")
@@ -4,8 +4,141 @@ Export Button Component - Allow admins to export tourist spot data.
 Provides UI for exporting spots in JSON or CSV format.
 """
 
+import io
+import json
 import streamlit as st
+from datetime import datetime
 from typing import Optional
+from services.api_client import error_detail
+
+
+# Download chunk size when streaming an export
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Exports larger than this skip the parsed JSON preview
+PREVIEW_PARSE_LIMIT = 1024 * 1024
+
+# Bytes shown in the raw preview of large or CSV exports
+PREVIEW_BYTES = 1024
+
+# Cached export payloads kept at once (each can be tens of MB)
+EXPORT_CACHE_MAX_ENTRIES = 4
+
+
+class ExportError(Exception):
+    """Raised when the export endpoint answers with a non-200 status."""
+    
+    def __init__(self, status_code: int, detail: str = "Unknown error"):
+        super().__init__(f"Export failed: {status_code}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+@st.cache_data(ttl=300, max_entries=EXPORT_CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_export(
+    _api_client,
+    format: str,
+    cidade: Optional[str] = None,
+    estado: Optional[str] = None,
+    pais: Optional[str] = None,
+    token: Optional[str] = None,
+) -> bytes:
+    """
+    Fetch an export payload, cached for 5 minutes per filter tuple.
+    
+    The client is excluded from the cache key; ``token`` scopes cached
+    exports to the logged-in admin. Failed exports raise ExportError and
+    are therefore never cached. The body is streamed in chunks and kept
+    as raw bytes, so it is never decoded into a Python string. Spot writes
+    call clear_export_cache() so downloads never lag behind the data.
+    
+    Args:
+        _api_client: API client instance.
+        format: Export format ("json" or "csv").
+        cidade: Optional city filter.
+        estado: Optional state filter.
+        pais: Optional country filter.
+        token: Access token of the current user (cache scope only).
+    
+    Returns:
+        Export content as bytes.
+    """
+    params = {"format": format}
+    if cidade:
+        params["cidade"] = cidade
+    if estado:
+        params["estado"] = estado
+    if pais:
+        params["pais"] = pais
+    
+    with _api_client.get("/spots/export", params=params, stream=True) as response:
+        if response.status_code != 200:
+            raise ExportError(response.status_code, error_detail(response))
+        
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=EXPORT_CHUNK_SIZE):
+            buffer.write(chunk)
+    
+    return buffer.getvalue()
+
+
+def clear_export_cache():
+    """Drop cached export payloads after spots are created, edited, deleted or imported."""
+    _fetch_export.clear()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _parse_export_json(export_content: bytes):
+    """Parse a JSON export for preview (cached alongside the payload)."""
+    return json.loads(export_content)
+
+
+def _export_timestamp(slot: str) -> str:
+    """
+    Get the filename timestamp for an export, fixed until it is downloaded.
+    
+    The value lives in session state so reruns between the click and the
+    download reuse the same filename and widget key.
+    
+    Args:
+        slot: Session state key for this export's timestamp
+    
+    Returns:
+        Timestamp formatted as YYYYMMDD_HHMMSS
+    """
+    if slot not in st.session_state:
+        st.session_state[slot] = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return st.session_state[slot]
+
+
+def _clear_export_timestamp(slot: str):
+    """Download callback: release the timestamp so the next export gets a fresh one."""
+    st.session_state.pop(slot, None)
+
+
+def _render_export_preview(export_content: bytes, export_format: str):
+    """
+    Show a preview of an export.
+    
+    Only JSON exports up to PREVIEW_PARSE_LIMIT are parsed; anything
+    larger (and every CSV) shows just the first PREVIEW_BYTES.
+    
+    Args:
+        export_content: Raw export bytes
+        export_format: Export format ("json" or "csv")
+    """
+    with st.expander("👁️ Preview Export Data", expanded=False):
+        if export_format == "json" and len(export_content) <= PREVIEW_PARSE_LIMIT:
+            try:
+                st.json(_parse_export_json(export_content))
+                return
+            except ValueError:
+                pass
+        
+        preview = export_content[:PREVIEW_BYTES].decode("utf-8", errors="replace")
+        if len(export_content) > PREVIEW_BYTES:
+            preview += "..."
+        st.code(preview, language="json" if export_format == "json" else None)
 
 
 def render_export_button(
@@ -47,60 +180,42 @@ def render_export_button(
         if st.button("📥 Export Data", key="export_data_button", use_container_width=container_width):
             with st.spinner(f"Exporting data as {export_format.upper()}..."):
                 try:
-                    # Build query parameters
-                    params = {"format": export_format}
-                    if filter_cidade:
-                        params["cidade"] = filter_cidade
-                    if filter_estado:
-                        params["estado"] = filter_estado
-                    if filter_pais:
-                        params["pais"] = filter_pais
+                    # Fetch export (cached per filter tuple)
+                    export_content = _fetch_export(
+                        api_client,
+                        export_format,
+                        filter_cidade or None,
+                        filter_estado or None,
+                        filter_pais or None,
+                        token=st.session_state.get("token"),
+                    )
                     
-                    # Make export request
-                    response = api_client.get("/spots/export", params=params)
+                    # Generate filename
+                    ts_slot = f"export_ts_{export_format}"
+                    timestamp = _export_timestamp(ts_slot)
+                    filename = f"turistando_spots_{timestamp}.{export_format}"
                     
-                    if response.status_code == 200:
-                        # Get export content
-                        export_content = response.text
-                        
-                        # Generate filename
-                        from datetime import datetime
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"turistando_spots_{timestamp}.{export_format}"
-                        
-                        # Provide download button
-                        st.success("✅ Export completed successfully!")
-                        
-                        st.download_button(
-                            label=f"💾 Download {filename}",
-                            data=export_content,
-                            file_name=filename,
-                            mime="application/json" if export_format == "json" else "text/csv",
-                            use_container_width=True,
-                        )
-                        
-                        # Show preview for JSON
-                        if export_format == "json":
-                            with st.expander("👁️ Preview Export Data", expanded=False):
-                                import json
-                                try:
-                                    data = json.loads(export_content)
-                                    st.json(data)
-                                except:
-                                    st.code(export_content, language="json")
-                        else:
-                            with st.expander("👁️ Preview Export Data", expanded=False):
-                                st.code(export_content[:1000] + "..." if len(export_content) > 1000 else export_content)
+                    # Provide download button
+                    st.success("✅ Export completed successfully!")
                     
-                    elif response.status_code == 403:
+                    st.download_button(
+                        label=f"💾 Download {filename}",
+                        data=export_content,
+                        file_name=filename,
+                        mime="application/json" if export_format == "json" else "text/csv",
+                        use_container_width=True,
+                        on_click=_clear_export_timestamp,
+                        args=(ts_slot,),
+                    )
+                    
+                    _render_export_preview(export_content, export_format)
+                
+                except ExportError as e:
+                    if e.status_code == 403:
                         st.error("❌ Access denied: Admin privileges required.")
                     else:
-                        st.error(f"❌ Export failed: {response.status_code}")
-                        try:
-                            error_detail = response.json().get("detail", "Unknown error")
-                            st.error(f"Details: {error_detail}")
-                        except:
-                            pass
+                        st.error(f"❌ Export failed: {e.status_code}")
+                        st.error(f"Details: {e.detail}")
                             
                 except Exception as e:
                     st.error(f"❌ Error during export: {str(e)}")
@@ -130,25 +245,24 @@ def _perform_export(api_client, format: str):
     """Helper function to perform export."""
     with st.spinner(f"Exporting {format.upper()}..."):
         try:
-            response = api_client.get("/spots/export", params={"format": format})
+            export_content = _fetch_export(api_client, format, token=st.session_state.get("token"))
             
-            if response.status_code == 200:
-                export_content = response.text
-                
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"turistando_spots_{timestamp}.{format}"
-                
-                st.download_button(
-                    label=f"💾 Download {filename}",
-                    data=export_content,
-                    file_name=filename,
-                    mime="application/json" if format == "json" else "text/csv",
-                    use_container_width=True,
-                    key=f"download_{format}_{timestamp}",
-                )
-                st.success(f"✅ {format.upper()} export ready!")
-            else:
-                st.error(f"❌ Export failed: {response.status_code}")
+            ts_slot = f"quick_export_ts_{format}"
+            timestamp = _export_timestamp(ts_slot)
+            filename = f"turistando_spots_{timestamp}.{format}"
+            
+            st.download_button(
+                label=f"💾 Download {filename}",
+                data=export_content,
+                file_name=filename,
+                mime="application/json" if format == "json" else "text/csv",
+                use_container_width=True,
+                key=f"download_{format}_{timestamp}",
+                on_click=_clear_export_timestamp,
+                args=(ts_slot,),
+            )
+            st.success(f"✅ {format.upper()} export ready!")
+        except ExportError as e:
+            st.error(f"❌ Export failed: {e.status_code}")
         except Exception as e:
             st.error(f"❌ Error: {str(e)}")
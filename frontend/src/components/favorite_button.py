@@ -3,8 +3,40 @@ Favorite button component for toggling favorite status.
 """
 
 import streamlit as st
-import requests
-from typing import Optional
+from typing import Dict, List, Optional
+from services.api_client import api_get, api_post, cached_get_my_favorites
+
+
+def _favorite_status_cache() -> dict:
+    """
+    Get this session's favorite status cache (spot_id -> bool).
+    
+    The cache is reset whenever the logged-in token changes, so statuses
+    never leak between users of the same browser session.
+    
+    Returns:
+        Mutable cache dictionary.
+    """
+    token = st.session_state.get("token")
+    cache = st.session_state.get("fav_status")
+    if cache is None or cache.get("token") != token:
+        cache = {"token": token, "spots": {}}
+        st.session_state["fav_status"] = cache
+    return cache["spots"]
+
+
+def set_cached_favorite_status(spot_id: int, is_favorited: bool):
+    """
+    Record a known favorite status after a successful change.
+    
+    Also drops the cached favorites lists so My Favorites refetches.
+    
+    Args:
+        spot_id: Tourist spot ID.
+        is_favorited: New favorite status.
+    """
+    _favorite_status_cache()[spot_id] = is_favorited
+    cached_get_my_favorites.clear()
 
 
 def render_favorite_button(
@@ -23,11 +55,38 @@ def render_favorite_button(
         key_suffix: Suffix for button key to avoid conflicts.
     """
     # Check if user is logged in
-    token = st.session_state.get("token")
-    if not token:
+    if not st.session_state.get("token"):
         st.caption("⭐ Login to favorite")
         return
     
+    _favorite_button_fragment(spot_id, is_favorited, on_toggle_callback, key_suffix)
+
+
+@st.fragment
+def _favorite_button_fragment(
+    spot_id: int,
+    is_favorited: bool,
+    on_toggle_callback: Optional[callable],
+    key_suffix: str
+):
+    """
+    Favorite toggle button, rerun on its own after a toggle.
+    
+    The fragment keeps its original arguments across its reruns, so the
+    current status is read from the session cache (updated by the toggle)
+    and ``is_favorited`` is only the fallback. Without a callback, a
+    toggle reruns just this fragment; with one, the whole page reruns so
+    the callback's effects are shown.
+    
+    Args:
+        spot_id: Tourist spot ID.
+        is_favorited: Favorite status when the page was rendered.
+        on_toggle_callback: Callback function to call after toggle.
+        key_suffix: Suffix for button key to avoid conflicts.
+    """
+    token = st.session_state.get("token")
+    is_favorited = _favorite_status_cache().get(spot_id, is_favorited)
+    
     # Button appearance
     button_text = "❤️ Favorited" if is_favorited else "🤍 Favorite"
     button_type = "secondary" if is_favorited else "primary"
@@ -38,34 +97,29 @@ def render_favorite_button(
         type=button_type,
         use_container_width=True
     ):
-        try:
-            headers = {"Authorization": f"Bearer {token}"}
-            response = requests.post(
-                f"http://localhost:8000/api/spots/{spot_id}/favorite/toggle",
-                headers=headers
-            )
+        ok, result, error = api_post(
+            f"http://localhost:8000/api/spots/{spot_id}/favorite/toggle",
+            token
+        )
+        
+        if ok:
+            action = result.get("action", "updated")
+            set_cached_favorite_status(spot_id, action == "added")
             
-            if response.status_code == 200:
-                result = response.json()
-                action = result.get("action", "updated")
-                
-                if action == "added":
-                    st.success("✅ Added to favorites!")
-                else:
-                    st.info("ℹ️ Removed from favorites")
-                
-                # Call callback if provided
-                if on_toggle_callback:
-                    on_toggle_callback()
-                
-                # Force rerun to update UI
-                st.rerun()
+            if action == "added":
+                st.success("✅ Added to favorites!")
             else:
-                error_detail = response.json().get("detail", "Unknown error")
-                st.error(f"❌ Error: {error_detail}")
-        
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ Connection error: {str(e)}")
+                st.info("ℹ️ Removed from favorites")
+            
+            # Call callback if provided
+            if on_toggle_callback:
+                on_toggle_callback()
+                st.rerun()
+            
+            # Redraw only this button
+            st.rerun(scope="fragment")
+        else:
+            st.error(f"❌ Error: {error}")
 
 
 def render_favorite_icon(is_favorited: bool):
@@ -85,6 +139,9 @@ def check_favorite_status(spot_id: int) -> bool:
     """
     Check if a spot is in user's favorites.
     
+    Results are cached per spot in session state; toggles update the
+    cache, so each spot is fetched at most once per session.
+    
     Args:
         spot_id: Tourist spot ID.
         
@@ -95,28 +152,66 @@ def check_favorite_status(spot_id: int) -> bool:
     if not token:
         return False
     
-    try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            f"http://localhost:8000/api/spots/{spot_id}/favorite/status",
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            return response.json().get("is_favorited", False)
-    except:
-        pass
+    cache = _favorite_status_cache()
+    if spot_id in cache:
+        return cache[spot_id]
+    
+    ok, result, _ = api_get(
+        f"http://localhost:8000/api/spots/{spot_id}/favorite/status",
+        token
+    )
+    if ok:
+        cache[spot_id] = result.get("is_favorited", False)
+        return cache[spot_id]
     
     return False
 
 
-def render_favorite_button_compact(spot_id: int, key_suffix: str = ""):
+def prefetch_favorite_status(spot_ids: List[int]) -> Dict[int, bool]:
+    """
+    Load the favorite status of several spots with one bulk request.
+    
+    Only spots missing from the session cache are requested. Call this
+    once before rendering a list of compact favorite buttons.
+    
+    Args:
+        spot_ids: Tourist spot IDs.
+        
+    Returns:
+        Mapping of spot ID to favorite status (cached entries included).
+    """
+    token = st.session_state.get("token")
+    if not token:
+        return {}
+    
+    cache = _favorite_status_cache()
+    missing = [spot_id for spot_id in spot_ids if spot_id not in cache]
+    if missing:
+        ok, result, _ = api_get(
+            "http://localhost:8000/api/spots/favorites/status",
+            token,
+            params={"ids": ",".join(map(str, missing))}
+        )
+        if ok:
+            for spot_id, is_favorited in result.items():
+                cache[int(spot_id)] = is_favorited
+    
+    return {spot_id: cache[spot_id] for spot_id in spot_ids if spot_id in cache}
+
+
+def render_favorite_button_compact(
+    spot_id: int,
+    key_suffix: str = "",
+    is_favorited: Optional[bool] = None
+):
     """
     Render a compact favorite button that checks status automatically.
     
     Args:
         spot_id: Tourist spot ID.
         key_suffix: Suffix for button key.
+        is_favorited: Known status (e.g. from prefetch_favorite_status);
+            looked up when omitted.
     """
     # Check if user is logged in
     token = st.session_state.get("token")
@@ -124,7 +219,8 @@ def render_favorite_button_compact(spot_id: int, key_suffix: str = ""):
         return
     
     # Check favorite status
-    is_favorited = check_favorite_status(spot_id)
+    if is_favorited is None:
+        is_favorited = check_favorite_status(spot_id)
     
     # Render button
     render_favorite_button(spot_id, is_favorited, key_suffix=key_suffix)
@@ -4,8 +4,289 @@ Import Form Component - Allow admins to import tourist spot data.
 Provides UI for importing spots from JSON or CSV files.
 """
 
+import csv
+import gzip
+import io
+import shutil
+import json
+import math
+import time
+import uuid
 import streamlit as st
-from typing import Optional
+from typing import List, Optional, Tuple
+from services.api_client import cached_list_spots, error_detail
+from components.export_button import clear_export_cache
+
+
+# Files above this size are sent in chunks of this size
+IMPORT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Attempts per chunk before giving up (exponential backoff in between)
+IMPORT_CHUNK_ATTEMPTS = 3
+
+
+# Gzip level for import uploads (the backend inflates gzip files transparently)
+IMPORT_GZIP_LEVEL = 6
+
+
+def _gzip_upload(uploaded_file) -> io.BytesIO:
+    """
+    Gzip an uploaded import file for transfer.
+    
+    CSV/JSON spot data compresses several times over, so the upload
+    (single request or chunks) shrinks accordingly.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file
+    
+    Returns:
+        In-memory gzip file, positioned at the start
+    """
+    compressed = io.BytesIO()
+    uploaded_file.seek(0)
+    with gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=IMPORT_GZIP_LEVEL) as gz:
+        shutil.copyfileobj(uploaded_file, gz)
+    compressed.seek(0)
+    return compressed
+
+
+# Fields every imported spot needs (mirrors the backend validator)
+_REQUIRED_FIELDS = ("nome", "cidade", "estado", "pais", "latitude", "longitude")
+
+# Pre-validation errors listed before the rest are summarized
+_MAX_SHOWN_ERRORS = 20
+
+
+def _validate_spot_fields(spot: dict, label: str) -> List[str]:
+    """
+    Check required fields and coordinate bounds of one record.
+    
+    Args:
+        spot: Record from the file
+        label: Record position used in messages (e.g. "Row 3")
+    
+    Returns:
+        Error messages (empty if valid)
+    """
+    errors = [
+        f"{label}: Missing required field '{field}'"
+        for field in _REQUIRED_FIELDS
+        if spot.get(field) in (None, "")
+    ]
+    for field, limit in (("latitude", 90), ("longitude", 180)):
+        value = spot.get(field)
+        if value in (None, ""):
+            continue
+        try:
+            if not -limit <= float(value) <= limit:
+                errors.append(f"{label}: {field.capitalize()} must be between -{limit} and {limit}")
+        except (TypeError, ValueError):
+            errors.append(f"{label}: Invalid {field} value: {value}")
+    return errors
+
+
+def _validate_csv(uploaded_file) -> Tuple[List[str], int]:
+    """
+    Pre-validate a CSV import file row by row, before uploading it.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file
+    
+    Returns:
+        Tuple of (error messages, number of valid rows)
+    """
+    uploaded_file.seek(0)
+    text = io.TextIOWrapper(uploaded_file, encoding="utf-8", newline="")
+    try:
+        reader = csv.DictReader(text)
+        missing = [f for f in _REQUIRED_FIELDS if f not in (reader.fieldnames or ())]
+        if missing:
+            return [f"Missing required columns: {', '.join(missing)}"], 0
+        
+        errors = []
+        valid = 0
+        for row in reader:
+            row_errors = _validate_spot_fields(row, f"Row {reader.line_num}")
+            errors.extend(row_errors)
+            valid += not row_errors
+        return errors, valid
+    except (UnicodeDecodeError, csv.Error) as e:
+        return [f"Error parsing CSV: {e}"], 0
+    finally:
+        # Keep the uploaded file open for the upload itself
+        text.detach()
+        uploaded_file.seek(0)
+
+
+def _validate_json(uploaded_file) -> Tuple[List[str], int]:
+    """
+    Pre-validate a JSON import file before uploading it.
+    
+    Accepts the same structures as the backend: a list of spots, an object
+    with "data" or "spots", or a single spot object.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file
+    
+    Returns:
+        Tuple of (error messages, number of valid records)
+    """
+    uploaded_file.seek(0)
+    try:
+        data = json.load(uploaded_file)
+    except ValueError as e:
+        return [f"Invalid JSON format: {e}"], 0
+    finally:
+        uploaded_file.seek(0)
+    
+    if isinstance(data, dict):
+        data = data.get("data", data.get("spots", [data]))
+    if not isinstance(data, list):
+        return ["Invalid JSON structure: expected list or object"], 0
+    
+    errors = []
+    valid = 0
+    for idx, spot in enumerate(data):
+        if not isinstance(spot, dict):
+            errors.append(f"Record {idx + 1}: Expected an object")
+            continue
+        spot_errors = _validate_spot_fields(spot, f"Record {idx + 1}")
+        errors.extend(spot_errors)
+        valid += not spot_errors
+    return errors, valid
+
+
+# Format requirements shown in the help expander
+_JSON_HELP_MD = """
+**JSON Format:**
+```json
+{
+  "data": [
+    {
+      "nome": "Spot Name",
+      "descricao": "Description",
+      "cidade": "City",
+      "estado": "State",
+      "pais": "Country",
+      "latitude": -23.5505,
+      "longitude": -46.6333,
+      "endereco": "Address (optional)"
+    }
+  ]
+}
+```
+
+**Required Fields:**
+- nome (max 200 chars)
+- cidade, estado, pais
+- latitude (-90 to 90)
+- longitude (-180 to 180)
+
+**Optional Fields:**
+- descricao (max 2000 chars)
+- endereco
+"""
+
+_CSV_HELP_MD = """
+**CSV Format:**
+```
+nome,descricao,cidade,estado,pais,latitude,longitude,endereco
+"Spot Name","Description","City","State","Country",-23.5505,-46.6333,"Address"
+```
+
+**Required Columns:**
+- nome (max 200 chars)
+- cidade, estado, pais
+- latitude (-90 to 90)
+- longitude (-180 to 180)
+
+**Optional Columns:**
+- descricao (max 2000 chars)
+- endereco
+
+**Note:** Use quotes for fields containing commas.
+"""
+
+
+# Downloadable example files, encoded once at import time
+_JSON_EXAMPLE_BYTES = """{
+  "data": [
+    {
+      "nome": "Cristo Redentor",
+      "descricao": "Icônica estátua Art Déco de Jesus Cristo no topo do Morro do Corcovado",
+      "cidade": "Rio de Janeiro",
+      "estado": "RJ",
+      "pais": "Brasil",
+      "latitude": -22.9519,
+      "longitude": -43.2105,
+      "endereco": "Parque Nacional da Tijuca"
+    },
+    {
+      "nome": "Museu do Amanhã",
+      "descricao": "Museu de ciências na Praça Mauá",
+      "cidade": "Rio de Janeiro",
+      "estado": "RJ",
+      "pais": "Brasil",
+      "latitude": -22.8941,
+      "longitude": -43.1802,
+      "endereco": "Praça Mauá, 1"
+    }
+  ]
+}""".encode("utf-8")
+
+_CSV_EXAMPLE_BYTES = """nome,descricao,cidade,estado,pais,latitude,longitude,endereco
+"Cristo Redentor","Icônica estátua Art Déco de Jesus Cristo no topo do Morro do Corcovado","Rio de Janeiro","RJ","Brasil",-22.9519,-43.2105,"Parque Nacional da Tijuca"
+"Museu do Amanhã","Museu de ciências na Praça Mauá","Rio de Janeiro","RJ","Brasil",-22.8941,-43.1802,"Praça Mauá, 1"
+""".encode("utf-8")
+
+
+def _upload_in_chunks(api_client, payload, import_format: str):
+    """
+    Upload a large import file in chunks, then commit it.
+    
+    Each chunk is retried with exponential backoff; the server stores
+    chunks by index, so a retry just replaces the failed one.
+    
+    Args:
+        api_client: API client instance
+        payload: Binary file to send (the gzipped upload)
+        import_format: Import format ("json" or "csv")
+    
+    Returns:
+        Response of the commit request (or of the failed chunk)
+    """
+    upload_id = uuid.uuid4().hex
+    total_chunks = math.ceil(payload.getbuffer().nbytes / IMPORT_CHUNK_SIZE)
+    progress_bar = st.progress(0, text="Uploading...")
+    
+    payload.seek(0)
+    for index in range(total_chunks):
+        chunk = payload.read(IMPORT_CHUNK_SIZE)
+        for attempt in range(IMPORT_CHUNK_ATTEMPTS):
+            try:
+                response = api_client.post(
+                    f"/spots/import/chunks/{upload_id}/{index}",
+                    data=chunk,
+                    headers={"Content-Type": "application/octet-stream"},
+                )
+                if response.status_code < 500:
+                    break
+            except Exception:
+                if attempt == IMPORT_CHUNK_ATTEMPTS - 1:
+                    raise
+            if attempt < IMPORT_CHUNK_ATTEMPTS - 1:
+                time.sleep(0.5 * 2 ** attempt)
+        
+        if response.status_code != 200:
+            progress_bar.empty()
+            return response
+        progress_bar.progress((index + 1) / total_chunks, text=f"Uploaded chunk {index + 1}/{total_chunks}")
+    
+    progress_bar.empty()
+    return api_client.post(
+        f"/spots/import/{upload_id}/commit",
+        params={"format": import_format, "total_chunks": total_chunks},
+    )
 
 
 def render_import_form(api_client):
@@ -36,72 +317,43 @@ def render_import_form(api_client):
         
         # Show format requirements
         with st.expander("📋 Format Requirements", expanded=False):
-            if import_format == "json":
-                st.markdown("""
-                **JSON Format:**
-                ```json
-                {
-                  "data": [
-                    {
-                      "nome": "Spot Name",
-                      "descricao": "Description",
-                      "cidade": "City",
-                      "estado": "State",
-                      "pais": "Country",
-                      "latitude": -23.5505,
-                      "longitude": -46.6333,
-                      "endereco": "Address (optional)"
-                    }
-                  ]
-                }
-                ```
-                
-                **Required Fields:**
-                - nome (max 200 chars)
-                - cidade, estado, pais
-                - latitude (-90 to 90)
-                - longitude (-180 to 180)
-                
-                **Optional Fields:**
-                - descricao (max 2000 chars)
-                - endereco
-                """)
-            else:  # csv
-                st.markdown("""
-                **CSV Format:**
-                ```
-                nome,descricao,cidade,estado,pais,latitude,longitude,endereco
-                "Spot Name","Description","City","State","Country",-23.5505,-46.6333,"Address"
-                ```
-                
-                **Required Columns:**
-                - nome (max 200 chars)
-                - cidade, estado, pais
-                - latitude (-90 to 90)
-                - longitude (-180 to 180)
-                
-                **Optional Columns:**
-                - descricao (max 2000 chars)
-                - endereco
-                
-                **Note:** Use quotes for fields containing commas.
-                """)
+            st.markdown(_JSON_HELP_MD if import_format == "json" else _CSV_HELP_MD)
         
         # Import button
         if uploaded_file is not None:
             if st.button("📤 Import Data", key="import_data_button", use_container_width=True):
+                # Validate locally first; files with nothing importable never hit the API
+                validate = _validate_json if import_format == "json" else _validate_csv
+                precheck_errors, valid_count = validate(uploaded_file)
+                if precheck_errors:
+                    report = st.error if valid_count == 0 else st.warning
+                    report(f"⚠️ {len(precheck_errors)} problem(s) found in the file:")
+                    for error in precheck_errors[:_MAX_SHOWN_ERRORS]:
+                        st.caption(error)
+                    if len(precheck_errors) > _MAX_SHOWN_ERRORS:
+                        st.caption(f"... and {len(precheck_errors) - _MAX_SHOWN_ERRORS} more")
+                if valid_count == 0:
+                    if not precheck_errors:
+                        st.error("❌ The file contains no records to import.")
+                    return
+                
                 with st.spinner(f"Importing data from {import_format.upper()}..."):
                     try:
-                        # Read file content
-                        content = uploaded_file.read().decode("utf-8")
-                        
-                        # Make import request
-                        response = api_client.post(
-                            "/spots/import",
-                            params={"format": import_format, "content": content},
-                        )
+                        payload = _gzip_upload(uploaded_file)
+                        if payload.getbuffer().nbytes > IMPORT_CHUNK_SIZE:
+                            # Large files: resumable chunked upload
+                            response = _upload_in_chunks(api_client, payload, import_format)
+                        else:
+                            # Upload the file as multipart instead of a query string
+                            response = api_client.post(
+                                "/spots/import",
+                                params={"format": import_format},
+                                files={"file": (f"{uploaded_file.name}.gz", payload, "application/gzip")},
+                            )
                         
                         if response.status_code == 200:
+                            cached_list_spots.clear()
+                            clear_export_cache()
                             result = response.json()
                             summary = result.get("summary", {})
                             imported_spots = result.get("imported_spots", [])
@@ -137,11 +389,7 @@ def render_import_form(api_client):
                             st.error("❌ Access denied: Admin privileges required.")
                         else:
                             st.error(f"❌ Import failed: {response.status_code}")
-                            try:
-                                error_detail = response.json().get("detail", "Unknown error")
-                                st.error(f"Details: {error_detail}")
-                            except:
-                                pass
+                            st.error(f"Details: {error_detail(response)}")
                                 
                     except Exception as e:
                         st.error(f"❌ Error during import: {str(e)}")
@@ -160,33 +408,9 @@ def render_import_examples():
     
     # JSON example
     with col1:
-        json_example = """{
-  "data": [
-    {
-      "nome": "Cristo Redentor",
-      "descricao": "Icônica estátua Art Déco de Jesus Cristo no topo do Morro do Corcovado",
-      "cidade": "Rio de Janeiro",
-      "estado": "RJ",
-      "pais": "Brasil",
-      "latitude": -22.9519,
-      "longitude": -43.2105,
-      "endereco": "Parque Nacional da Tijuca"
-    },
-    {
-      "nome": "Museu do Amanhã",
-      "descricao": "Museu de ciências na Praça Mauá",
-      "cidade": "Rio de Janeiro",
-      "estado": "RJ",
-      "pais": "Brasil",
-      "latitude": -22.8941,
-      "longitude": -43.1802,
-      "endereco": "Praça Mauá, 1"
-    }
-  ]
-}"""
         st.download_button(
             label="📄 Download JSON Example",
-            data=json_example,
+            data=_JSON_EXAMPLE_BYTES,
             file_name="example_import.json",
             mime="application/json",
             use_container_width=True,
@@ -194,13 +418,9 @@ def render_import_examples():
     
     # CSV example
     with col2:
-        csv_example = """nome,descricao,cidade,estado,pais,latitude,longitude,endereco
-"Cristo Redentor","Icônica estátua Art Déco de Jesus Cristo no topo do Morro do Corcovado","Rio de Janeiro","RJ","Brasil",-22.9519,-43.2105,"Parque Nacional da Tijuca"
-"Museu do Amanhã","Museu de ciências na Praça Mauá","Rio de Janeiro","RJ","Brasil",-22.8941,-43.1802,"Praça Mauá, 1"
-"""
         st.download_button(
             label="📄 Download CSV Example",
-            data=csv_example,
+            data=_CSV_EXAMPLE_BYTES,
             file_name="example_import.csv",
             mime="text/csv",
             use_container_width=True,
@@ -8,15 +8,15 @@ import streamlit as st
 from typing import Optional
 
 
-def show_loading_spinner(message: str = "Loading..."):
-    """
-    Display a loading spinner with message.
-    
-    Args:
-        message: Loading message to display
-    """
-    with st.spinner(message):
-        pass
+# One skeleton card (title, caption line, empty progress bar, divider)
+_SKELETON_CARD_HTML = (
+    "<div>"
+    "<h3>⬜ Loading...</h3>"
+    "<p style='opacity: 0.6; font-size: 0.875rem;'>⬜⬜⬜⬜⬜⬜⬜⬜</p>"
+    "<div style='height: 0.5rem; border-radius: 0.25rem; background: rgba(151, 166, 195, 0.25);'></div>"
+    "<hr>"
+    "</div>"
+)
 
 
 def show_loading_placeholder(message: str = "Loading data..."):
@@ -36,12 +36,8 @@ def show_skeleton_card(count: int = 1):
     Args:
         count: Number of skeleton cards to show
     """
-    for _ in range(count):
-        with st.container():
-            st.markdown("### ⬜ Loading...")
-            st.caption("⬜⬜⬜⬜⬜⬜⬜⬜")
-            st.progress(0.0)
-            st.divider()
+    # All cards go out as a single markdown element instead of 4 per card
+    st.markdown(_SKELETON_CARD_HTML * count, unsafe_allow_html=True)
 
 
 def show_data_loading(data_type: str = "data"):
@@ -8,6 +8,53 @@ import streamlit as st
 from typing import Optional, Dict, Any
 
 
+_MAPS_URL = "https://www.google.com/maps/search/?api=1&query={},{}"
+
+# Distance badge captions: under 1 km, under 10 km, farther
+_METERS_FORMAT = "📏 {:.0f} meters away"
+_NEAR_KM_FORMAT = "📏 {:.1f} km away"
+_FAR_KM_FORMAT = "📏 {:.0f} km away"
+
+
+class DirectionsError(Exception):
+    """Raised when the directions endpoint answers with a non-200 status."""
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"Failed to fetch directions: {status_code}")
+        self.status_code = status_code
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_directions(
+    _api_client,
+    spot_id: int,
+    user_location: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch directions for a spot, cached for 5 minutes.
+    
+    Keyed by spot_id and user_location; the client is excluded from the
+    key. Failures raise DirectionsError and are therefore not cached.
+    
+    Args:
+        _api_client: API client instance
+        spot_id: ID of the tourist spot
+        user_location: Optional tuple of (latitude, longitude)
+    
+    Returns:
+        Directions payload
+    """
+    params = {}
+    if user_location:
+        params["from_latitude"] = user_location[0]
+        params["from_longitude"] = user_location[1]
+    
+    response = _api_client.get(f"/spots/{spot_id}/directions", params=params)
+    if response.status_code != 200:
+        raise DirectionsError(response.status_code)
+    return response.json()
+
+
 def display_directions(
     spot_id: int,
     spot_name: str,
@@ -27,65 +74,58 @@ def display_directions(
     
     # Fetch directions information
     try:
-        params = {}
-        if user_location:
-            params["from_latitude"] = user_location[0]
-            params["from_longitude"] = user_location[1]
+        directions = _fetch_directions(
+            api_client, spot_id, tuple(user_location) if user_location else None
+        )
         
-        response = api_client.get(f"/spots/{spot_id}/directions", params=params)
+        # Display coordinates
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric(
+                "Latitude", 
+                f"{directions['coordinates']['latitude']:.6f}"
+            )
+        with col2:
+            st.metric(
+                "Longitude", 
+                f"{directions['coordinates']['longitude']:.6f}"
+            )
         
-        if response.status_code == 200:
-            directions = response.json()
-            
-            # Display coordinates
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric(
-                    "Latitude", 
-                    f"{directions['coordinates']['latitude']:.6f}"
-                )
-            with col2:
-                st.metric(
-                    "Longitude", 
-                    f"{directions['coordinates']['longitude']:.6f}"
-                )
-            
-            # Display address
-            location = directions["location"]
-            st.write("**Address:**")
-            st.write(f"{location['address']}")
-            st.write(f"{location['city']}, {location['state']}, {location['country']}")
-            
-            # Display distance if calculated
-            if "distance" in directions:
-                st.info(f"📏 Distance from your location: **{directions['distance']['text']}**")
-            
-            # Google Maps links
-            st.write("---")
-            st.write("**🗺️ Open in Maps:**")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.link_button(
-                    "View Location",
-                    directions["googleMapsUrl"],
-                    use_container_width=True,
-                )
-            with col2:
-                st.link_button(
-                    "Get Directions",
-                    directions["googleMapsDirectionsUrl"],
-                    use_container_width=True,
-                )
-            
-            # Text directions
-            with st.expander("📝 Text Directions", expanded=False):
-                for i, instruction in enumerate(directions["textDirections"], 1):
-                    st.write(f"{i}. {instruction}")
-                    
-        else:
-            st.error(f"Failed to fetch directions: {response.status_code}")
-            
+        # Display address
+        location = directions["location"]
+        st.write("**Address:**")
+        st.write(f"{location['address']}")
+        st.write(f"{location['city']}, {location['state']}, {location['country']}")
+        
+        # Display distance if calculated
+        if "distance" in directions:
+            st.info(f"📏 Distance from your location: **{directions['distance']['text']}**")
+        
+        # Google Maps links
+        st.write("---")
+        st.write("**🗺️ Open in Maps:**")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.link_button(
+                "View Location",
+                directions["googleMapsUrl"],
+                use_container_width=True,
+            )
+        with col2:
+            st.link_button(
+                "Get Directions",
+                directions["googleMapsDirectionsUrl"],
+                use_container_width=True,
+            )
+        
+        # Text directions
+        with st.expander("📝 Text Directions", expanded=False):
+            for i, instruction in enumerate(directions["textDirections"], 1):
+                st.write(f"{i}. {instruction}")
+    
+    except DirectionsError as e:
+        st.error(str(e))
     except Exception as e:
         st.error(f"Error loading directions: {str(e)}")
 
@@ -99,15 +139,8 @@ def display_map_with_marker(latitude: float, longitude: float, spot_name: str):
         longitude: Spot longitude
         spot_name: Name of the spot for tooltip
     """
-    import pandas as pd
-    
-    # Create dataframe for map
-    map_data = pd.DataFrame({
-        'lat': [latitude],
-        'lon': [longitude],
-    })
-    
-    st.map(map_data, zoom=13)
+    # st.map accepts a plain column mapping; no DataFrame needed
+    st.map({"lat": [latitude], "lon": [longitude]}, zoom=13)
 
 
 def get_user_location_input() -> Optional[tuple]:
@@ -146,6 +179,7 @@ def get_user_location_input() -> Optional[tuple]:
     return None
 
 
+@st.fragment
 def display_directions_card(
     spot_id: int,
     spot_name: str,
@@ -156,6 +190,9 @@ def display_directions_card(
     """
     Display a compact directions card with expand option.
     
+    Runs as a fragment: editing the location inputs or calculating the
+    distance reruns only this card, not the whole page.
+    
     Args:
         spot_id: ID of the tourist spot
         spot_name: Name of the spot
@@ -193,7 +230,7 @@ def display_compact_map_link(
         longitude: Spot longitude
         spot_name: Name for the tooltip
     """
-    maps_url = f"https://www.google.com/maps/search/?api=1&query={latitude},{longitude}"
+    maps_url = _MAPS_URL.format(latitude, longitude)
     st.markdown(
         f"📍 [View **{spot_name}** on Google Maps]({maps_url})",
         unsafe_allow_html=False,
@@ -208,8 +245,8 @@ def display_distance_badge(distance_km: float):
         distance_km: Distance in kilometers
     """
     if distance_km < 1:
-        st.caption(f"📏 {distance_km * 1000:.0f} meters away")
+        st.caption(_METERS_FORMAT.format(distance_km * 1000))
     elif distance_km < 10:
-        st.caption(f"📏 {distance_km:.1f} km away")
+        st.caption(_NEAR_KM_FORMAT.format(distance_km))
     else:
-        st.caption(f"📏 {distance_km:.0f} km away")
+        st.caption(_FAR_KM_FORMAT.format(distance_km))
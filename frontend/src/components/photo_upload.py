@@ -5,9 +5,15 @@ Provides UI for uploading and managing photos (admin only).
 """
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
-from services.api_client import TuristandoAPI
-import base64
+from services.api_client import TuristandoAPI, api_delete, api_post, cached_get_spot_bundle, get_http_session
+
+# Maximum photo size accepted by the API
+MAX_PHOTO_BYTES = 5 * 1024 * 1024
+
+# Concurrent uploads in a batch
+BATCH_UPLOAD_WORKERS = 6
 
 
 def render_photo_upload(
@@ -43,16 +49,17 @@ def render_photo_upload(
             placeholder="e.g., Sunset view from the top"
         )
         
-        # Preview
+        # Preview (size is checked first so oversize files are never read)
         if uploaded_file:
-            st.image(uploaded_file, caption="Preview", use_column_width=True)
-            
-            # File info
             file_size_mb = uploaded_file.size / (1024 * 1024)
-            st.caption(f"File: {uploaded_file.name} ({file_size_mb:.2f} MB)")
             
-            if file_size_mb > 5:
+            if uploaded_file.size > MAX_PHOTO_BYTES:
                 st.warning("⚠️ File size exceeds 5MB limit")
+            else:
+                st.image(uploaded_file, caption="Preview", use_column_width=True)
+            
+            # File info
+            st.caption(f"File: {uploaded_file.name} ({file_size_mb:.2f} MB)")
         
         # Submit button
         submitted = st.form_submit_button("📤 Upload Photo", use_container_width=True, type="primary")
@@ -63,53 +70,70 @@ def render_photo_upload(
                 return False
             
             # Check file size
-            if uploaded_file.size > 5 * 1024 * 1024:
+            if uploaded_file.size > MAX_PHOTO_BYTES:
                 st.error("❌ File size exceeds 5MB limit")
                 return False
             
-            try:
-                # Upload photo using multipart/form-data
-                import requests
-                
-                files = {
-                    "file": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)
-                }
-                
-                data = {}
-                if titulo:
-                    data["titulo"] = titulo
-                
-                response = requests.post(
-                    f"{api.base_url}{api.api_prefix}/spots/{spot_id}/photos",
-                    files=files,
-                    data=data,
-                    headers={"Authorization": f"Bearer {token}"}
-                )
-                response.raise_for_status()
-                
+            # Upload photo using multipart/form-data
+            # Hand requests the upload buffer itself instead of a bytes copy
+            uploaded_file.seek(0)
+            files = {
+                "file": (uploaded_file.name, uploaded_file, uploaded_file.type)
+            }
+            
+            data = {}
+            if titulo:
+                data["titulo"] = titulo
+            
+            ok, _, error_msg = api_post(
+                f"{api.base_url}{api.api_prefix}/spots/{spot_id}/photos",
+                token,
+                files=files,
+                data=data
+            )
+            
+            if ok:
+                fetch_spot_photos.clear()
+                cached_get_spot_bundle.clear()
                 st.success("✅ Photo uploaded successfully!")
                 st.balloons()
                 return True
-                
-            except Exception as e:
-                error_msg = str(e)
-                
-                if "403" in error_msg:
-                    st.error("❌ Admin access required")
-                elif "401" in error_msg:
-                    st.error("❌ Authentication error. Please login again.")
-                elif "404" in error_msg:
-                    st.error("❌ Tourist spot not found")
-                elif "400" in error_msg:
-                    st.error("❌ Invalid file format or data")
-                else:
-                    st.error(f"❌ Error uploading photo: {error_msg}")
-                
-                return False
+            
+            if "403" in error_msg:
+                st.error("❌ Admin access required")
+            elif "401" in error_msg:
+                st.error("❌ Authentication error. Please login again.")
+            elif "404" in error_msg:
+                st.error("❌ Tourist spot not found")
+            elif "400" in error_msg:
+                st.error("❌ Invalid file format or data")
+            else:
+                st.error(f"❌ Error uploading photo: {error_msg}")
+            
+            return False
     
     return False
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_spot_photos(_api: TuristandoAPI, spot_id: int) -> list:
+    """
+    Fetch a spot's photo metadata, cached for 60 seconds per spot.
+    
+    The API client is excluded from the cache key (leading underscore).
+    Call ``fetch_spot_photos.clear()`` after uploading or deleting photos.
+    
+    Args:
+        _api: API client instance.
+        spot_id: Tourist spot ID.
+    
+    Returns:
+        List of photo metadata.
+    """
+    return _api.get_spot_photos(spot_id)
+
+
+@st.fragment
 def render_photo_gallery_manager(
     api: TuristandoAPI,
     spot_id: int,
@@ -118,6 +142,8 @@ def render_photo_gallery_manager(
     """
     Render photo gallery with delete functionality.
     
+    Runs as a fragment, so deleting a photo only redraws the gallery.
+    
     Args:
         api: API client instance.
         spot_id: Tourist spot ID.
@@ -127,7 +153,7 @@ def render_photo_gallery_manager(
     
     try:
         # Fetch photos
-        photos = api.get_spot_photos(spot_id)
+        photos = fetch_spot_photos(api, spot_id)
         
         if not photos:
             st.info("No photos yet. Upload the first one!")
@@ -161,22 +187,37 @@ def render_photo_gallery_manager(
                             key=f"delete_photo_{photo['id']}",
                             use_container_width=True
                         ):
-                            try:
-                                import requests
-                                response = requests.delete(
-                                    f"{api.base_url}{api.api_prefix}/photos/{photo['id']}",
-                                    headers={"Authorization": f"Bearer {token}"}
-                                )
-                                response.raise_for_status()
-                                st.success("Photo deleted!")
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Error: {e}")
+                            ok, _, error = api_delete(
+                                f"{api.base_url}{api.api_prefix}/photos/{photo['id']}",
+                                token
+                            )
+                            if ok:
+                                fetch_spot_photos.clear()
+                                cached_get_spot_bundle.clear()
+                                st.rerun(scope="fragment")
+                            st.error(f"Error: {error}")
         
     except Exception as e:
         st.error(f"❌ Error loading photos: {e}")
 
 
+def _upload_one(session, url: str, token: str, photo: tuple) -> tuple:
+    """
+    Upload one photo (runs in a batch upload worker thread).
+    
+    Args:
+        session: Shared HTTP session.
+        url: Photo upload endpoint.
+        token: Admin authentication token.
+        photo: (name, file object, mime type) tuple.
+    
+    Returns:
+        (name, ok, error) tuple.
+    """
+    ok, _, error = api_post(url, token, session=session, files={"file": photo})
+    return photo[0], ok, error
+
+
 def render_batch_upload(
     api: TuristandoAPI,
     spot_id: int,
@@ -207,7 +248,10 @@ def render_batch_upload(
             cols = st.columns(len(uploaded_files))
             for i, (col, file) in enumerate(zip(cols, uploaded_files)):
                 with col:
-                    st.image(file, caption=file.name, use_column_width=True)
+                    if file.size > MAX_PHOTO_BYTES:
+                        st.caption(f"⚠️ {file.name} (too large)")
+                    else:
+                        st.image(file, caption=file.name, use_column_width=True)
         else:
             st.caption("Preview limited to first 5 photos")
         
@@ -219,33 +263,40 @@ def render_batch_upload(
             progress_bar = st.progress(0)
             status_text = st.empty()
             
+            # Filter oversized files before starting any upload
+            to_upload = []
+            for file in uploaded_files:
+                if file.size > MAX_PHOTO_BYTES:
+                    status_text.warning(f"⚠️ Skipped {file.name} (too large)")
+                else:
+                    file.seek(0)
+                    to_upload.append((file.name, file, file.type))
+            
+            url = f"{api.base_url}{api.api_prefix}/spots/{spot_id}/photos"
+            session = get_http_session()
+            
             success_count = 0
-            for i, file in enumerate(uploaded_files):
-                try:
-                    # Check size
-                    if file.size > 5 * 1024 * 1024:
-                        status_text.warning(f"⚠️ Skipped {file.name} (too large)")
-                        continue
+            done = len(uploaded_files) - len(to_upload)
+            with ThreadPoolExecutor(max_workers=BATCH_UPLOAD_WORKERS) as executor:
+                futures = [
+                    executor.submit(_upload_one, session, url, token, photo)
+                    for photo in to_upload
+                ]
+                for future in as_completed(futures):
+                    name, ok, error = future.result()
+                    if ok:
+                        success_count += 1
+                        status_text.success(f"✅ Uploaded {name}")
+                    else:
+                        status_text.error(f"❌ Failed {name}: {error}")
                     
-                    # Upload
-                    import requests
-                    files = {"file": (file.name, file.getvalue(), file.type)}
-                    
-                    response = requests.post(
-                        f"{api.base_url}{api.api_prefix}/spots/{spot_id}/photos",
-                        files=files,
-                        headers={"Authorization": f"Bearer {token}"}
-                    )
-                    response.raise_for_status()
-                    
-                    success_count += 1
-                    status_text.success(f"✅ Uploaded {file.name}")
-                    
-                except Exception as e:
-                    status_text.error(f"❌ Failed {file.name}: {e}")
-                
-                # Update progress
-                progress_bar.progress((i + 1) / len(uploaded_files))
+                    # Update progress
+                    done += 1
+                    progress_bar.progress(done / len(uploaded_files))
+            
+            if success_count > 0:
+                fetch_spot_photos.clear()
+                cached_get_spot_bundle.clear()
             
             st.success(f"✅ Successfully uploaded {success_count}/{len(uploaded_files)} photos!")
             
@@ -4,11 +4,31 @@ Rating submission form component.
 Provides UI for submitting and editing ratings for tourist spots.
 """
 
+import requests
 import streamlit as st
+from functools import lru_cache
 from typing import Optional
+from datetime import datetime
 from services.api_client import TuristandoAPI
 
 
+# Star strings indexed by rating 0-5: filled + empty stars, and filled only
+RATING_STARS = tuple("⭐" * n + "☆" * (5 - n) for n in range(6))
+FILLED_STARS = tuple("⭐" * n for n in range(6))
+
+# Opt-in balloons animation after a new rating (never shown on edits)
+SHOW_CELEBRATION = False
+
+_AUTH_MESSAGE = "❌ Authentication error. Please login again."
+_RATING_ERROR_MESSAGES = {
+    409: "❌ You have already rated this spot. Please edit your existing rating.",
+    404: "❌ Tourist spot not found.",
+    401: _AUTH_MESSAGE,
+    403: _AUTH_MESSAGE,
+    400: "❌ Invalid input. Please check your rating and comment.",
+}
+
+
 def render_rating_form(
     api: TuristandoAPI,
     spot_id: int,
@@ -49,7 +69,7 @@ def render_rating_form(
         )
         
         # Display star visualization
-        star_display = "⭐" * nota + "☆" * (5 - nota)
+        star_display = RATING_STARS[nota]
         st.markdown(f"### {star_display}")
         
         # Optional comment
@@ -89,29 +109,62 @@ def render_rating_form(
                     )
                     st.success("✅ Rating submitted successfully!")
                 
-                st.balloons()
+                if SHOW_CELEBRATION and not is_edit:
+                    st.balloons()
                 return True
                 
+            except requests.HTTPError as e:
+                message = _RATING_ERROR_MESSAGES.get(e.response.status_code)
+                st.error(message or f"❌ Error submitting rating: {e}")
+                return False
             except Exception as e:
-                error_msg = str(e)
-                
-                # Handle specific error cases
-                if "409" in error_msg or "already rated" in error_msg.lower():
-                    st.error("❌ You have already rated this spot. Please edit your existing rating.")
-                elif "404" in error_msg:
-                    st.error("❌ Tourist spot not found.")
-                elif "401" in error_msg or "403" in error_msg:
-                    st.error("❌ Authentication error. Please login again.")
-                elif "400" in error_msg:
-                    st.error("❌ Invalid input. Please check your rating and comment.")
-                else:
-                    st.error(f"❌ Error submitting rating: {error_msg}")
-                
+                st.error(f"❌ Error submitting rating: {e}")
                 return False
     
     return False
 
 
+@lru_cache(maxsize=1024)
+def format_rating_date(created_at: str) -> Optional[str]:
+    """
+    Format a rating ISO timestamp for display, memoized per raw string.
+    
+    Args:
+        created_at: ISO 8601 timestamp (may end with "Z").
+    
+    Returns:
+        Formatted date, or None if it cannot be parsed.
+    """
+    try:
+        if created_at.endswith("Z"):
+            created_at = created_at[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(created_at)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return parsed.strftime("%b %d, %Y")
+
+
+@lru_cache(maxsize=1024)
+def _format_rating_row(nota: int, usuario_id: int, created_at: Optional[str]) -> tuple:
+    """
+    Build the display strings of a rating card, memoized per rating.
+    
+    Args:
+        nota: Rating value (1-5).
+        usuario_id: Author's user ID.
+        created_at: ISO 8601 creation timestamp.
+    
+    Returns:
+        Tuple of (stars line, user caption, date caption).
+    """
+    date_str = format_rating_date(created_at)
+    return (
+        f"**{RATING_STARS[nota]}** ({nota}/5)",
+        f"User ID: {usuario_id}",
+        f"Posted: {date_str}" if date_str else "Posted recently",
+    )
+
+
 def render_rating_display(rating: dict):
     """
     Display a single rating in a card format.
@@ -119,12 +172,15 @@ def render_rating_display(rating: dict):
     Args:
         rating: Rating data dictionary.
     """
+    stars_line, user_caption, date_caption = _format_rating_row(
+        rating["nota"], rating["usuario_id"], rating.get("created_at")
+    )
+    
     col1, col2 = st.columns([3, 1])
     
     with col1:
         # Star display
-        stars = "⭐" * rating["nota"] + "☆" * (5 - rating["nota"])
-        st.markdown(f"**{stars}** ({rating['nota']}/5)")
+        st.markdown(stars_line)
         
         # Comment (if exists)
         if rating.get("comentario"):
@@ -134,20 +190,34 @@ def render_rating_display(rating: dict):
     
     with col2:
         # User and date
-        st.caption(f"User ID: {rating['usuario_id']}")
-        
-        # Format date
-        from datetime import datetime
-        try:
-            created_at = datetime.fromisoformat(rating["created_at"].replace("Z", "+00:00"))
-            date_str = created_at.strftime("%b %d, %Y")
-            st.caption(f"Posted: {date_str}")
-        except:
-            st.caption("Posted recently")
+        st.caption(user_caption)
+        st.caption(date_caption)
     
     st.divider()
 
 
+# Star labels for the distribution bars, highest first
+_DISTRIBUTION_LABELS = ("5 ⭐", "4 ⭐", "3 ⭐", "2 ⭐", "1 ⭐")
+
+
+@lru_cache(maxsize=256)
+def _distribution_rows(total: int, *counts: int) -> tuple:
+    """
+    Build the distribution bar rows, memoized per set of counts.
+    
+    Args:
+        total: Total number of ratings (> 0).
+        counts: Rating counts for 5 down to 1 stars.
+    
+    Returns:
+        Tuple of (label, count, percentage) rows.
+    """
+    return tuple(
+        (label, count, count / total * 100)
+        for label, count in zip(_DISTRIBUTION_LABELS, counts)
+    )
+
+
 def render_rating_statistics(stats: dict):
     """
     Display rating statistics with distribution chart.
@@ -170,16 +240,15 @@ def render_rating_statistics(stats: dict):
         # Distribution chart
         st.subheader("Rating Distribution")
         
-        # Prepare data for chart
-        distribution_data = {
-            "5 ⭐": stats.get("5", 0),
-            "4 ⭐": stats.get("4", 0),
-            "3 ⭐": stats.get("3", 0),
-            "2 ⭐": stats.get("2", 0),
-            "1 ⭐": stats.get("1", 0),
-        }
+        rows = _distribution_rows(
+            total,
+            stats.get("5", 0),
+            stats.get("4", 0),
+            stats.get("3", 0),
+            stats.get("2", 0),
+            stats.get("1", 0),
+        )
         
         # Display as horizontal bars
-        for label, count in distribution_data.items():
-            percentage = (count / total * 100) if total > 0 else 0
+        for label, count, percentage in rows:
             st.progress(percentage / 100, text=f"{label}: {count} ({percentage:.1f}%)")
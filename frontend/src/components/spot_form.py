@@ -4,10 +4,23 @@ Spot management form component.
 Provides UI for creating and editing tourist spots (admin only).
 """
 
+import requests
 import streamlit as st
 from typing import Optional
 from decimal import Decimal
-from services.api_client import TuristandoAPI
+from services.api_client import TuristandoAPI, cached_get_spot_bundle, cached_list_spots
+from components.export_button import clear_export_cache
+from utils.text import truncate
+
+
+# Opt-in balloons animation after creating a spot (never shown on edits)
+SHOW_CELEBRATION = False
+
+_SPOT_ERROR_MESSAGES = {
+    403: "❌ Admin access required",
+    401: "❌ Authentication error. Please login again.",
+    400: "❌ Invalid input data. Please check all fields.",
+}
 
 
 def render_spot_form(
@@ -160,40 +173,27 @@ def render_spot_form(
                 
                 if is_edit:
                     # Update existing spot
-                    import requests
-                    response = requests.put(
-                        f"{api.base_url}{api.api_prefix}/spots/{spot_data['id']}",
-                        json=spot_payload,
-                        headers={"Authorization": f"Bearer {token}"}
-                    )
-                    response.raise_for_status()
+                    api.update_spot(spot_data['id'], spot_payload, token)
                     st.success("✅ Spot updated successfully!")
                 else:
                     # Create new spot
-                    import requests
-                    response = requests.post(
-                        f"{api.base_url}{api.api_prefix}/spots",
-                        json=spot_payload,
-                        headers={"Authorization": f"Bearer {token}"}
-                    )
-                    response.raise_for_status()
+                    api.create_spot(spot_payload, token)
                     st.success("✅ Spot created successfully!")
                 
-                st.balloons()
+                cached_list_spots.clear()
+                
+                clear_export_cache()
+                cached_get_spot_bundle.clear()
+                if SHOW_CELEBRATION and not is_edit:
+                    st.balloons()
                 return True
                 
+            except requests.HTTPError as e:
+                message = _SPOT_ERROR_MESSAGES.get(e.response.status_code)
+                st.error(message or f"❌ Error saving spot: {e}")
+                return False
             except Exception as e:
-                error_msg = str(e)
-                
-                if "403" in error_msg:
-                    st.error("❌ Admin access required")
-                elif "401" in error_msg:
-                    st.error("❌ Authentication error. Please login again.")
-                elif "400" in error_msg:
-                    st.error("❌ Invalid input data. Please check all fields.")
-                else:
-                    st.error(f"❌ Error saving spot: {error_msg}")
-                
+                st.error(f"❌ Error saving spot: {e}")
                 return False
     
     return False
@@ -214,10 +214,7 @@ def render_quick_spot_preview(spot: dict):
             st.caption(f"📍 {spot['cidade']}, {spot['estado']}, {spot['pais']}")
             
             # Truncate description
-            desc = spot.get('descricao', '')
-            if len(desc) > 100:
-                desc = desc[:97] + "..."
-            st.caption(desc)
+            st.caption(truncate(spot.get('descricao', ''), 100))
         
         with col2:
             # Stats
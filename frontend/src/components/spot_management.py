@@ -6,7 +6,22 @@ Displays list of spots with admin management actions.
 
 import streamlit as st
 from typing import Optional
-from services.api_client import TuristandoAPI
+from services.api_client import TuristandoAPI, cached_get_spot_bundle, cached_list_spots
+from components.export_button import clear_export_cache
+from components.spot_form import render_spot_form
+from utils.text import truncate
+
+
+# Column setup for the management table
+_MANAGEMENT_COLUMNS = {
+    "id": st.column_config.NumberColumn("ID"),
+    "nome": st.column_config.TextColumn("Name"),
+    "cidade": st.column_config.TextColumn("City"),
+    "estado": st.column_config.TextColumn("State"),
+    "pais": st.column_config.TextColumn("Country"),
+    "avg_rating": st.column_config.NumberColumn("Rating", format="%.1f ⭐"),
+    "rating_count": st.column_config.NumberColumn("Reviews"),
+}
 
 
 def render_spot_management_list(
@@ -27,7 +42,8 @@ def render_spot_management_list(
     st.subheader("🗺️ Manage Tourist Spots")
     
     # Filters
-    with st.expander("🔍 Filters", expanded=False):
+    # Form values only change on "Apply", so typing doesn't refetch
+    with st.expander("🔍 Filters", expanded=False), st.form("admin_filters", border=False):
         col1, col2, col3 = st.columns(3)
         
         with col1:
@@ -38,11 +54,13 @@ def render_spot_management_list(
             filter_pais = st.text_input("Country", key="admin_filter_pais")
         
         filter_search = st.text_input("Search in name/description", key="admin_filter_search")
+        st.form_submit_button("Apply")
     
     try:
         # Fetch spots
         skip = (page - 1) * per_page
-        result = api.list_spots(
+        result = cached_list_spots(
+            api,
             skip=skip,
             limit=per_page,
             cidade=filter_cidade if filter_cidade else None,
@@ -61,9 +79,22 @@ def render_spot_management_list(
             st.info("No spots found. Create your first one!")
             return
         
-        # Display spots
-        for spot in spots:
-            render_spot_management_card(api, spot, token)
+        # One table for the page; actions are rendered for the selected row only
+        event = st.dataframe(
+            spots,
+            column_order=("id", "nome", "cidade", "estado", "pais", "avg_rating", "rating_count"),
+            column_config=_MANAGEMENT_COLUMNS,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"admin_spots_table_{page}",
+        )
+        selected_rows = event.selection.rows
+        if selected_rows and selected_rows[0] < len(spots):
+            render_spot_management_card(api, spots[selected_rows[0]], token)
+        else:
+            st.caption("Select a row to view, edit or delete the spot.")
         
         # Pagination
         if total > per_page:
@@ -82,19 +113,21 @@ def render_spot_management_card(api: TuristandoAPI, spot: dict, token: str):
         spot: Spot data dictionary.
         token: Admin authentication token.
     """
+    spot_id = spot['id']
+    nome = spot['nome']
+    confirm_key = f"confirm_delete_{spot_id}"
+    edit_key = f"edit_spot_{spot_id}"
+    
     with st.container():
         col1, col2 = st.columns([3, 1])
         
         with col1:
             # Spot info
-            st.markdown(f"### {spot['nome']}")
+            st.markdown(f"### {nome}")
             st.caption(f"📍 {spot['cidade']}, {spot['estado']}, {spot['pais']}")
             
             # Description preview
-            desc = spot.get('descricao', '')
-            if len(desc) > 150:
-                desc = desc[:147] + "..."
-            st.write(desc)
+            st.write(truncate(spot.get('descricao', ''), 150))
             
             # Stats
             col_a, col_b, col_c = st.columns(3)
@@ -108,67 +141,68 @@ def render_spot_management_card(api: TuristandoAPI, spot: dict, token: str):
                 rating_count = spot.get('rating_count', 0)
                 st.caption(f"{rating_count} reviews")
             with col_c:
-                st.caption(f"ID: {spot['id']}")
+                st.caption(f"ID: {spot_id}")
         
         with col2:
             # Actions
             st.markdown("**Actions**")
             
             # View button
-            if st.button(f"👁️ View", key=f"view_{spot['id']}", use_container_width=True):
-                st.session_state[f"view_spot_{spot['id']}"] = True
+            if st.button(f"👁️ View", key=f"view_{spot_id}", use_container_width=True):
+                st.session_state[f"view_spot_{spot_id}"] = True
             
             # Edit button
-            if st.button(f"✏️ Edit", key=f"edit_{spot['id']}", use_container_width=True):
-                st.session_state[f"edit_spot_{spot['id']}"] = True
+            if st.button(f"✏️ Edit", key=f"edit_{spot_id}", use_container_width=True):
+                st.session_state[edit_key] = True
                 st.rerun()
             
             # Delete button
-            if st.button(f"🗑️ Delete", key=f"delete_{spot['id']}", use_container_width=True):
-                st.session_state[f"confirm_delete_{spot['id']}"] = True
+            if st.button(f"🗑️ Delete", key=f"delete_{spot_id}", use_container_width=True):
+                st.session_state[confirm_key] = True
         
         # Delete confirmation dialog
-        if st.session_state.get(f"confirm_delete_{spot['id']}", False):
+        if st.session_state.get(confirm_key, False):
             with st.expander("⚠️ Confirm Deletion", expanded=True):
-                st.warning(f"Are you sure you want to delete **{spot['nome']}**? This action cannot be undone.")
+                st.warning(f"Are you sure you want to delete **{nome}**? This action cannot be undone.")
                 
                 col_a, col_b = st.columns(2)
                 with col_a:
-                    if st.button("✅ Yes, Delete", key=f"confirm_yes_{spot['id']}", type="primary"):
+                    if st.button("✅ Yes, Delete", key=f"confirm_yes_{spot_id}", type="primary"):
                         try:
-                            import requests
-                            response = requests.delete(
-                                f"{api.base_url}{api.api_prefix}/spots/{spot['id']}",
-                                headers={"Authorization": f"Bearer {token}"}
-                            )
-                            response.raise_for_status()
-                            st.success(f"✅ Spot '{spot['nome']}' deleted successfully!")
-                            del st.session_state[f"confirm_delete_{spot['id']}"]
+                            api.delete_spot(spot_id, token)
+                            cached_list_spots.clear()
+                            clear_export_cache()
+                            cached_get_spot_bundle.clear()
+                            st.success(f"✅ Spot '{nome}' deleted successfully!")
+                            del st.session_state[confirm_key]
                             st.rerun()
                         except Exception as e:
                             st.error(f"❌ Error deleting spot: {e}")
                 
                 with col_b:
-                    if st.button("❌ Cancel", key=f"confirm_no_{spot['id']}"):
-                        del st.session_state[f"confirm_delete_{spot['id']}"]
+                    if st.button("❌ Cancel", key=f"confirm_no_{spot_id}"):
+                        del st.session_state[confirm_key]
                         st.rerun()
         
         # Edit dialog
-        if st.session_state.get(f"edit_spot_{spot['id']}", False):
-            with st.expander(f"✏️ Editing: {spot['nome']}", expanded=True):
-                from components.spot_form import render_spot_form
-                
+        if st.session_state.get(edit_key, False):
+            with st.expander(f"✏️ Editing: {nome}", expanded=True):
                 if render_spot_form(api, token, spot):
-                    del st.session_state[f"edit_spot_{spot['id']}"]
+                    del st.session_state[edit_key]
                     st.rerun()
                 
-                if st.button("Close Editor", key=f"close_edit_{spot['id']}"):
-                    del st.session_state[f"edit_spot_{spot['id']}"]
+                if st.button("Close Editor", key=f"close_edit_{spot_id}"):
+                    del st.session_state[edit_key]
                     st.rerun()
         
         st.divider()
 
 
+def _set_admin_page(page: int):
+    """Button callback: store the management list page."""
+    st.session_state["admin_page"] = page
+
+
 def render_management_pagination(total: int, page: int, per_page: int):
     """
     Render pagination controls for management list.
@@ -183,68 +217,70 @@ def render_management_pagination(total: int, page: int, per_page: int):
     if total_pages <= 1:
         return
     
-    col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
+    has_prev = page > 1
+    has_next = page < total_pages
     
-    with col1:
-        if page > 1:
-            if st.button("⏮️ First", key="admin_first_page"):
-                st.session_state["admin_page"] = 1
-                st.rerun()
+    # Only lay out columns for the buttons that are actually shown
+    widths = [1, 1] * has_prev + [2] + [1, 1] * has_next
+    cols = iter(st.columns(widths))
     
-    with col2:
-        if page > 1:
-            if st.button("◀️ Prev", key="admin_prev_page"):
-                st.session_state["admin_page"] = page - 1
-                st.rerun()
+    if has_prev:
+        with next(cols):
+            st.button("⏮️ First", key="admin_first_page", on_click=_set_admin_page, args=(1,))
+        with next(cols):
+            st.button("◀️ Prev", key="admin_prev_page", on_click=_set_admin_page, args=(page - 1,))
     
-    with col3:
+    with next(cols):
         st.markdown(f"<div style='text-align: center; padding-top: 8px;'>Page {page} of {total_pages}</div>", unsafe_allow_html=True)
     
-    with col4:
-        if page < total_pages:
-            if st.button("Next ▶️", key="admin_next_page"):
-                st.session_state["admin_page"] = page + 1
-                st.rerun()
+    if has_next:
+        with next(cols):
+            st.button("Next ▶️", key="admin_next_page", on_click=_set_admin_page, args=(page + 1,))
+        with next(cols):
+            st.button("Last ⏭️", key="admin_last_page", on_click=_set_admin_page, args=(total_pages,))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_platform_stats(_api: TuristandoAPI, token: str) -> dict:
+    """
+    Fetch platform totals with one request, cached for 5 minutes.
     
-    with col5:
-        if page < total_pages:
-            if st.button("Last ⏭️", key="admin_last_page"):
-                st.session_state["admin_page"] = total_pages
-                st.rerun()
+    Args:
+        _api: API client instance (excluded from the cache key).
+        token: Admin authentication token.
+    
+    Returns:
+        Dict with spots, photos, ratings and comments totals.
+    """
+    return _api.get_platform_stats(token)
 
 
-def render_spot_statistics(api: TuristandoAPI):
+def render_spot_statistics(api: TuristandoAPI, token: str):
     """
     Render overall statistics dashboard.
     
     Args:
         api: API client instance.
+        token: Admin authentication token.
     """
     st.subheader("📊 Platform Statistics")
     
     try:
-        # Fetch total spots
-        result = api.list_spots(skip=0, limit=1)
-        total_spots = result.get("total", 0)
+        stats = _fetch_platform_stats(api, token)
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Spots", total_spots)
+            st.metric("Total Spots", stats.get("spots", 0))
         
         with col2:
-            # This would require a new API endpoint
-            st.metric("Total Photos", "N/A")
+            st.metric("Total Photos", stats.get("photos", 0))
         
         with col3:
-            # This would require a new API endpoint
-            st.metric("Total Ratings", "N/A")
+            st.metric("Total Ratings", stats.get("ratings", 0))
         
         with col4:
-            # This would require a new API endpoint  
-            st.metric("Total Comments", "N/A")
-        
-        st.caption("💡 Tip: Add more analytics endpoints to get detailed statistics")
+            st.metric("Total Comments", stats.get("comments", 0))
         
     except Exception as e:
         st.error(f"❌ Error loading statistics: {e}")
@@ -5,7 +5,12 @@ Reusable component to show user profile and logout functionality.
 """
 
 import streamlit as st
-from src.services.api_client import TuristandoAPI
+from services.api_client import get_api_client
+
+
+def _logged_in() -> bool:
+    """Return whether a user is logged in in this session."""
+    return bool(st.session_state.get("logged_in"))
 
 
 def user_profile_sidebar():
@@ -14,7 +19,7 @@ def user_profile_sidebar():
     
     Should be called on pages that require authentication.
     """
-    if not st.session_state.get("logged_in", False):
+    if not _logged_in():
         return
     
     user = st.session_state.get("user", {})
@@ -44,7 +49,7 @@ def user_profile_header():
     
     Alternative to sidebar display for wide layouts.
     """
-    if not st.session_state.get("logged_in", False):
+    if not _logged_in():
         return
     
     user = st.session_state.get("user", {})
@@ -61,7 +66,7 @@ def user_profile_header():
 
 def logout():
     """Handle user logout."""
-    api = TuristandoAPI()
+    api = get_api_client()
     
     try:
         # Get token
@@ -100,7 +105,7 @@ def require_login(redirect_to_login: bool = True):
     Returns:
         True if user is logged in, False otherwise.
     """
-    if not st.session_state.get("logged_in", False):
+    if not _logged_in():
         st.warning("⚠️ Você precisa estar logado para acessar esta página.")
         
         if redirect_to_login:
@@ -112,6 +117,20 @@ def require_login(redirect_to_login: bool = True):
     return True
 
 
+def get_session_user():
+    """
+    Get current user data and access token with a single login check.
+    
+    Returns:
+        Tuple of (user dict, token), or (None, None) if not logged in.
+    """
+    if not _logged_in():
+        return None, None
+    
+    state = st.session_state
+    return state.get("user"), state.get("access_token")
+
+
 def get_current_user():
     """
     Get current logged-in user data.
@@ -119,10 +138,7 @@ def get_current_user():
     Returns:
         User dict or None if not logged in.
     """
-    if not st.session_state.get("logged_in", False):
-        return None
-    
-    return st.session_state.get("user")
+    return get_session_user()[0]
 
 
 def get_access_token():
@@ -132,10 +148,7 @@ def get_access_token():
     Returns:
         Token string or None if not logged in.
     """
-    if not st.session_state.get("logged_in", False):
-        return None
-    
-    return st.session_state.get("access_token")
+    return get_session_user()[1]
 
 
 def is_admin():
@@ -5,35 +5,99 @@ Displays paginated list of tourist spots with filters.
 """
 
 import streamlit as st
-from src.services.api_client import TuristandoAPI
+from services.api_client import get_api_client, cached_list_spots
+from components.rating_form import FILLED_STARS
+from components.favorite_button import prefetch_favorite_status, render_favorite_button_compact
 
 st.set_page_config(page_title="Explorar Pontos", page_icon="🔍", layout="wide")
 
 st.title("🔍 Explorar Pontos Turísticos")
 
 # Initialize API client
-api = TuristandoAPI()
+api = get_api_client()
+
+# Read once per rerun instead of once per card
+token = st.session_state.get("token")
+
+# Favorite statuses for the current page, filled by one bulk request
+favorite_statuses = {}
 
 # Filters in sidebar
 st.sidebar.header("Filtros de Busca")
 
-search = st.sidebar.text_input("🔎 Pesquisar", placeholder="Nome ou descrição...")
-cidade = st.sidebar.text_input("🏙️ Cidade", placeholder="Ex: Rio de Janeiro")
-estado = st.sidebar.text_input("🗺️ Estado", placeholder="Ex: Rio de Janeiro")
-pais = st.sidebar.text_input("🌍 País", placeholder="Ex: Brasil")
+# Inside a form the inputs only apply (and rerun) on submit
+with st.sidebar.form("spot_filters"):
+    search = st.text_input("🔎 Pesquisar", placeholder="Nome ou descrição...")
+    cidade = st.text_input("🏙️ Cidade", placeholder="Ex: Rio de Janeiro")
+    estado = st.text_input("🗺️ Estado", placeholder="Ex: Rio de Janeiro")
+    pais = st.text_input("🌍 País", placeholder="Ex: Brasil")
+    st.form_submit_button("Aplicar filtros", use_container_width=True)
 
 # Pagination
 st.sidebar.header("Paginação")
 page = st.sidebar.number_input("Página", min_value=1, value=1, step=1)
 page_size = st.sidebar.selectbox("Itens por página", [10, 20, 50], index=1)
 
+view_mode = st.sidebar.radio("Exibição", ["Tabela", "Cartões"], horizontal=True)
+
 # Calculate skip
 skip = (page - 1) * page_size
 
+# Column setup for the table view
+_TABLE_COLUMNS = {
+    "nome": st.column_config.TextColumn("Nome"),
+    "cidade": st.column_config.TextColumn("Cidade"),
+    "estado": st.column_config.TextColumn("Estado"),
+    "avg_rating": st.column_config.NumberColumn("Avaliação", format="%.1f ⭐"),
+    "rating_count": st.column_config.NumberColumn("Avaliações"),
+}
+
+
+def render_spot_card(spot: dict):
+    """
+    Render a spot card with rating, favorite button and details link.
+    
+    Args:
+        spot: Spot list item.
+    """
+    spot_id = spot['id']
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        st.subheader(f"📍 {spot['nome']}")
+        st.write(f"**Localização**: {spot['cidade']}, {spot['estado']}, {spot['pais']}")
+        st.write(spot['descricao'])
+    
+    with col2:
+        # Rating display
+        rating = spot['avg_rating']
+        if rating:
+            stars = FILLED_STARS[max(0, min(5, int(round(rating))))]
+            st.metric("Avaliação", f"{rating:.1f} {stars}")
+            st.caption(f"{spot['rating_count']} avaliações")
+        else:
+            st.caption("Sem avaliações")
+        
+        # Favorite button (if logged in)
+        if token:
+            render_favorite_button_compact(
+                spot_id,
+                key_suffix=f"list_{page}",
+                is_favorited=favorite_statuses.get(spot_id),
+            )
+        
+        # Link to details
+        if st.button("Ver Detalhes", key=f"spot_{spot_id}"):
+            st.session_state.selected_spot_id = spot_id
+            st.switch_page("pages/2_Spot_Details.py")
+
+
 # Fetch spots
 try:
     with st.spinner("Carregando pontos turísticos..."):
-        result = api.list_spots(
+        result = cached_list_spots(
+            api,
             skip=skip,
             limit=page_size,
             cidade=cidade if cidade else None,
@@ -52,36 +116,35 @@ try:
     if not spots:
         st.warning("Nenhum ponto turístico encontrado com os filtros aplicados.")
     else:
-        # Display spots in cards
-        for spot in spots:
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.subheader(f"📍 {spot['nome']}")
-                    st.write(f"**Localização**: {spot['cidade']}, {spot['estado']}, {spot['pais']}")
-                    st.write(spot['descricao'])
-                
-                with col2:
-                    # Rating display
-                    if spot['avg_rating']:
-                        rating = spot['avg_rating']
-                        stars = "⭐" * int(round(rating))
-                        st.metric("Avaliação", f"{rating:.1f} {stars}")
-                        st.caption(f"{spot['rating_count']} avaliações")
-                    else:
-                        st.caption("Sem avaliações")
-                    
-                    # Favorite button (if logged in)
-                    if st.session_state.get("token"):
-                        from components.favorite_button import render_favorite_button_compact
-                        render_favorite_button_compact(spot['id'], key_suffix=f"list_{page}")
-                    
-                    # Link to details
-                    if st.button("Ver Detalhes", key=f"spot_{spot['id']}"):
-                        st.session_state.selected_spot_id = spot['id']
-                        st.switch_page("pages/2_Spot_Details.py")
-                
+        # Load favorite statuses for the whole page in one request
+        if token:
+            favorite_statuses = prefetch_favorite_status([spot['id'] for spot in spots])
+        
+        if view_mode == "Tabela":
+            # One dataframe element for the whole page; the card for the
+            # selected row is rendered on demand
+            event = st.dataframe(
+                spots,
+                column_order=("nome", "cidade", "estado", "avg_rating", "rating_count"),
+                column_config=_TABLE_COLUMNS,
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key=f"spots_table_{page}",
+            )
+            selected_rows = event.selection.rows
+            if selected_rows and selected_rows[0] < len(spots):
+                selected = spots[selected_rows[0]]
+                with st.expander(f"📍 {selected['nome']}", expanded=True):
+                    render_spot_card(selected)
+            else:
+                st.caption("Selecione uma linha para ver o ponto turístico.")
+            st.divider()
+        else:
+            # Display spots in cards
+            for spot in spots:
+                render_spot_card(spot)
                 st.divider()
         
         # Pagination info
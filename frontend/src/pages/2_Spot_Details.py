@@ -4,13 +4,27 @@ Spot Details Page - Detailed view of a tourist spot.
 Displays full spot information, photos, and ratings.
 """
 
+import html
 import streamlit as st
-from src.services.api_client import TuristandoAPI
+from services.api_client import get_api_client, cached_get_spot_bundle, prefetch_list_spots
+from components.map_directions import display_directions_card
+from components.accommodation_card import render_accommodation_list
+from components.accommodation_form import render_quick_add_accommodation_button
 
 st.set_page_config(page_title="Detalhes do Ponto", page_icon="📍", layout="wide")
 
 # Initialize API client
-api = TuristandoAPI()
+api = get_api_client()
+
+
+# Thumbnails shown per "load more" step
+PHOTOS_PER_PAGE = 9
+
+
+def _show_more_photos(key: str):
+    """Button callback: reveal the next page of photos."""
+    st.session_state[key] += 1
+
 
 # Get spot ID from session state or URL
 spot_id = st.session_state.get("selected_spot_id")
@@ -25,10 +39,16 @@ if not spot_id:
 # Fetch spot details
 try:
     with st.spinner("Carregando detalhes..."):
-        spot = api.get_spot(spot_id)
-        photos = api.get_spot_photos(spot_id)
-        rating_stats = api.get_spot_rating_stats(spot_id)
-        ratings = api.get_spot_ratings(spot_id, limit=10)
+        # Spot, photos, ratings and accommodations in one request
+        bundle = cached_get_spot_bundle(api, spot_id, ratings_limit=10)
+    
+    # Users usually go back to the list next: have its first page ready
+    prefetch_list_spots(api, skip=0, limit=20)
+    
+    spot = bundle["spot"]
+    photos = bundle["photos"]
+    rating_stats = bundle["rating_stats"]
+    ratings = bundle["ratings"]
     
     # Header
     st.title(f"📍 {spot['nome']}")
@@ -64,21 +84,40 @@ try:
     
     if photos:
         # Display photos in grid
+        photo_page_key = f"photo_page_{spot_id}"
+        shown = st.session_state.setdefault(photo_page_key, 1) * PHOTOS_PER_PAGE
+        
         cols = st.columns(3)
-        for idx, photo in enumerate(photos):
+        for idx, photo in enumerate(photos[:shown]):
+            url = f"http://localhost:8000{photo['thumbnail_url']}"
+            titulo = photo.get('titulo', 'Sem título')
             with cols[idx % 3]:
-                st.image(
-                    f"http://localhost:8000{photo['thumbnail_url']}",
-                    caption=photo.get('titulo', 'Sem título'),
-                    use_container_width=True,
-                )
+                if idx < 3:
+                    # First row is above the fold: load it right away
+                    st.image(url, caption=titulo, use_container_width=True)
+                else:
+                    # Let the browser fetch the rest only when scrolled into view
+                    caption = html.escape(titulo)
+                    st.markdown(
+                        f'<figure style="margin: 0 0 1rem 0;">'
+                        f'<img src="{html.escape(url)}" alt="{caption}" loading="lazy" decoding="async" style="width: 100%;">'
+                        f'<figcaption style="text-align: center; font-size: 0.875rem; opacity: 0.6;">{caption}</figcaption>'
+                        f'</figure>',
+                        unsafe_allow_html=True,
+                    )
+        
+        if len(photos) > shown:
+            st.button(
+                f"Mostrar mais fotos ({len(photos) - shown} restantes)",
+                on_click=_show_more_photos,
+                args=(photo_page_key,),
+            )
     else:
         st.info("Nenhuma foto disponível para este ponto turístico.")
     
     st.divider()
     
     # Directions section
-    from src.components.map_directions import display_directions_card
     display_directions_card(
         spot_id=spot_id,
         spot_name=spot['nome'],
@@ -93,12 +132,10 @@ try:
     st.subheader("🏨 Hospedagens Próximas")
     
     try:
-        accommodations_data = api.get_spot_accommodations(spot_id)
+        accommodations_data = bundle["accommodations"]
         accommodations = accommodations_data.get('accommodations', [])
         
         if accommodations:
-            from src.components.accommodation_card import render_accommodation_list
-            
             # Show filters if logged in as admin
             user = st.session_state.get("user")
             is_admin = user and user.get("role") == "ADMIN"
@@ -107,7 +144,6 @@ try:
             
             # Admin: quick add button
             if is_admin:
-                from src.components.accommodation_form import render_quick_add_accommodation_button
                 st.divider()
                 render_quick_add_accommodation_button(spot_id)
         else:
@@ -116,7 +152,6 @@ try:
             # Admin: show add button
             user = st.session_state.get("user")
             if user and user.get("role") == "ADMIN":
-                from src.components.accommodation_form import render_quick_add_accommodation_button
                 render_quick_add_accommodation_button(spot_id)
     
     except Exception as e:
@@ -133,18 +168,24 @@ try:
         
         with col1:
             st.write("**Distribuição de Avaliações:**")
-            for stars in range(5, 0, -1):
-                count = rating_stats[str(stars)]
-                percentage = (count / rating_stats['total'] * 100) if rating_stats['total'] > 0 else 0
-                st.write(f"{'⭐' * stars} ({stars}): {count} ({percentage:.0f}%)")
+            total = rating_stats['total']
+            st.markdown("  \n".join(
+                f"{'⭐' * stars} ({stars}): {rating_stats[key]} ({rating_stats[key] / total * 100:.0f}%)"
+                for stars, key in ((5, "5"), (4, "4"), (3, "3"), (2, "2"), (1, "1"))
+            ))
         
         with col2:
             st.write("**Avaliações Recentes:**")
             if ratings:
-                for rating in ratings:
-                    st.write(f"**{rating['nota']} ⭐** - {rating.get('comentario', 'Sem comentário')}")
-                    st.caption(f"Avaliado em {rating['created_at']}")
-                    st.divider()
+                # All ratings in one markdown element; user text is escaped
+                st.markdown(
+                    "\n\n---\n\n".join(
+                        f"**{rating['nota']} ⭐** - {html.escape(rating.get('comentario') or 'Sem comentário')}"
+                        f"\n\n<sub>Avaliado em {rating['created_at']}</sub>"
+                        for rating in ratings
+                    ),
+                    unsafe_allow_html=True,
+                )
             else:
                 st.info("Nenhuma avaliação detalhada disponível.")
     else:
@@ -4,11 +4,16 @@ Registration Page - User account creation.
 Streamlit page for new user registration.
 """
 
+import re
 import streamlit as st
-from src.services.api_client import TuristandoAPI
+from services.api_client import get_api_client
 
 st.set_page_config(page_title="Cadastro - Turistando", page_icon="✍️", layout="wide")
 
+# Mirror the backend UserRegisterRequest rules to catch typos before the POST
+LOGIN_RE = re.compile(r"[A-Za-z0-9_-]{3,50}")
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
 
 def register_page():
     """Render registration page."""
@@ -74,16 +79,24 @@ def register_page():
                 st.error("❌ Por favor, preencha todos os campos obrigatórios.")
                 return
             
+            if not LOGIN_RE.fullmatch(login):
+                st.error("❌ O nome de usuário deve ter 3-50 caracteres: letras, números, hífens e underscores.")
+                return
+            
+            if not EMAIL_RE.fullmatch(email):
+                st.error("❌ Informe um endereço de email válido.")
+                return
+            
             if password != password_confirm:
                 st.error("❌ As senhas não coincidem.")
                 return
             
-            if len(password) < 6:
-                st.error("❌ A senha deve ter pelo menos 6 caracteres.")
+            if not 6 <= len(password) <= 100:
+                st.error("❌ A senha deve ter entre 6 e 100 caracteres.")
                 return
             
             # Call API
-            api = TuristandoAPI()
+            api = get_api_client()
             
             try:
                 with st.spinner("Criando conta..."):
@@ -95,10 +108,8 @@ def register_page():
                 st.session_state["user"] = result["user"]
                 
                 st.success(f"✅ Conta criada com sucesso! Bem-vindo, {result['user']['login']}!")
-                st.balloons()
                 
-                # Redirect to home after 2 seconds
-                st.info("Redirecionando para a página inicial...")
+                # Redirect to home
                 st.rerun()
                 
             except Exception as e:
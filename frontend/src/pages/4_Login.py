@@ -5,7 +5,7 @@ Streamlit page for user login.
 """
 
 import streamlit as st
-from src.services.api_client import TuristandoAPI
+from services.api_client import get_api_client
 
 st.set_page_config(page_title="Login - Turistando", page_icon="🔑", layout="wide")
 
@@ -58,7 +58,7 @@ def login_page():
                 return
             
             # Call API
-            api = TuristandoAPI()
+            api = get_api_client()
             
             try:
                 with st.spinner("Autenticando..."):
@@ -5,10 +5,14 @@ Admin-only page for creating, editing, and managing tourist spots and photos.
 """
 
 import streamlit as st
-from services.api_client import TuristandoAPI
+from services.api_client import get_api_client, cached_get_spot_bundle, cached_list_spots
 from components.spot_form import render_spot_form
 from components.photo_upload import render_photo_upload, render_photo_gallery_manager, render_batch_upload
 from components.spot_management import render_spot_management_list, render_spot_statistics
+from components.accommodation_card import render_accommodation_statistics, render_accommodation_card
+from components.accommodation_form import render_accommodation_form
+from components.export_button import render_export_button
+from components.import_form import render_import_form, render_import_examples
 
 # Page configuration
 st.set_page_config(
@@ -18,7 +22,69 @@ st.set_page_config(
 )
 
 # Initialize API client
-api = TuristandoAPI()
+api = get_api_client()
+
+
+def _spot_select_options(_api) -> dict:
+    """
+    Map spot IDs to selectbox labels.
+    
+    Built from cached_list_spots, so spot creates, edits, deletes and
+    imports (which clear that cache) show up in the selectors right away.
+    
+    Args:
+        _api: API client instance.
+    
+    Returns:
+        Dict of spot ID to "name (city)" label.
+    """
+    result = cached_list_spots(_api, 0, 100)
+    return {spot['id']: f"{spot['nome']} ({spot['cidade']})" for spot in result.get("spots", [])}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_accommodations(_api, spot_id: int, version: int) -> dict:
+    """
+    Fetch a spot's accommodations (cached for 30s).
+    
+    Args:
+        _api: API client instance (excluded from the cache key).
+        spot_id: Tourist spot ID.
+        version: Per-spot data version; bumped after writes to skip stale entries.
+    
+    Returns:
+        Accommodation list response.
+    """
+    return _api.get_spot_accommodations(spot_id)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_accommodation_stats(_api, spot_id: int, version: int) -> dict:
+    """
+    Fetch a spot's accommodation statistics (cached for 30s).
+    
+    Args:
+        _api: API client instance (excluded from the cache key).
+        spot_id: Tourist spot ID.
+        version: Per-spot data version; bumped after writes to skip stale entries.
+    
+    Returns:
+        Accommodation statistics.
+    """
+    return _api.get_accommodation_statistics(spot_id)
+
+
+def _accommodations_version(spot_id: int) -> int:
+    """Current accommodation data version for a spot in this session."""
+    return st.session_state.setdefault("acc_data_v", {}).get(spot_id, 0)
+
+
+def _bump_accommodations_version(spot_id: int):
+    """Invalidate cached accommodation data for a spot after a write."""
+    versions = st.session_state.setdefault("acc_data_v", {})
+    versions[spot_id] = versions.get(spot_id, 0) + 1
+    cached_get_spot_bundle.clear()
+
 
 # Check authentication and admin role
 if "token" not in st.session_state or not st.session_state.get("token"):
@@ -46,7 +112,7 @@ tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
 
 # Tab 1: Statistics
 with tab1:
-    render_spot_statistics(api)
+    render_spot_statistics(api, st.session_state["token"])
     
     st.divider()
     
@@ -87,22 +153,19 @@ with tab4:
     
     try:
         # Fetch spots for selection
-        result = api.list_spots(skip=0, limit=100)
-        spots = result.get("spots", [])
+        spot_labels = _spot_select_options(api)
         
-        if not spots:
+        if not spot_labels:
             st.info("No spots available. Create a spot first in the 'Create New Spot' tab.")
         else:
-            # Spot selection
-            spot_options = {f"{spot['nome']} ({spot['cidade']})": spot['id'] for spot in spots}
-            selected_spot_name = st.selectbox(
+            # Spot selection (options are IDs, shown by label)
+            selected_spot_id = st.selectbox(
                 "Choose a tourist spot",
-                options=list(spot_options.keys())
+                options=spot_labels,
+                format_func=spot_labels.get
             )
             
-            if selected_spot_name:
-                selected_spot_id = spot_options[selected_spot_name]
-                
+            if selected_spot_id:
                 st.divider()
                 
                 # Photo upload section
@@ -123,49 +186,73 @@ with tab4:
         st.error(f"❌ Error loading spots: {e}")
 
 # Tab 5: Accommodations Management
-with tab5:
+def _bulk_delete_accommodations(spot_id: int):
+    """
+    Form callback: delete the selected accommodations of a spot.
+    
+    Runs before the fragment rerun, so the refreshed list is fetched
+    without an explicit st.rerun().
+    """
+    ids = st.session_state.get(f"bulk_delete_ids_{spot_id}")
+    if not ids:
+        return
+    try:
+        deleted = api.delete_accommodations(ids, st.session_state["token"])
+        st.session_state["acc_bulk_delete_result"] = (True, f"✅ Deleted {deleted} accommodation(s)")
+        st.session_state[f"bulk_delete_ids_{spot_id}"] = []
+        _bump_accommodations_version(spot_id)
+    except Exception as e:
+        st.session_state["acc_bulk_delete_result"] = (False, f"❌ Error deleting: {e}")
+
+
+@st.fragment
+def _render_accommodations_tab():
+    """
+    Render the accommodations tab as a fragment.
+    
+    Selecting a spot or adding, editing and deleting accommodations only
+    reruns this tab instead of the whole dashboard.
+    """
     st.header("🏨 Accommodation Management")
     st.caption("Add and manage accommodations for tourist spots")
     
     try:
         # Get all spots for selection
-        spots = api.list_spots(limit=1000)
+        spot_labels = _spot_select_options(api)
         
-        if spots['spots']:
-            # Spot selector
-            spot_options = {spot['nome']: spot['id'] for spot in spots['spots']}
-            selected_spot_name = st.selectbox(
+        if spot_labels:
+            # Spot selector (options are IDs, shown by label)
+            selected_spot_id = st.selectbox(
                 "Select a Tourist Spot",
-                options=[""] + list(spot_options.keys()),
+                options=spot_labels,
+                format_func=spot_labels.get,
+                index=None,
                 key="acc_spot_select"
             )
             
-            if selected_spot_name:
-                selected_spot_id = spot_options[selected_spot_name]
-                
+            if selected_spot_id:
                 st.divider()
                 
                 # Show accommodations
                 try:
-                    accommodations_data = api.get_spot_accommodations(selected_spot_id)
+                    version = _accommodations_version(selected_spot_id)
+                    accommodations_data = _fetch_accommodations(api, selected_spot_id, version)
                     accommodations = accommodations_data.get('accommodations', [])
                     
                     # Statistics
                     try:
-                        stats = api.get_accommodation_statistics(selected_spot_id)
-                        from components.accommodation_card import render_accommodation_statistics
+                        stats = _fetch_accommodation_stats(api, selected_spot_id, version)
                         render_accommodation_statistics(stats)
                         st.divider()
                     except:
                         pass
                     
                     # Add accommodation form
-                    from components.accommodation_form import render_accommodation_form
-                    
                     with st.expander("➕ Add New Accommodation", expanded=len(accommodations) == 0):
                         if render_accommodation_form(selected_spot_id):
                             st.success("✅ Accommodation added!")
-                            st.rerun()
+                            _bump_accommodations_version(selected_spot_id)
+                            st.rerun(scope="fragment")
                     
                     st.divider()
                     
@@ -173,7 +260,29 @@ with tab5:
                     st.subheader(f"Accommodations ({len(accommodations)})")
                     
                     if accommodations:
-                        from components.accommodation_card import render_accommodation_card
+                        # Bulk delete: one request for all selected
+                        with st.form(f"bulk_delete_acc_{selected_spot_id}", border=False):
+                            acc_names = {acc['id']: acc['nome'] for acc in accommodations}
+                            st.multiselect(
+                                "Select accommodations to delete",
+                                options=acc_names,
+                                format_func=acc_names.get,
+                                key=f"bulk_delete_ids_{selected_spot_id}"
+                            )
+                            st.form_submit_button(
+                                "🗑️ Delete selected",
+                                on_click=_bulk_delete_accommodations,
+                                args=(selected_spot_id,)
+                            )
+                        
+                        bulk_result = st.session_state.pop("acc_bulk_delete_result", None)
+                        if bulk_result:
+                            if bulk_result[0]:
+                                st.success(bulk_result[1])
+                            else:
+                                st.error(bulk_result[1])
+                        
+                        st.divider()
                         
                         for accommodation in accommodations:
                             # Check if editing
@@ -185,7 +294,8 @@ with tab5:
                                         accommodation
                                     ):
                                         st.success("✅ Accommodation updated!")
-                                        st.rerun()
+                                        _bump_accommodations_version(selected_spot_id)
+                                        st.rerun(scope="fragment")
                             else:
                                 result = render_accommodation_card(accommodation, show_actions=True)
                                 
@@ -197,10 +307,11 @@ with tab5:
                                             st.session_state["token"]
                                         )
                                         st.success(f"✅ Deleted {accommodation['nome']}")
+                                        _bump_accommodations_version(selected_spot_id)
                                         # Clear confirmation state
                                         if f"confirm_delete_acc_{accommodation['id']}" in st.session_state:
                                             del st.session_state[f"confirm_delete_acc_{accommodation['id']}"]
-                                        st.rerun()
+                                        st.rerun(scope="fragment")
                                     except Exception as e:
                                         st.error(f"❌ Error deleting: {e}")
                             
@@ -216,6 +327,10 @@ with tab5:
     except Exception as e:
         st.error(f"❌ Error loading spots: {e}")
 
+
+with tab5:
+    _render_accommodations_tab()
+
 # Tab 6: Import/Export
 with tab6:
     st.header("📦 Data Import/Export")
@@ -223,15 +338,12 @@ with tab6:
     
     # Export section
     st.subheader("📥 Export Data")
-    from components.export_button import render_export_button
     render_export_button(api.client)
     
     st.divider()
     
     # Import section
     st.subheader("📤 Import Data")
-    from components.import_form import render_import_form, render_import_examples
-    
     # Show examples first
     render_import_examples()
     
@@ -2,8 +2,14 @@
 My Favorites Page - Display user's favorite tourist spots.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+import pandas as pd
+import requests
 import streamlit as st
-from services.api_client import TuristandoAPI
+from services.api_client import get_api_client, cached_get_my_favorites
+from components.favorite_button import set_cached_favorite_status
+from components.rating_form import FILLED_STARS
 
 # Page configuration
 st.set_page_config(
@@ -13,7 +19,142 @@ st.set_page_config(
 )
 
 # Initialize API client
-api = TuristandoAPI()
+api = get_api_client()
+
+# Columns matched by the favorites search box
+_SEARCH_COLUMNS = ("spot_nome", "spot_cidade", "spot_estado")
+
+# Cards per page choices (only one page is rendered at a time)
+PAGE_SIZES = (10, 20, 50)
+
+
+@st.cache_resource
+def _removal_executor() -> ThreadPoolExecutor:
+    """Get the process-wide pool that sends favorite removals."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _pending_removals() -> dict:
+    """Get this session's in-flight removals (spot_id -> (future, name))."""
+    return st.session_state.setdefault("fav_pending_removals", {})
+
+
+def _remove_favorite(spot_id: int, spot_nome: str):
+    """
+    Button callback: send the removal in the background.
+    
+    The spot is hidden right away; reconcile_removals() reports the
+    outcome on a later run.
+    """
+    future = _removal_executor().submit(api.remove_favorite, spot_id, st.session_state["token"])
+    _pending_removals()[spot_id] = (future, spot_nome)
+
+
+def reconcile_removals():
+    """
+    Settle finished background removals.
+    
+    Successful removals drop the cached favorites list (it may have been
+    refetched while the DELETE was in flight); failed ones restore the
+    favorite and show an error toast.
+    """
+    pending = _pending_removals()
+    for spot_id, (future, spot_nome) in list(pending.items()):
+        if not future.done():
+            continue
+        del pending[spot_id]
+        if future.exception() is None:
+            set_cached_favorite_status(spot_id, False)
+            st.toast(f"✅ Removed {spot_nome} from favorites")
+        else:
+            set_cached_favorite_status(spot_id, True)
+            st.toast(f"❌ Error removing {spot_nome}: {future.exception()}")
+
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def _prepare_favorites(favorites: list) -> tuple:
+    """
+    Format the favorites for display and build their search/sort frame.
+    
+    Each favorite gets its display strings (``_loc``, ``_stars``, ``_date``)
+    once per distinct list instead of on every card render. The frame keeps
+    the list positions as its index, plus one lowercased ``_haystack`` of
+    the searchable columns joined by newlines (which a search box cannot
+    contain), so a search is a single vectorized substring test and the
+    formatted dicts are still used for rendering.
+    
+    Args:
+        favorites: Favorites as returned by the API.
+    
+    Returns:
+        Tuple of (formatted favorites, DataFrame with ``spot_nome``,
+        ``spot_avg_rating`` and ``_haystack`` columns).
+    """
+    for fav in favorites:
+        rating = fav.get('spot_avg_rating')
+        fav['_loc'] = f"{fav['spot_cidade']}, {fav['spot_estado']}, {fav['spot_pais']}"
+        fav['_stars'] = FILLED_STARS[max(0, min(5, int(rating)))] if rating else None
+        fav['_date'] = fav['favorited_at'][:10]
+    
+    df = pd.DataFrame(favorites, columns=[*_SEARCH_COLUMNS, "spot_avg_rating"])
+    df["_haystack"] = (
+        df[list(_SEARCH_COLUMNS)].fillna("").astype(str).agg("\n".join, axis=1).str.lower()
+    )
+    return favorites, df
+
+
+def render_favorite_card(fav: dict):
+    """
+    Render one favorite spot card with its view and remove actions.
+    
+    Args:
+        fav: Favorite with spot details.
+    """
+    spot_id = fav['spot_id']
+    spot_nome = fav['spot_nome']
+    
+    with st.container():
+        # Spot card
+        st.markdown(f"### 📍 {spot_nome}")
+        st.caption(fav['_loc'])
+        
+        # Rating
+        if fav['_stars']:
+            st.markdown(
+                f"**Rating:** {fav['_stars']} "
+                f"{fav['spot_avg_rating']:.1f} "
+                f"({fav.get('spot_rating_count', 0)} reviews)"
+            )
+        else:
+            st.caption("_No ratings yet_")
+        
+        # Favorited date
+        st.caption(f"❤️ Favorited on: {fav['_date']}")
+        
+        # Actions
+        col_view, col_unfav = st.columns([1, 1])
+        
+        with col_view:
+            if st.button(
+                "👁️ View Details",
+                key=f"view_{spot_id}",
+                use_container_width=True
+            ):
+                st.session_state["selected_spot_id"] = spot_id
+                st.switch_page("pages/2_Spot_Details.py")
+        
+        with col_unfav:
+            st.button(
+                "💔 Remove",
+                key=f"unfav_{spot_id}",
+                type="secondary",
+                use_container_width=True,
+                on_click=_remove_favorite,
+                args=(spot_id, spot_nome)
+            )
+        
+        st.divider()
+
 
 # Check authentication
 if "token" not in st.session_state or not st.session_state.get("token"):
@@ -34,23 +175,23 @@ if "token" not in st.session_state or not st.session_state.get("token"):
 st.title("❤️ My Favorites")
 st.caption(f"Favorite tourist spots for {st.session_state.get('username', 'you')}")
 
+# Settle finished removals first so the fetch below sees their outcome
+reconcile_removals()
+
 # Fetch favorites
 try:
     with st.spinner("Loading your favorites..."):
-        import requests
-        
-        headers = {"Authorization": f"Bearer {st.session_state['token']}"}
-        response = requests.get(
-            "http://localhost:8000/api/favorites",
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            favorites = response.json()
-        else:
-            st.error(f"❌ Error loading favorites: {response.status_code}")
+        try:
+            favorites = cached_get_my_favorites(api, st.session_state["token"])
+        except requests.HTTPError as e:
+            st.error(f"❌ Error loading favorites: {e.response.status_code}")
             favorites = []
     
+    # Hide removals still in flight (optimistic update)
+    pending = _pending_removals()
+    if pending:
+        favorites = [fav for fav in favorites if fav['spot_id'] not in pending]
+    
     if not favorites:
         st.info("📭 You haven't favorited any tourist spots yet!")
         st.markdown("""
@@ -67,114 +208,69 @@ try:
         # Display favorites count
         st.markdown(f"### You have {len(favorites)} favorite spot{'s' if len(favorites) != 1 else ''}")
         
-        # Add filters
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            search_query = st.text_input(
-                "🔍 Search favorites",
-                placeholder="Search by name or location...",
-                key="fav_search"
-            )
-        
-        with col2:
-            sort_by = st.selectbox(
-                "Sort by",
-                ["Most Recent", "Alphabetical (A-Z)", "Highest Rated"],
-                key="fav_sort"
-            )
+        # Add filters (inside a form they only apply, and rerun, on submit)
+        with st.form("fav_filters", border=False):
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                search_query = st.text_input(
+                    "🔍 Search favorites",
+                    placeholder="Search by name or location...",
+                    key="fav_search"
+                )
+            
+            with col2:
+                sort_by = st.selectbox(
+                    "Sort by",
+                    ["Most Recent", "Alphabetical (A-Z)", "Highest Rated"],
+                    key="fav_sort"
+                )
+            
+            st.form_submit_button("Apply")
         
         st.divider()
         
-        # Filter favorites
-        filtered_favorites = favorites
+        # Filter favorites (one vectorized substring test)
+        favorites, df = _prepare_favorites(favorites)
         
         if search_query:
-            search_lower = search_query.lower()
-            filtered_favorites = [
-                fav for fav in favorites
-                if search_lower in fav['spot_nome'].lower()
-                or search_lower in fav['spot_cidade'].lower()
-                or search_lower in fav['spot_estado'].lower()
-            ]
+            df = df[df["_haystack"].str.contains(search_query.lower(), regex=False)]
         
         # Sort favorites
         if sort_by == "Alphabetical (A-Z)":
-            filtered_favorites = sorted(filtered_favorites, key=lambda x: x['spot_nome'])
+            df = df.sort_values("spot_nome", kind="stable")
         elif sort_by == "Highest Rated":
-            filtered_favorites = sorted(
-                filtered_favorites,
-                key=lambda x: x.get('spot_avg_rating') or 0,
-                reverse=True
+            df = df.sort_values(
+                "spot_avg_rating",
+                ascending=False,
+                na_position="last",
+                kind="stable"
             )
         # Most Recent is already the default order from API
         
+        filtered_favorites = [favorites[i] for i in df.index]
+        
         if not filtered_favorites:
             st.info(f"No favorites found matching '{search_query}'")
         else:
-            # Display favorites in grid
-            for i in range(0, len(filtered_favorites), 2):
-                cols = st.columns(2)
-                
-                for j, col in enumerate(cols):
-                    if i + j < len(filtered_favorites):
-                        fav = filtered_favorites[i + j]
-                        
+            # Filter and sort run on the full list; only one page is rendered
+            shown_favorites = filtered_favorites
+            if len(filtered_favorites) > PAGE_SIZES[0]:
+                col_size, col_page = st.columns([1, 1])
+                with col_size:
+                    page_size = st.selectbox("Per page", PAGE_SIZES, index=1, key="fav_page_size")
+                total_pages = -(-len(filtered_favorites) // page_size)
+                with col_page:
+                    # No key: the page resets to 1 when the page count changes
+                    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
+                shown_favorites = filtered_favorites[(page - 1) * page_size:page * page_size]
+            
+            # Display favorites in grid, two per row
+            for pair in zip_longest(*[iter(shown_favorites)] * 2):
+                for fav, col in zip(pair, st.columns(2)):
+                    if fav is not None:
                         with col:
-                            with st.container():
-                                # Spot card
-                                st.markdown(f"### 📍 {fav['spot_nome']}")
-                                st.caption(f"{fav['spot_cidade']}, {fav['spot_estado']}, {fav['spot_pais']}")
-                                
-                                # Rating
-                                if fav.get('spot_avg_rating'):
-                                    rating_stars = "⭐" * int(fav['spot_avg_rating'])
-                                    st.markdown(
-                                        f"**Rating:** {rating_stars} "
-                                        f"{fav['spot_avg_rating']:.1f} "
-                                        f"({fav.get('spot_rating_count', 0)} reviews)"
-                                    )
-                                else:
-                                    st.caption("_No ratings yet_")
-                                
-                                # Favorited date
-                                st.caption(f"❤️ Favorited on: {fav['favorited_at'][:10]}")
-                                
-                                # Actions
-                                col_view, col_unfav = st.columns([1, 1])
-                                
-                                with col_view:
-                                    if st.button(
-                                        "👁️ View Details",
-                                        key=f"view_{fav['spot_id']}",
-                                        use_container_width=True
-                                    ):
-                                        st.session_state["selected_spot_id"] = fav['spot_id']
-                                        st.switch_page("pages/2_Spot_Details.py")
-                                
-                                with col_unfav:
-                                    if st.button(
-                                        "💔 Remove",
-                                        key=f"unfav_{fav['spot_id']}",
-                                        type="secondary",
-                                        use_container_width=True
-                                    ):
-                                        # Confirm and remove
-                                        try:
-                                            response = requests.delete(
-                                                f"http://localhost:8000/api/spots/{fav['spot_id']}/favorite",
-                                                headers=headers
-                                            )
-                                            
-                                            if response.status_code == 204:
-                                                st.success(f"✅ Removed {fav['spot_nome']} from favorites")
-                                                st.rerun()
-                                            else:
-                                                st.error("❌ Error removing favorite")
-                                        except Exception as e:
-                                            st.error(f"❌ Error: {str(e)}")
-                                
-                                st.divider()
+                            render_favorite_card(fav)
 
 except Exception as e:
     st.error(f"❌ Error loading favorites: {e}")
@@ -4,22 +4,116 @@ API client for backend communication.
 Provides typed interface to Turistando API endpoints.
 """
 
+import json
+import threading
 import requests
-from typing import Optional, List, Dict, Any
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, List, Dict, Any, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# Bytes of an error body read when extracting its detail message
+ERROR_BODY_LIMIT = 4096
+
+# orjson parses read payloads several times faster when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# (connect, read) timeout in seconds for requests that do not set one
+DEFAULT_TIMEOUT = (3, 10)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_TIMEOUT when a request has no timeout."""
+    
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def error_detail(response: requests.Response, default: str = "Unknown error") -> str:
+    """
+    Extract the ``detail`` message from an error response.
+    
+    Reads at most ERROR_BODY_LIMIT bytes (also for streamed responses) and
+    only parses JSON bodies, so huge HTML error pages from proxies are
+    never loaded or parsed in full.
+    
+    Args:
+        response: Failed HTTP response.
+        default: Message used when the body has no detail.
+    
+    Returns:
+        Error detail, or the start of the body text.
+    """
+    body = next(response.iter_content(ERROR_BODY_LIMIT), b"")
+    if response.headers.get("content-type", "").startswith("application/json"):
+        try:
+            data = json.loads(body)
+            return data.get("detail", default) if isinstance(data, dict) else default
+        except ValueError:
+            pass
+    return body[:200].decode("utf-8", errors="replace") or default
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    """
+    Build the Authorization header for a token.
+    
+    The header is passed per request and never stored on the shared
+    session, which is used by every user. It is not memoized, so tokens
+    are not kept in memory after logout or expiry.
+    
+    Args:
+        token: Access token.
+    
+    Returns:
+        Headers dictionary with the bearer token.
+    """
+    return {"Authorization": f"Bearer {token}"}
 
 
 class TuristandoAPI:
     """Client for Turistando API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        session: Optional[requests.Session] = None,
+    ):
         self.base_url = base_url
         self.api_prefix = "/api"
-        self.session = requests.Session()
+        self.session = session or requests.Session()
     
     def _url(self, path: str) -> str:
         """Build full URL for API endpoint."""
         return f"{self.base_url}{self.api_prefix}{path}"
     
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Decode a JSON response body (with orjson when available)."""
+        return _json_loads(response.content)
+    
+    def warmup(self) -> None:
+        """
+        Open a pooled keep-alive connection to the backend.
+        
+        Sends a cheap health check so the first user request reuses an
+        established connection. Failures are ignored.
+        """
+        try:
+            self.session.get(f"{self.base_url}/health", timeout=1)
+        except requests.exceptions.RequestException:
+            pass
+    
     def list_spots(
         self,
         skip: int = 0,
@@ -55,7 +149,7 @@ class TuristandoAPI:
         
         response = self.session.get(self._url("/spots"), params=params)
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def get_spot(self, spot_id: int) -> Dict[str, Any]:
         """
@@ -69,8 +163,75 @@ class TuristandoAPI:
         """
         response = self.session.get(self._url(f"/spots/{spot_id}"))
         response.raise_for_status()
+        return self._json(response)
+    
+    def get_spot_bundle(self, spot_id: int, ratings_limit: int = 10) -> Dict[str, Any]:
+        """
+        Get a spot with photos, rating stats, ratings and accommodations.
+        
+        Args:
+            spot_id: Spot ID.
+            ratings_limit: Max recent ratings to include.
+        
+        Returns:
+            Dict with spot, photos, rating_stats, ratings and accommodations.
+        """
+        response = self.session.get(
+            self._url(f"/spots/{spot_id}/bundle"),
+            params={"ratings_limit": ratings_limit}
+        )
+        response.raise_for_status()
+        return self._json(response)
+    
+    def create_spot(self, payload: Dict[str, Any], token: str) -> Dict[str, Any]:
+        """
+        Create a tourist spot (admin only).
+        
+        Args:
+            payload: Spot fields.
+            token: Admin access token.
+        
+        Returns:
+            Created spot.
+        """
+        headers = _auth_headers(token)
+        response = self.session.post(self._url("/spots"), json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()
+    
+    def update_spot(self, spot_id: int, payload: Dict[str, Any], token: str) -> Dict[str, Any]:
+        """
+        Update a tourist spot (admin only).
+        
+        Args:
+            spot_id: Spot ID.
+            payload: Fields to update.
+            token: Admin access token.
+        
+        Returns:
+            Updated spot.
+        """
+        headers = _auth_headers(token)
+        response = self.session.put(
+            self._url(f"/spots/{spot_id}"),
+            json=payload,
+            headers=headers
+        )
+        response.raise_for_status()
         return response.json()
     
+    def delete_spot(self, spot_id: int, token: str) -> None:
+        """
+        Delete a tourist spot (admin only).
+        
+        Args:
+            spot_id: Spot ID.
+            token: Admin access token.
+        """
+        headers = _auth_headers(token)
+        response = self.session.delete(self._url(f"/spots/{spot_id}"), headers=headers)
+        response.raise_for_status()
+    
     def get_spot_photos(self, spot_id: int) -> List[Dict[str, Any]]:
         """
         Get photos for a spot.
@@ -83,7 +244,7 @@ class TuristandoAPI:
         """
         response = self.session.get(self._url(f"/spots/{spot_id}/photos"))
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def get_spot_ratings(
         self, spot_id: int, skip: int = 0, limit: int = 50
@@ -102,7 +263,7 @@ class TuristandoAPI:
         params = {"skip": skip, "limit": limit}
         response = self.session.get(self._url(f"/spots/{spot_id}/ratings"), params=params)
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def get_spot_rating_stats(self, spot_id: int) -> Dict[str, Any]:
         """
@@ -116,7 +277,7 @@ class TuristandoAPI:
         """
         response = self.session.get(self._url(f"/spots/{spot_id}/ratings/stats"))
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def register(self, login: str, email: str, password: str) -> Dict[str, Any]:
         """
@@ -168,7 +329,7 @@ class TuristandoAPI:
         Returns:
             Logout confirmation.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.post(self._url("/auth/logout"), headers=headers)
         response.raise_for_status()
         return response.json()
@@ -183,7 +344,7 @@ class TuristandoAPI:
         Returns:
             User information.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.get(self._url("/auth/me"), headers=headers)
         response.raise_for_status()
         return response.json()
@@ -203,7 +364,7 @@ class TuristandoAPI:
         Returns:
             Created rating.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         payload = {"nota": nota}
         if comentario:
             payload["comentario"] = comentario
@@ -231,7 +392,7 @@ class TuristandoAPI:
         Returns:
             Updated rating.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         payload = {}
         if nota is not None:
             payload["nota"] = nota
@@ -275,7 +436,7 @@ class TuristandoAPI:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def create_comment(
         self, spot_id: int, texto: str, token: str
@@ -291,7 +452,7 @@ class TuristandoAPI:
         Returns:
             Created comment.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         payload = {"texto": texto}
         
         response = self.session.post(
@@ -302,6 +463,34 @@ class TuristandoAPI:
         response.raise_for_status()
         return response.json()
     
+    def create_comments_bulk(
+        self, spot_id: int, textos: List[str], token: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several comments for a spot in one request.
+        
+        Args:
+            spot_id: Spot ID.
+            textos: Comment texts.
+            token: Access token.
+        
+        Returns:
+            Created comments, in input order.
+        """
+        headers = _auth_headers(token)
+        payload = {
+            "spot_id": spot_id,
+            "items": [{"texto": texto} for texto in textos]
+        }
+        
+        response = self.session.post(
+            self._url("/comments/bulk"),
+            json=payload,
+            headers=headers
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def like_comment(self, comment_id: str) -> None:
         """
         Like a comment.
@@ -312,6 +501,19 @@ class TuristandoAPI:
         response = self.session.post(self._url(f"/comments/{comment_id}/like"))
         response.raise_for_status()
     
+    def like_comments_bulk(self, comment_ids: List[str]) -> None:
+        """
+        Like several comments in one request.
+        
+        Args:
+            comment_ids: Comment IDs (1-100).
+        """
+        response = self.session.post(
+            self._url("/comments/likes/bulk"),
+            json={"comment_ids": comment_ids}
+        )
+        response.raise_for_status()
+    
     def report_comment(self, comment_id: str) -> None:
         """
         Report a comment for moderation.
@@ -355,7 +557,7 @@ class TuristandoAPI:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def get_accommodation_statistics(self, spot_id: int) -> Dict[str, Any]:
         """
@@ -371,7 +573,7 @@ class TuristandoAPI:
             self._url(f"/spots/{spot_id}/accommodations/statistics")
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def get_accommodation(self, accommodation_id: int) -> Dict[str, Any]:
         """
@@ -387,7 +589,7 @@ class TuristandoAPI:
             self._url(f"/accommodations/{accommodation_id}")
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def delete_accommodation(self, accommodation_id: int, token: str) -> None:
         """
@@ -397,13 +599,33 @@ class TuristandoAPI:
             accommodation_id: Accommodation ID.
             token: Admin access token.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.delete(
             self._url(f"/accommodations/{accommodation_id}"),
             headers=headers
         )
         response.raise_for_status()
     
+    def delete_accommodations(self, accommodation_ids: List[int], token: str) -> int:
+        """
+        Delete several accommodations in one request (admin only).
+        
+        Args:
+            accommodation_ids: Accommodation IDs (at most 100).
+            token: Admin access token.
+        
+        Returns:
+            Number of deleted accommodations.
+        """
+        headers = _auth_headers(token)
+        response = self.session.delete(
+            self._url("/accommodations"),
+            params={"ids": ",".join(str(i) for i in accommodation_ids)},
+            headers=headers
+        )
+        response.raise_for_status()
+        return response.json()["deleted"]
+    
     # Favorites methods
     def get_my_favorites(self, token: str) -> List[Dict[str, Any]]:
         """
@@ -415,13 +637,13 @@ class TuristandoAPI:
         Returns:
             List of favorites with spot details.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.get(
             self._url("/favorites"),
             headers=headers
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
     
     def add_favorite(self, spot_id: int, token: str) -> Dict[str, Any]:
         """
@@ -434,7 +656,7 @@ class TuristandoAPI:
         Returns:
             Created favorite information.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.post(
             self._url(f"/spots/{spot_id}/favorite"),
             headers=headers
@@ -450,7 +672,7 @@ class TuristandoAPI:
             spot_id: Spot ID.
             token: Access token.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.delete(
             self._url(f"/spots/{spot_id}/favorite"),
             headers=headers
@@ -468,7 +690,7 @@ class TuristandoAPI:
         Returns:
             Action taken and new status.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.post(
             self._url(f"/spots/{spot_id}/favorite/toggle"),
             headers=headers
@@ -487,10 +709,321 @@ class TuristandoAPI:
         Returns:
             True if favorited, False otherwise.
         """
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = _auth_headers(token)
         response = self.session.get(
             self._url(f"/spots/{spot_id}/favorite/status"),
             headers=headers
         )
         response.raise_for_status()
         return response.json().get("is_favorited", False)
+    
+    def get_platform_stats(self, token: str) -> Dict[str, int]:
+        """
+        Get platform-wide totals in a single request (admin only).
+        
+        Args:
+            token: Admin access token.
+        
+        Returns:
+            Dict with spots, photos, ratings and comments totals.
+        """
+        headers = _auth_headers(token)
+        response = self.session.get(self._url("/stats"), headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+
+@st.cache_resource
+def get_api_client(base_url: str = "http://localhost:8000") -> TuristandoAPI:
+    """
+    Get a process-wide API client shared across reruns and sessions.
+    
+    Reusing one client keeps the underlying requests.Session (and its
+    pooled connections) alive between Streamlit reruns.
+    
+    Args:
+        base_url: Backend base URL.
+    
+    The first call also warms the connection pool in a daemon thread.
+    
+    Returns:
+        Shared TuristandoAPI instance using the pooled HTTP session.
+    """
+    api = TuristandoAPI(base_url, session=get_http_session())
+    threading.Thread(target=api.warmup, daemon=True).start()
+    return api
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Get a process-wide pooled HTTP session for direct backend calls.
+    
+    Components that call endpoints not wrapped by TuristandoAPI should use
+    this instead of module-level ``requests.get/post/...`` so keep-alive
+    connections are reused across reruns and sessions.
+    
+    Idempotent requests are retried up to 3 times on connection errors
+    and 502/503/504 responses; POSTs are never retried. Requests without
+    an explicit timeout use DEFAULT_TIMEOUT, so a dead backend fails fast
+    instead of hanging the script.
+    
+    Returns:
+        Shared requests.Session with a pooled HTTPAdapter and default
+        Accept/User-Agent headers.
+    """
+    session = requests.Session()
+    adapter = _TimeoutHTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "User-Agent": "turistando-frontend/1.0",
+    })
+    return session
+
+
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
+def cached_get_my_favorites(_api: TuristandoAPI, token: str) -> List[Dict[str, Any]]:
+    """
+    Get a user's favorites, cached for 30 seconds per token.
+    
+    Search and sort reruns on My Favorites reuse the cached list. Call
+    ``cached_get_my_favorites.clear()`` after adding or removing a favorite.
+    
+    Args:
+        _api: API client instance.
+        token: Access token (part of the cache key).
+    
+    Returns:
+        List of favorites with spot details.
+    """
+    return _api.get_my_favorites(token)
+
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def cached_list_spots(
+    _api: TuristandoAPI,
+    skip: int = 0,
+    limit: int = 20,
+    cidade: Optional[str] = None,
+    estado: Optional[str] = None,
+    pais: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    List tourist spots, cached for 60 seconds per filter/page combination.
+    
+    Reruns with unchanged filters reuse the cached JSON dict instead of
+    calling the backend again. The client is excluded from the cache key.
+    Call ``cached_list_spots.clear()`` after creating, updating or deleting
+    a spot.
+    
+    Args:
+        _api: API client instance.
+        skip: Records to skip.
+        limit: Max records.
+        cidade: Filter by city.
+        estado: Filter by state.
+        pais: Filter by country.
+        search: Search query.
+    
+    Returns:
+        API response with spots list.
+    """
+    return _api.list_spots(
+        skip=skip,
+        limit=limit,
+        cidade=cidade,
+        estado=estado,
+        pais=pais,
+        search=search,
+    )
+
+
+def start_prefetch(key: tuple, warm):
+    """
+    Run a cache-warming callable in a background thread, once per session.
+    
+    The key is remembered in session state, so reruns do not start a new
+    thread each time. The thread gets the script run context, so Streamlit
+    cache calls inside it do not warn about a missing ScriptRunContext.
+    
+    Args:
+        key: Identifies the prefetch within the session.
+        warm: Zero-argument callable that fills a cache; errors are ignored.
+    """
+    started = st.session_state.setdefault("prefetched", set())
+    if key in started:
+        return
+    started.add(key)
+    
+    def _run():
+        try:
+            warm()
+        except Exception:
+            pass
+    
+    thread = threading.Thread(target=_run, daemon=True)
+    add_script_run_ctx(thread)
+    thread.start()
+
+
+def prefetch_list_spots(api: TuristandoAPI, skip: int = 0, limit: int = 20):
+    """
+    Warm the cached_list_spots cache for an unfiltered page in the background.
+    
+    Passes the same keyword arguments as the Explore Spots page so the
+    cache key matches its first render. Runs once per session via
+    start_prefetch(); failures are ignored and the page is simply fetched
+    again when shown.
+    
+    Args:
+        api: API client instance.
+        skip: Records to skip.
+        limit: Max records.
+    """
+    start_prefetch(
+        ("list_spots", skip, limit),
+        lambda: cached_list_spots(
+            api,
+            skip=skip,
+            limit=limit,
+            cidade=None,
+            estado=None,
+            pais=None,
+            search=None,
+        ),
+    )
+
+
+# Fetches currently running, shared by concurrent callers with the same key
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: tuple, fetch):
+    """
+    Run fetch() once for concurrent callers that use the same key.
+    
+    The first caller runs the fetch; callers arriving while it is in
+    flight wait for and share its result (or exception).
+    
+    Args:
+        key: Identifies identical requests.
+        fetch: Zero-argument callable doing the request.
+    
+    Returns:
+        The fetch result.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[key] = future
+    
+    if is_leader:
+        try:
+            future.set_result(fetch())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+    
+    return future.result()
+
+
+@st.cache_resource(ttl=60, max_entries=256, show_spinner=False)
+def cached_get_spot_bundle(
+    _api: TuristandoAPI,
+    spot_id: int,
+    ratings_limit: int = 10,
+) -> Dict[str, Any]:
+    """
+    Get the spot detail bundle, cached for 60 seconds per spot.
+    
+    Uses st.cache_resource so cache hits return the stored dict as-is
+    instead of unpickling a copy of every photo, rating and accommodation.
+    The result is shared between sessions: treat it as read-only.
+    
+    Call ``cached_get_spot_bundle.clear()`` after updating or deleting a
+    spot.
+    
+    Args:
+        _api: API client instance (excluded from the cache key).
+        spot_id: Spot ID.
+        ratings_limit: Max recent ratings to include.
+    
+    Returns:
+        Dict with spot, photos, rating_stats, ratings and accommodations.
+    """
+    return _single_flight(
+        ("spot_bundle", spot_id, ratings_limit),
+        lambda: _api.get_spot_bundle(spot_id, ratings_limit=ratings_limit),
+    )
+
+
+def api_request(
+    method: str,
+    url: str,
+    token: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    **kwargs
+) -> Tuple[bool, Any, Optional[str]]:
+    """
+    Send an (optionally authenticated) request through the pooled session.
+    
+    Args:
+        method: HTTP method.
+        url: Full endpoint URL.
+        token: Bearer token added as the Authorization header.
+        session: Session to use (defaults to get_http_session(); pass it
+            explicitly from worker threads).
+        **kwargs: Passed to ``requests.Session.request`` (files, data, json...).
+    
+    Returns:
+        Tuple of (ok, payload, error). ``payload`` is the decoded JSON body
+        of a successful response (None if it has none); ``error`` starts
+        with the status code, e.g. "403: Admin access required".
+    """
+    headers = dict(kwargs.pop("headers", None) or {})
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    
+    try:
+        response = (session or get_http_session()).request(method, url, headers=headers, **kwargs)
+    except requests.exceptions.RequestException as e:
+        return False, None, f"Connection error: {e}"
+    
+    if not response.ok:
+        return False, None, f"{response.status_code}: {error_detail(response)}"
+    
+    if response.content and response.headers.get("content-type", "").startswith("application/json"):
+        return True, response.json(), None
+    return True, None, None
+
+
+def api_get(url: str, token: Optional[str] = None, **kwargs) -> Tuple[bool, Any, Optional[str]]:
+    """GET via api_request()."""
+    return api_request("GET", url, token, **kwargs)
+
+
+def api_post(url: str, token: Optional[str] = None, **kwargs) -> Tuple[bool, Any, Optional[str]]:
+    """POST via api_request()."""
+    return api_request("POST", url, token, **kwargs)
+
+
+def api_delete(url: str, token: Optional[str] = None, **kwargs) -> Tuple[bool, Any, Optional[str]]:
+    """DELETE via api_request()."""
+    return api_request("DELETE", url, token, **kwargs)
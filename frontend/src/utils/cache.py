@@ -4,9 +4,9 @@ Frontend Caching Utilities - Simple caching for API responses.
 Provides TTL-based caching for frequently accessed data.
 """
 
+import time
 import streamlit as st
-from typing import Any, Optional, Callable
-from datetime import datetime, timedelta
+from typing import Any, Optional, Callable, Hashable
 from functools import wraps
 
 
@@ -15,81 +15,80 @@ class SimpleCache:
     
     def __init__(self):
         """Initialize cache storage."""
-        if "cache_data" not in st.session_state:
-            st.session_state.cache_data = {}
-        if "cache_timestamps" not in st.session_state:
-            st.session_state.cache_timestamps = {}
+        self._entries()
     
-    def get(self, key: str, ttl_seconds: int = 60) -> Optional[Any]:
+    @staticmethod
+    def _entries() -> dict:
+        """
+        Get this session's cache storage.
+        
+        Entries are ``key -> (value, expires_at)`` with ``expires_at`` on
+        the time.monotonic() clock, so a hit costs one lookup and one
+        float comparison.
+        """
+        return st.session_state.setdefault("cache_entries", {})
+    
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get value from cache if not expired.
         
         Args:
             key: Cache key
-            ttl_seconds: Time to live in seconds
             
         Returns:
             Cached value or None if expired/not found
         """
-        if key not in st.session_state.cache_data:
+        entries = self._entries()
+        entry = entries.get(key)
+        if entry is None:
             return None
         
-        timestamp = st.session_state.cache_timestamps.get(key)
-        if timestamp is None:
-            return None
-        
-        # Check if expired
-        now = datetime.now()
-        if (now - timestamp).total_seconds() > ttl_seconds:
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
             # Remove expired entry
-            del st.session_state.cache_data[key]
-            del st.session_state.cache_timestamps[key]
+            del entries[key]
             return None
         
-        return st.session_state.cache_data[key]
+        return value
     
-    def set(self, key: str, value: Any):
+    def set(self, key: Hashable, value: Any, ttl_seconds: int = 60):
         """
         Store value in cache.
         
         Args:
             key: Cache key
             value: Value to cache
+            ttl_seconds: Time to live in seconds
         """
-        st.session_state.cache_data[key] = value
-        st.session_state.cache_timestamps[key] = datetime.now()
+        self._entries()[key] = (value, time.monotonic() + ttl_seconds)
     
-    def invalidate(self, key: str):
+    def invalidate(self, key: Hashable):
         """
         Invalidate cache entry.
         
         Args:
             key: Cache key to invalidate
         """
-        if key in st.session_state.cache_data:
-            del st.session_state.cache_data[key]
-        if key in st.session_state.cache_timestamps:
-            del st.session_state.cache_timestamps[key]
+        self._entries().pop(key, None)
     
     def invalidate_pattern(self, pattern: str):
         """
         Invalidate all cache entries matching pattern.
         
+        String keys are matched as a whole; tuple keys built by
+        cached_api_call are matched on their base key.
+        
         Args:
             pattern: Pattern to match (substring)
         """
-        keys_to_remove = [
-            key for key in st.session_state.cache_data.keys()
-            if pattern in key
-        ]
-        
-        for key in keys_to_remove:
-            self.invalidate(key)
+        st.session_state["cache_entries"] = {
+            key: entry for key, entry in self._entries().items()
+            if pattern not in (key[0] if isinstance(key, tuple) else key)
+        }
     
     def clear(self):
         """Clear all cache entries."""
-        st.session_state.cache_data = {}
-        st.session_state.cache_timestamps = {}
+        st.session_state["cache_entries"] = {}
 
 
 # Global cache instance
@@ -100,6 +99,9 @@ def cached_api_call(key: str, ttl_seconds: int = 60):
     """
     Decorator for caching API calls.
     
+    The wrapped function's arguments are part of the cache key and must
+    be hashable.
+    
     Args:
         key: Base cache key
         ttl_seconds: Time to live in seconds
@@ -110,17 +112,17 @@ def cached_api_call(key: str, ttl_seconds: int = 60):
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            cache_key = f"{key}:{str(args)}:{str(kwargs)}"
+            # Tuple key: hashed directly, no repr of the arguments
+            cache_key = (key, args, tuple(sorted(kwargs.items())))
             
             # Try to get from cache
-            cached_value = cache.get(cache_key, ttl_seconds)
+            cached_value = cache.get(cache_key)
             if cached_value is not None:
                 return cached_value
             
             # Call function and cache result
             result = func(*args, **kwargs)
-            cache.set(cache_key, result)
+            cache.set(cache_key, result, ttl_seconds)
             return result
         
         return wrapper
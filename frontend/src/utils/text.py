@@ -0,0 +1,25 @@
+"""
+Frontend Text Utilities - Small string helpers shared by components.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2048)
+def truncate(text: str, max_length: int) -> str:
+    """
+    Shorten text to max_length characters, ending with "..." when cut.
+    
+    Memoized per (text, max_length) so re-rendering the same page reuses
+    previously truncated strings.
+    
+    Args:
+        text: Text to shorten
+        max_length: Maximum length of the result, including the ellipsis
+    
+    Returns:
+        The original text, or its truncated form
+    """
+    if len(text) <= max_length:
+        return text
+    return text[:max_length - 3] + "..."